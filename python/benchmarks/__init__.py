@@ -0,0 +1 @@
+"""Performance benchmarks of the AaC startup and hot paths, run with `python -m benchmarks` from the Python project."""
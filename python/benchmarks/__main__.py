@@ -0,0 +1,79 @@
+"""Runs the benchmark suite: `python -m benchmarks run` to time it, and `python -m benchmarks compare` to find regressions."""
+import json
+import sys
+from argparse import ArgumentParser
+
+from benchmarks.benchmark_suite import (
+    BENCHMARKS,
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_REPEAT,
+    MODEL_PRESETS,
+    compare_results,
+    run_benchmarks,
+    run_worker,
+)
+
+
+def main() -> int:
+    """Run the benchmark command given on the command line."""
+    parser = ArgumentParser(prog="python -m benchmarks", description="Time the AaC startup and hot paths on synthetic models.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Time the benchmarks and write the results as JSON.")
+    run_parser.add_argument("--model", action="append", choices=list(MODEL_PRESETS), help="A model to time the benchmarks on. (default: small and medium)")
+    run_parser.add_argument("--benchmark", action="append", choices=[benchmark.name for benchmark in BENCHMARKS], help="A benchmark to time. (default: all)")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="The number of samples of each benchmark.")
+    run_parser.add_argument("--output", help="The file to write the results to. (default: standard output)")
+    run_parser.add_argument("--baseline", help="The results of an earlier run to compare with, failing if a benchmark regressed.")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="The fraction a median can grow by before it's a regression.")
+
+    compare_parser = commands.add_parser("compare", help="Compare the results of two runs, failing if a benchmark regressed.")
+    compare_parser.add_argument("baseline", help="The results to compare against.")
+    compare_parser.add_argument("current", help="The results of the change being measured.")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="The fraction a median can grow by before it's a regression.")
+
+    worker_parser = commands.add_parser("worker", help="Time a benchmark in this process. Used by the run command.")
+    worker_parser.add_argument("benchmark")
+    worker_parser.add_argument("model_file")
+    worker_parser.add_argument("--samples", type=int, default=1)
+    worker_parser.add_argument("--warm-up", action="store_true")
+
+    arguments = parser.parse_args()
+    if arguments.command == "worker":
+        print(json.dumps(run_worker(arguments.benchmark, arguments.model_file, arguments.samples, arguments.warm_up)))
+        return 0
+
+    if arguments.command == "run":
+        current = run_benchmarks(arguments.model or ["small", "medium"], arguments.benchmark, arguments.repeat, _report)
+        results = json.dumps(current, indent=2)
+        if arguments.output:
+            with open(arguments.output, "w") as output_file:
+                output_file.write(results)
+        else:
+            print(results)
+        if not arguments.baseline:
+            return 0
+        baseline_file = arguments.baseline
+    else:
+        baseline_file = arguments.baseline
+        with open(arguments.current) as current_file:
+            current = json.load(current_file)
+
+    with open(baseline_file) as baseline:
+        lines, regressions = compare_results(json.load(baseline), current, arguments.threshold)
+    _report(f"{'benchmark':40} {'baseline':>13} {'current':>13} {'ratio':>7}")
+    for line in lines:
+        _report(line)
+    if regressions:
+        _report(f"{len(regressions)} benchmark(s) regressed by more than {arguments.threshold:.0%}.")
+        return 1
+    return 0
+
+
+def _report(message: str) -> None:
+    # Progress goes to standard error, so the results can be written to standard output.
+    print(message, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""Times the AaC startup and hot paths on synthetic models and writes the results as JSON so they can be compared between commits."""
+import json
+import os
+import platform
+import subprocess
+import sys
+from attr import Factory, attrib, attrs, validators
+from datetime import datetime, timezone
+from statistics import mean, median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Optional
+
+from benchmarks.model_generator import ModelParameters, generate_model, get_generator_file_path
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_REPEAT = 5
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+# Environment variables understood by aac, set by the suite so each benchmark controls its own caches.
+CACHE_DIRECTORY_VARIABLE = "AAC_CACHE_DIR"
+LANGUAGE_SNAPSHOT_VARIABLE = "AAC_LANGUAGE_SNAPSHOT"
+PERSISTENT_PARSE_CACHE_VARIABLE = "AAC_PERSISTENT_PARSE_CACHE"
+
+MODEL_PRESETS = {
+    "small": ModelParameters(definitions=50, fields=5, imports=0, extends_depth=1, typeref_density=0.25),
+    "medium": ModelParameters(definitions=500, fields=8, imports=5, extends_depth=3, typeref_density=0.5),
+    "large": ModelParameters(definitions=2000, fields=10, imports=20, extends_depth=5, typeref_density=0.5),
+    "wide": ModelParameters(definitions=200, fields=50, imports=0, extends_depth=0, typeref_density=0.1),
+    "deep": ModelParameters(definitions=200, fields=5, imports=0, extends_depth=20, typeref_density=0.25),
+    "typerefs": ModelParameters(definitions=500, fields=8, imports=0, extends_depth=0, typeref_density=1.0),
+}
+
+
+@attrs(slots=True)
+class Benchmark:
+    """A timed operation of the suite.
+
+    Attributes:
+        name (str): The name of the benchmark.
+        description (str): What the benchmark times.
+        measure (Callable[[str], float]): Times one sample of the operation on a model file and returns the seconds it took.
+            It runs in a worker process, so it only sees the state that the worker built up.
+        uses_model (bool): Whether the benchmark is timed on each model, or only once per run.
+        fresh_process (bool): Whether each sample is timed in a new worker process, for operations that only happen once per process.
+        warm_cache (bool): Whether a worker runs the operation once before the samples are timed, so that the samples find the
+            language snapshot and parse cache on disk.
+        environment (dict[str, str]): Environment variables for the worker processes.
+    """
+
+    name: str = attrib(validator=validators.instance_of(str))
+    description: str = attrib(validator=validators.instance_of(str))
+    measure: Callable[[str], float] = attrib(validator=validators.is_callable())
+    uses_model: bool = attrib(default=True, validator=validators.instance_of(bool))
+    fresh_process: bool = attrib(default=False, validator=validators.instance_of(bool))
+    warm_cache: bool = attrib(default=False, validator=validators.instance_of(bool))
+    environment: dict[str, str] = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+
+
+@attrs(slots=True)
+class BenchmarkResult:
+    """The timings of a benchmark.
+
+    Attributes:
+        benchmark (str): The name of the benchmark.
+        model (Optional[str]): The name of the model the benchmark was timed on, or None if it doesn't use a model.
+        parameters (Optional[dict]): The size and shape of the model.
+        samples (list[float]): The seconds each sample took.
+    """
+
+    benchmark: str = attrib(validator=validators.instance_of(str))
+    model: Optional[str] = attrib(validator=validators.optional(validators.instance_of(str)))
+    parameters: Optional[dict] = attrib(validator=validators.optional(validators.instance_of(dict)))
+    samples: list[float] = attrib(default=Factory(list), validator=validators.instance_of(list))
+
+    def to_dict(self) -> dict:
+        """Return the result as a JSON-serializable dictionary, with summary statistics of its samples."""
+        return {
+            "benchmark": self.benchmark,
+            "model": self.model,
+            "parameters": self.parameters,
+            "samples": self.samples,
+            "min": min(self.samples),
+            "median": median(self.samples),
+            "mean": mean(self.samples),
+        }
+
+
+def _time(operation: Callable[[], object]) -> float:
+    start = perf_counter()
+    operation()
+    return perf_counter() - start
+
+
+def _time_with_model_unloaded(operation: Callable[[], object]) -> float:
+    """Time an operation that loads a model into the LanguageContext, and unload the model afterwards so samples are comparable."""
+    from aac.context.language_context import LanguageContext
+
+    context = LanguageContext()
+    loaded_definitions = set(context.get_definitions())
+    seconds = _time(operation)
+    context.remove_definitions([definition for definition in context.get_definitions() if definition not in loaded_definitions])
+    return seconds
+
+
+def measure_bootstrap(model_file: str) -> float:
+    """Time bootstrapping the LanguageContext, which is the first thing every aac command does."""
+    from aac.context.language_context import LanguageContext
+
+    return _time(LanguageContext)
+
+
+def measure_startup(model_file: str) -> float:
+    """Time importing the command line, which bootstraps the context and builds the commands, and running `aac version`."""
+    start = perf_counter()
+    from click.testing import CliRunner
+    from aac.execute.command_line import cli
+
+    CliRunner().invoke(cli, ["version"])
+    return perf_counter() - start
+
+
+def measure_parse(model_file: str) -> float:
+    """Time parsing a model without loading it."""
+    from aac.in_out.parser._parse_source import parse
+
+    return _time(lambda: parse(model_file))
+
+
+def measure_load_definitions(model_file: str) -> float:
+    """Time loading parsed definitions into the LanguageContext."""
+    from aac.context.definition_parser import DefinitionParser
+    from aac.context.language_context import LanguageContext
+    from aac.in_out.parser._parse_source import parse
+
+    context = LanguageContext()
+    definitions = parse(model_file)
+    return _time_with_model_unloaded(lambda: DefinitionParser().load_definitions(context, definitions))
+
+
+def measure_check(model_file: str) -> float:
+    """Time `aac check` of a model."""
+    from aac.plugins.check.check_aac_impl import check
+
+    return _time_with_model_unloaded(lambda: _assert_success(check(model_file, False, False)))
+
+
+def measure_generate(model_file: str) -> float:
+    """Time `aac generate` of a Python class for each schema of a model."""
+    from aac.plugins.generate.generate_impl import generate
+
+    with TemporaryDirectory() as output_directory:
+        generator_file = get_generator_file_path(model_file)
+        return _time(lambda: _assert_success(generate(model_file, generator_file, output_directory, output_directory, output_directory, True, True, False)))
+
+
+def measure_print_defs(model_file: str) -> float:
+    """Time `aac print-defs` of the language and a loaded model."""
+    from aac.context.language_context import LanguageContext
+    from aac.plugins.print_defs.print_aac_definitions_impl import print_defs
+
+    context = LanguageContext()
+    loaded_definitions = context.parse_and_load(model_file)
+    seconds = _time(lambda: _assert_success(print_defs(False)))
+    context.remove_definitions(loaded_definitions)
+    return seconds
+
+
+def _assert_success(result) -> None:
+    if not result.is_success():
+        raise RuntimeError(f"The benchmarked command failed: {result.get_messages_as_string()}")
+
+
+BENCHMARKS = [
+    Benchmark(
+        "bootstrap", "Bootstrap the LanguageContext from the AaC language and plugin files.", measure_bootstrap,
+        uses_model=False, fresh_process=True, environment={LANGUAGE_SNAPSHOT_VARIABLE: "0"},
+    ),
+    Benchmark(
+        "bootstrap_snapshot", "Bootstrap the LanguageContext from the language snapshot.", measure_bootstrap,
+        uses_model=False, fresh_process=True, warm_cache=True,
+    ),
+    Benchmark(
+        "startup", "Import the command line and run `aac version`, with the language snapshot.", measure_startup,
+        uses_model=False, fresh_process=True, warm_cache=True,
+    ),
+    Benchmark("parse_cold", "Parse a model in a new process with empty caches.", measure_parse, fresh_process=True),
+    Benchmark(
+        "parse_persistent", "Parse a model in a new process from the on-disk parse cache.", measure_parse,
+        fresh_process=True, warm_cache=True, environment={PERSISTENT_PARSE_CACHE_VARIABLE: "1"},
+    ),
+    Benchmark("parse_warm", "Parse a model that the process has already parsed.", measure_parse),
+    Benchmark("load_definitions", "Load the parsed definitions of a model into the LanguageContext.", measure_load_definitions),
+    Benchmark("check", "Check a model with `aac check`.", measure_check),
+    Benchmark("generate", "Generate a Python class for each schema of a model with `aac generate`.", measure_generate),
+    Benchmark("print_defs", "Print the language and a loaded model with `aac print-defs`.", measure_print_defs),
+]
+
+
+def get_benchmark(name: str) -> Benchmark:
+    """Return the benchmark with the name."""
+    for benchmark in BENCHMARKS:
+        if benchmark.name == name:
+            return benchmark
+    raise ValueError(f"There is no benchmark named '{name}'.")
+
+
+def run_worker(benchmark_name: str, model_file: str, samples: int, warm_up: bool) -> list[float]:
+    """
+    Time a benchmark in this process.
+
+    Args:
+        benchmark_name (str): The name of the benchmark.
+        model_file (str): The model file to time the benchmark on.
+        samples (int): The number of samples to time.
+        warm_up (bool): Whether to run the benchmark once, untimed, before the samples.
+
+    Returns:
+        The seconds each sample took.
+    """
+    benchmark = get_benchmark(benchmark_name)
+    if warm_up:
+        benchmark.measure(model_file)
+    return [benchmark.measure(model_file) for _ in range(samples)]
+
+
+def _run_worker_process(benchmark: Benchmark, model_file: str, samples: int, warm_up: bool, environment: dict[str, str]) -> list[float]:
+    command = [sys.executable, "-m", "benchmarks", "worker", benchmark.name, model_file, "--samples", str(samples)]
+    if warm_up:
+        command.append("--warm-up")
+    process = subprocess.run(
+        command,
+        env={**environment, **benchmark.environment},
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"The '{benchmark.name}' benchmark failed:{os.linesep}{process.stderr}")
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def time_benchmark(benchmark: Benchmark, model_file: str, repeat: int) -> list[float]:
+    """
+    Time a benchmark in worker processes with their own, initially empty, aac cache directory.
+
+    Args:
+        benchmark (Benchmark): The benchmark to time.
+        model_file (str): The model file to time the benchmark on.
+        repeat (int): The number of samples to time.
+
+    Returns:
+        The seconds each sample took.
+    """
+    with TemporaryDirectory() as cache_directory:
+        environment = {**os.environ, CACHE_DIRECTORY_VARIABLE: cache_directory}
+        if benchmark.fresh_process:
+            if benchmark.warm_cache:
+                _run_worker_process(benchmark, model_file, 1, False, environment)
+            samples = []
+            for _ in range(repeat):
+                if not benchmark.warm_cache:
+                    # every sample starts with empty caches, so it mustn't reuse the caches written by the last sample
+                    environment[CACHE_DIRECTORY_VARIABLE] = os.path.join(cache_directory, str(len(samples)))
+                samples.extend(_run_worker_process(benchmark, model_file, 1, False, environment))
+            return samples
+        return _run_worker_process(benchmark, model_file, repeat, True, environment)
+
+
+def run_benchmarks(
+    model_presets: list[str],
+    benchmark_names: Optional[list[str]] = None,
+    repeat: int = DEFAULT_REPEAT,
+    report: Callable[[str], None] = print,
+) -> dict:
+    """
+    Time the benchmarks on the models of the presets.
+
+    Args:
+        model_presets (list[str]): The names of the models to time the benchmarks on.
+        benchmark_names (Optional[list[str]]): The names of the benchmarks to time, or None to time all of them.
+        repeat (int): The number of samples to time of each benchmark.
+        report (Callable[[str], None]): Reports the progress of the suite.
+
+    Returns:
+        The machine-readable results of the suite.
+    """
+    benchmarks = [get_benchmark(name) for name in benchmark_names] if benchmark_names else BENCHMARKS
+    results = []
+    with TemporaryDirectory() as model_directory:
+        model_files = {preset: generate_model(os.path.join(model_directory, preset), MODEL_PRESETS[preset]) for preset in model_presets}
+        for benchmark in benchmarks:
+            models = list(model_files.items()) if benchmark.uses_model else [(None, next(iter(model_files.values()), ""))]
+            for model, model_file in models:
+                report(f"{_get_result_name(benchmark.name, model)}...")
+                samples = time_benchmark(benchmark, model_file, repeat)
+                parameters = _get_parameters(MODEL_PRESETS[model]) if model else None
+                result = BenchmarkResult(benchmark.name, model, parameters, samples).to_dict()
+                report(f"  median {result['median'] * 1000:.1f} ms, min {result['min'] * 1000:.1f} ms")
+                results.append(result)
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "environment": _get_environment(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> tuple[list[str], list[str]]:
+    """
+    Compare the median timings of two runs of the suite.
+
+    Args:
+        baseline (dict): The results to compare against, such as those of the target branch.
+        current (dict): The results of the change being measured.
+        threshold (float): The fraction a median can grow by before it's reported as a regression.
+
+    Returns:
+        A line describing each benchmark timed in both runs, and the lines of the benchmarks that regressed.
+    """
+    baseline_medians = {(result["benchmark"], result["model"]): result["median"] for result in baseline["results"]}
+    lines, regressions = [], []
+    for result in current["results"]:
+        key = (result["benchmark"], result["model"])
+        if key not in baseline_medians:
+            continue
+        ratio = result["median"] / baseline_medians[key] if baseline_medians[key] else 1.0
+        line = f"{_get_result_name(result['benchmark'], result['model']):40} {baseline_medians[key] * 1000:10.1f} ms {result['median'] * 1000:10.1f} ms {ratio:6.2f}x"
+        lines.append(line)
+        if ratio > 1 + threshold:
+            regressions.append(line)
+    return lines, regressions
+
+
+def _get_result_name(benchmark_name: str, model: Optional[str]) -> str:
+    return f"{benchmark_name} [{model}]" if model else benchmark_name
+
+
+def _get_parameters(parameters: ModelParameters) -> dict:
+    return {
+        "definitions": parameters.definitions,
+        "fields": parameters.fields,
+        "imports": parameters.imports,
+        "extends_depth": parameters.extends_depth,
+        "typeref_density": parameters.typeref_density,
+        "seed": parameters.seed,
+    }
+
+
+def _get_environment() -> dict:
+    """Describe what the results were measured on, so results are only compared with comparable ones."""
+    from aac import __version__
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "aac_version": __version__,
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
@@ -0,0 +1,145 @@
+"""Generates synthetic AaC models whose size and shape can be scaled independently for benchmarking."""
+from attr import attrib, attrs, validators
+from os import makedirs, path
+from random import Random
+
+MODEL_PACKAGE = "benchmark.model"
+MODEL_FILE_NAME = "model.aac"
+GENERATOR_FILE_NAME = "generator.aac"
+TEMPLATE_FILE_NAME = "schema.jinja2"
+PRIMITIVE_TYPES = ["string", "int", "bool", "number", "date"]
+
+GENERATOR_CONTENT = f"""generator:
+  name: Benchmark Generator
+  description: Generates a Python class for each schema of a benchmark model.
+  sources:
+    - name: Benchmark Schemas
+      data_source: schema
+      templates:
+        - name: SchemaClass
+          description: Generates a Python class for a schema.
+          template_file: ./{TEMPLATE_FILE_NAME}
+          overwrite: OVERWRITE
+          helper_functions:
+            - name: Get Python name
+              description: Converts a string to a Python suitable name.
+              package: aac.plugins.generate.helpers
+              module: python_helpers
+              function: get_python_name
+          output_target: CODE
+          output_path_uses_data_source_package: false
+          output_file_extension: py
+"""
+
+TEMPLATE_CONTENT = """\"\"\"{{ schema.description }}\"\"\"
+
+
+class {{ get_python_name(schema.name) }}:
+    \"\"\"{{ schema.description }}\"\"\"
+
+    def __init__(self{% for field in schema.fields %}, {{ get_python_name(field.name) }}=None{% endfor %}):
+{%- for field in schema.fields %}
+        self.{{ get_python_name(field.name) }} = {{ get_python_name(field.name) }}
+{%- endfor %}
+{%- if not schema.fields %}
+        pass
+{%- endif %}
+"""
+
+
+@attrs(slots=True, frozen=True)
+class ModelParameters:
+    """The size and shape of a synthetic model.
+
+    Attributes:
+        definitions (int): The number of schema definitions in the model.
+        fields (int): The number of fields of each schema.
+        imports (int): The number of files the definitions are split across, which the model file imports.
+        extends_depth (int): The length of the chains of schemas extending each other, or 0 for no extends.
+        typeref_density (float): The fraction of fields whose type is another schema of the model rather than a primitive.
+        seed (int): The seed of the random choices, so the same parameters always generate the same model.
+    """
+
+    definitions: int = attrib(validator=validators.instance_of(int))
+    fields: int = attrib(validator=validators.instance_of(int))
+    imports: int = attrib(default=0, validator=validators.instance_of(int))
+    extends_depth: int = attrib(default=0, validator=validators.instance_of(int))
+    typeref_density: float = attrib(default=0.0, validator=validators.instance_of((int, float)))
+    seed: int = attrib(default=0, validator=validators.instance_of(int))
+
+
+def generate_model(directory: str, parameters: ModelParameters) -> str:
+    """
+    Write a synthetic model, and a generator for it, to a directory.
+
+    The schemas only refer to schemas that come before them, so the model is valid and passes `aac check`.
+
+    Args:
+        directory (str): The directory to write the model to.
+        parameters (ModelParameters): The size and shape of the model.
+
+    Returns:
+        The path of the model file, which contains the definitions, or imports the files that do.
+    """
+    random = Random(parameters.seed)
+    schemas = [_get_schema(index, parameters, random) for index in range(parameters.definitions)]
+
+    makedirs(directory, exist_ok=True)
+    model_file_path = path.join(directory, MODEL_FILE_NAME)
+    if parameters.imports:
+        imported_files = []
+        for file_index in range(parameters.imports):
+            imported_file_name = f"model_{file_index:04d}.aac"
+            _write_file(path.join(directory, imported_file_name), "---\n".join(schemas[file_index::parameters.imports]))
+            imported_files.append(imported_file_name)
+        _write_file(model_file_path, "import:\n  files:\n" + "".join(f"    - ./{file_name}\n" for file_name in imported_files))
+    else:
+        _write_file(model_file_path, "---\n".join(schemas))
+
+    _write_file(path.join(directory, GENERATOR_FILE_NAME), GENERATOR_CONTENT)
+    _write_file(path.join(directory, TEMPLATE_FILE_NAME), TEMPLATE_CONTENT)
+    return model_file_path
+
+
+def get_generator_file_path(model_file_path: str) -> str:
+    """Return the path of the generator written next to a model file."""
+    return path.join(path.dirname(model_file_path), GENERATOR_FILE_NAME)
+
+
+def _get_schema_name(index: int) -> str:
+    return f"Schema{index:05d}"
+
+
+def _get_schema(index: int, parameters: ModelParameters, random: Random) -> str:
+    """Return the YAML of a schema, which extends the schema before it unless it starts a new chain of extends."""
+    name = _get_schema_name(index)
+    lines = [
+        "schema:",
+        f"  name: {name}",
+        f"  package: {MODEL_PACKAGE}",
+        f"  description: Benchmark schema {index}.",
+    ]
+    if parameters.extends_depth and index % (parameters.extends_depth + 1):
+        lines.extend(["  extends:", f"    - package: {MODEL_PACKAGE}", f"      name: {_get_schema_name(index - 1)}"])
+
+    lines.append("  fields:" if parameters.fields else "  fields: []")
+    for field_index in range(parameters.fields):
+        if index and random.random() < parameters.typeref_density:
+            field_type = _get_schema_name(random.randrange(index))
+            if random.random() < 0.5:
+                field_type = f"{field_type}[]"
+        else:
+            field_type = random.choice(PRIMITIVE_TYPES)
+        lines.extend([
+            f"    - name: {name.lower()}_field_{field_index}",
+            f"      type: {field_type}",
+            f"      description: Field {field_index} of {name}.",
+        ])
+        if field_index % 3 == 0:
+            lines.append("      is_required: true")
+    return "\n".join(lines) + "\n"
+
+
+def _write_file(file_path: str, content: str) -> None:
+    with open(file_path, "w") as model_file:
+        model_file.write(content)
@@ -1,15 +1,25 @@
 """Definition class for Architecture-as-Code."""
 from attr import Factory, attrib, attrs, validators
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Optional
 from uuid import UUID, uuid5, NAMESPACE_DNS
 import yaml
 
 from aac.in_out.files.aac_file import AaCFile
 from aac.context.lexeme import Lexeme
+from aac.context.fingerprint import get_fingerprint
 from aac.context.util import get_python_module_name, get_python_class_name, get_fully_qualified_name
 from aac.context.language_error import LanguageError
 
 
+def _reset_identity(definition: "Definition", attribute: Any, value: Any) -> Any:
+    """Clear the memoized identity and fingerprint of a definition when its name, package or structure is reassigned."""
+    definition._root_key = None
+    definition._fully_qualified_name = None
+    definition._fingerprint = None
+    return value
+
+
 @attrs(hash=False, eq=False)
 class Definition:
     """An Architecture-as-Code definition.
@@ -20,19 +30,26 @@ class Definition:
         package (str): The package of the definition.
         content (str): The original source textual representation of the definition.
         source (AaCFile): The source document containing the definition.
-        lexemes (list[Lexeme]): A list of lexemes for each item in the parsed definition.
+        lexemes (Sequence[Lexeme]): The lexemes for each item in the parsed definition.
         structure (dict): The dictionary representation of the definition.
         instance (Any): A Python class instance of the definition.
+
+    The root key and fully qualified name are memoized, since they're used to index and look up definitions
+    throughout the language context, and are cleared whenever the name, package or structure is reassigned. So is the
+    fingerprint of the structure, which is why the structure must be replaced rather than changed in place.
     """
 
     uid: UUID = attrib(init=False, validator=validators.instance_of(UUID))
-    name: str = attrib(validator=validators.instance_of(str))
-    package: str = attrib(validator=validators.instance_of(str))
+    name: str = attrib(validator=validators.instance_of(str), on_setattr=_reset_identity)
+    package: str = attrib(validator=validators.instance_of(str), on_setattr=_reset_identity)
     content: str = attrib(validator=validators.instance_of(str))
     source: AaCFile = attrib(validator=validators.instance_of(AaCFile))
-    lexemes: list[Lexeme] = attrib(default=Factory(list), validator=validators.instance_of(list))
-    structure: dict = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+    lexemes: Sequence[Lexeme] = attrib(default=Factory(list), validator=validators.instance_of(Sequence))
+    structure: dict = attrib(default=Factory(dict), validator=validators.instance_of(dict), on_setattr=_reset_identity)
     instance: Any = attrib(default=None)
+    _root_key: Optional[str] = attrib(init=False, default=None, repr=False)
+    _fully_qualified_name: Optional[str] = attrib(init=False, default=None, repr=False)
+    _fingerprint: Optional[str] = attrib(init=False, default=None, repr=False)
 
     def __attrs_post_init__(self):
         """Post-init hook."""
@@ -42,15 +59,27 @@ class Definition:
 
     def __hash__(self) -> int:
         """Return the hash of this Definition."""
+        # strings cache their own hash, so this is cheap once the name is memoized, and unlike a memoized hash it stays
+        # valid for definitions loaded from a snapshot written by another process
         return hash(self.get_fully_qualified_name())
 
     def __eq__(self, obj):
         """Equals function for the Definition."""
 
         def is_equal() -> bool:
-            equal = self.get_fully_qualified_name() == obj.get_fully_qualified_name()
-            equal = equal and self.structure == obj.structure
-            return equal
+            if self is obj:
+                return True
+            # compare the memoized identity first, so unequal definitions rarely need their structures compared
+            if self.get_fully_qualified_name() != obj.get_fully_qualified_name():
+                return False
+            if self.get_root_key() != obj.get_root_key():
+                return False
+            if self.structure is obj.structure:
+                return True
+            if self._fingerprint is not None and obj._fingerprint is not None:
+                return self._fingerprint == obj._fingerprint
+            # digesting a structure costs more than comparing it once, so fingerprints are only compared once they're known
+            return self.structure == obj.structure
 
         return isinstance(obj, Definition) and is_equal()
 
@@ -60,7 +89,19 @@ class Definition:
         Returns:
             The root key for the definition.
         """
-        return list(self.structure.keys())[0]
+        if self._root_key is None:
+            self._root_key = list(self.structure.keys())[0]
+        return self._root_key
+
+    def get_fingerprint(self) -> str:
+        """Get the content fingerprint of the definition's structure.
+
+        Returns:
+            A fingerprint that is equal for definitions with equal structures and changes whenever the structure does.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = get_fingerprint(self.structure)
+        return self._fingerprint
 
     def is_import(self) -> bool:
         """Return True if the definition is an import definition."""
@@ -80,13 +121,16 @@ class Definition:
 
     def get_fully_qualified_name(self) -> str:
         """Return the fully qualified name of the definition."""
-        if self.is_import():
-            return ""
-        # this is just the package and name joined with a dot
-        try:
-            return get_fully_qualified_name(self.package, self.name)
-        except LanguageError as e:
-            raise LanguageError(e.message, self.source.uri)
+        if self._fully_qualified_name is None:
+            if self.is_import():
+                self._fully_qualified_name = ""
+            else:
+                # this is just the package and name joined with a dot
+                try:
+                    self._fully_qualified_name = get_fully_qualified_name(self.package, self.name)
+                except LanguageError as e:
+                    raise LanguageError(e.message, self.source.uri)
+        return self._fully_qualified_name
 
     def to_yaml(self) -> str:
         """Return a yaml string based on the current state of the definition including extensions."""
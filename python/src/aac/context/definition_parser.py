@@ -1,10 +1,13 @@
 """Definition Parser class for AaC, contains a load_definition function that handles loading of definition files."""
+from collections.abc import Sequence
 from typing import Any, Type
 from enum import Enum, auto
 from aac.context.language_error import LanguageError
 from aac.in_out.parser._parser_error import ParserError
+from aac.in_out.parser._frozen import thaw
 from aac.context.definition import Definition
 from aac.context.lexeme import Lexeme
+from aac.context.lexeme_table import find_lexemes, get_lexemes_from_value
 from aac.context.util import get_python_module_name, get_python_class_name
 
 
@@ -22,9 +25,13 @@ class DefinitionParser():
             The definition with the given name.
         """
         result = []
-        for definition in self.context.get_definitions():
-            if definition.name == name:
-                result.append(definition)
+        try:
+            # The context indexes its definitions by python class name, so only the definitions under that name can match.
+            candidates = self.context.context_instance.name_to_definitions.get(get_python_class_name(name), {})
+            result = [definition for _, definition in candidates.values() if definition.name == name]
+        except LanguageError:
+            # the name isn't a valid definition name, so no definition in the context has it
+            pass
         # if we didn't find any definitions in the context, check the parsed definitions
         if len(result) == 0:
             for definition in self.parsed_definitions:
@@ -32,27 +39,19 @@ class DefinitionParser():
                     result.append(definition)
         return result
 
-    def get_location_str(self, lexeme_value: str, lexemes: list[Lexeme]) -> str:
+    def get_location_str(self, lexeme_value: str, lexemes: Sequence[Lexeme]) -> str:
         """
         Method to find the file name and line number for a requested Lexeme value.
 
         Args:
             lexeme_value (str): The Lexeme to match.
-            lexemes (list[Lexeme]): A list of definition Lexemes.
+            lexemes (Sequence[Lexeme]): A list of definition Lexemes.
 
         Returns:
             The file name and line number of the requested Lexeme value.
         """
-        lexeme = []
-        for lex in lexemes:
-            # This is just a way to account for different variations of true and false.
-            if lexeme_value is True and (lex.value == "True" or lex.value == "true" or lex.value == "yes"):
-                lexeme.append(lex)
-            if lexeme_value is False and (lex.value == "False" or lex.value == "false"):
-                lexeme.append(lex)
-            # The normal found case.  lexeme_value is being cast as a string because all values are stored in lexemes as strings.
-            elif lex.value == str(lexeme_value):
-                lexeme.append(lex)
+        # Parsed lexemes are looked up through their source's value index, which also accounts for different variations of true and false.
+        lexeme = find_lexemes(lexemes, lexeme_value)
         location_str = (
             "Unable to identify source and location"  # this is the 'not found' case
         )
@@ -434,15 +433,8 @@ class DefinitionParser():
                             ](subfield_default_str)
                     else:
                         subfield_value = subfield_default_str
-            # we need to eliminate previously covered lexemes, so go through the list until we find subfield_name then add it and everything else
-            found = False
-            sub_lexemes = []
-            for lex in lexemes:
-                if lex.value == subfield_name:
-                    found = True
-                    sub_lexemes.append(lex)
-                if found:
-                    sub_lexemes.append(lex)
+            # we need to eliminate previously covered lexemes, so start from subfield_name and keep everything after it
+            sub_lexemes = get_lexemes_from_value(lexemes, subfield_name)
             subfields[subfield_name] = self.create_field_instance(
                 subfield_name,
                 subfield_type,
@@ -640,7 +632,8 @@ class DefinitionParser():
                         f"Invalid value for field '{field_name}'.  Expected type '{python_type}', but found '{type(field_value)}'",
                         self.get_location_str(field_value, lexemes),
                     )
-        return field_value
+        # the parsed structure is shared with the parser cache, so instances get their own copy of list and dict values
+        return thaw(field_value)
 
     def enum_field_list_check(self, field_value: Any, field_name: str, lexemes: list, defining_definition: Definition, enum_class: str) -> list:
         """
@@ -819,15 +812,11 @@ class DefinitionParser():
         """
         instance = None
 
-        defining_definition = None
-        for item in self.context.get_definitions() + self.parsed_definitions:
-            if item.get_root_key() == "schema":
-                if "root" in item.structure["schema"]:
-                    if (
-                        definition.get_root_key()
-                        == item.structure["schema"]["root"]
-                    ):
-                        defining_definition = item
+        # the parsed definitions take precedence over the definitions already in the context
+        defining_definition = self.parsed_schema_defs_by_root.get(definition.get_root_key())
+        if not defining_definition:
+            context_defining_schemas = self.context.get_defining_schemas_for_root(definition.get_root_key())
+            defining_definition = context_defining_schemas[-1] if context_defining_schemas else None
 
         if not defining_definition:
             raise LanguageError(
@@ -903,17 +892,16 @@ class DefinitionParser():
         # only place where we have to deal with navigating the structure of the definitions and
         # not using the python objects.  In order for this to work, any changes in here should
         # avoid the use of he definition instance...other than actually creating it.
-        schema_defs_by_root = {}
         self.context = context
         self.parsed_definitions = parsed_definitions
         self.primitive_name_to_py_type = {}
         self.fully_qualified_name_to_definition = {}
         for definition in self.parsed_definitions + self.context.get_definitions():
             self.set_qualified_name(definition)
-        for definition in self.context.get_definitions():
-            if definition.get_root_key() == "schema":
-                if definition.instance.root:
-                    schema_defs_by_root[definition.instance.root] = definition
+        self.parsed_schema_defs_by_root = {}
+        for definition in self.parsed_definitions:
+            if definition.get_root_key() == "schema" and isinstance(definition.structure["schema"].get("root"), str):
+                self.parsed_schema_defs_by_root[definition.structure["schema"]["root"]] = definition
 
         result = []
         for definition in self.parsed_definitions:
@@ -922,13 +910,5 @@ class DefinitionParser():
             definition.source.is_loaded_in_context = True
             result.append(definition)
             self.context.context_instance.definitions.add(definition)
-            fully_qualified_name = f"{definition.package}.{definition.name}"
-
-            # This is so requirements specifically do not get overwritten.  Although other definition types may still get overwritten, so we may need to find a better solution eventually.
-            if definition.get_root_key() == "req":
-                req_id = definition.structure["req"]["id"]
-                fully_qualified_name = f"{fully_qualified_name}_{req_id}"
-            self.context.context_instance.fully_qualified_name_to_definition[
-                fully_qualified_name
-            ] = definition
+            self.context.add_definition(self.context.get_lookup_name(definition), definition)
         return result
@@ -0,0 +1,100 @@
+"""Provides queries for the dot notation field chains used by datarefs and generator data content."""
+from attr import attrib, attrs, validators
+from typing import Any, Iterable, Iterator
+
+from aac.context.language_error import LanguageError
+
+
+@attrs(slots=True, frozen=True)
+class FieldChainQuery:
+    """A dot notation field chain, such as `req.id`, parsed once so it can be run over many structures.
+
+    Use `get_field_chain_query` to get the query for a field chain, so each field chain is only parsed once.
+
+    Attributes:
+        field_chain (str): The dot notation field chain, starting with a root key.
+        fields (tuple[str, ...]): The field names of the chain, in order.
+    """
+
+    field_chain: str = attrib(validator=validators.instance_of(str))
+    fields: tuple[str, ...] = attrib(init=False)
+
+    @fields.default
+    def _split_fields(self) -> tuple[str, ...]:
+        return tuple(self.field_chain.split("."))
+
+    @property
+    def root_key(self) -> str:
+        """The root key that the field chain starts with."""
+        return self.fields[0]
+
+    def iter_values(self, structures: Iterable[dict]) -> Iterator[Any]:
+        """
+        Lazily find the values at the end of the field chain.
+
+        Fields that are missing from a structure are skipped, and the items of list values are found in their place.
+
+        Args:
+            structures (Iterable[dict]): The structures to run the query over, such as the structures of the definitions with the chain's root key.
+
+        Returns:
+            An iterator of the values found, in the order of the structures they were found in.
+        """
+        return self._walk(structures, strict=False)
+
+    def iter_structures(self, structures: Iterable[dict]) -> Iterator[dict]:
+        """
+        Lazily find the structures at the end of the field chain, such as the data content of a generator source.
+
+        Args:
+            structures (Iterable[dict]): The structures to run the query over.
+
+        Returns:
+            An iterator of the structures found, in the order of the structures they were found in.
+
+        Raises:
+            LanguageError: If a field of the chain has a primitive value rather than a structure or a list.
+        """
+        return self._walk(structures, strict=True)
+
+    def _walk(self, structures: Iterable[dict], strict: bool) -> Iterator[Any]:
+        """Walk the field chain over each structure in turn, one field at a time, rejecting primitive values if strict."""
+        for structure in structures:
+            found = [structure]
+            for field_name in self.fields:
+                values = []
+                for found_structure in found:
+                    # only structures have fields, so the rest of the chain is skipped for other values
+                    if isinstance(found_structure, dict) and field_name in found_structure:
+                        value = found_structure[field_name]
+                        if strict and not isinstance(value, (list, dict)):
+                            raise LanguageError(
+                                f"The field chain '{self.field_chain}' must lead to structures of data, but '{field_name}' is a primitive.",
+                                "No file to reference",
+                            )
+                        if isinstance(value, list):
+                            values.extend(value)
+                        else:
+                            values.append(value)
+                found = values
+            yield from found
+
+
+# The query of each field chain, which is kept for the life of the process since models only use a handful of field chains.
+_field_chain_queries: dict[str, FieldChainQuery] = {}
+
+
+def get_field_chain_query(field_chain: str) -> FieldChainQuery:
+    """
+    Get the query for a dot notation field chain, parsing it the first time it's used.
+
+    Args:
+        field_chain (str): A dot notation field chain. (i.e. root.definition.field)
+
+    Returns:
+        The query for the field chain.
+    """
+    query = _field_chain_queries.get(field_chain)
+    if query is None:
+        query = _field_chain_queries[field_chain] = FieldChainQuery(field_chain)
+    return query
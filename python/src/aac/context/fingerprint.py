@@ -0,0 +1,73 @@
+"""Provides stable content fingerprints of YAML structures, built up like a Merkle tree from the fingerprints of their parts."""
+from hashlib import blake2b
+from math import isfinite
+from typing import Any
+
+# The size, in bytes, of the digest behind each fingerprint.
+FINGERPRINT_DIGEST_SIZE = 16
+
+
+def get_fingerprint(structure: Any) -> str:
+    """
+    Return the content fingerprint of a YAML structure or value.
+
+    Fingerprints are equal for equal structures, even across processes, and differ for structures that aren't equal.
+    Like a Merkle tree, the fingerprint of a dict or list is computed from the fingerprints of its items, and it is
+    memoized on frozen structures so each parsed structure, and every structure within it, is only digested once.
+
+    Args:
+        structure (Any): A YAML structure made of dicts, lists and scalar values.
+
+    Returns:
+        The fingerprint of the structure as a hex string.
+    """
+    if isinstance(structure, (dict, list)):
+        return _get_digest(structure).hex()
+    return blake2b(_get_scalar_token(structure), digest_size=FINGERPRINT_DIGEST_SIZE).hexdigest()
+
+
+def _get_digest(structure: Any) -> bytes:
+    """Return the digest of a dict or list, memoizing it if the structure is frozen and so can't change."""
+    digest = getattr(structure, "digest", None)
+    if digest is not None:
+        return digest
+
+    if isinstance(structure, dict):
+        # dicts are equal regardless of the order of their keys, so neither is their digest
+        tokens = sorted(_get_token(key) + _get_token(value) for key, value in structure.items())
+        tag = b"d"
+    else:
+        tokens = [_get_token(item) for item in structure]
+        tag = b"l"
+    digest = blake2b(tag + b"".join(tokens), digest_size=FINGERPRINT_DIGEST_SIZE).digest()
+
+    if hasattr(type(structure), "digest"):
+        # only frozen structures have a slot for their digest, since other dicts and lists can change
+        structure.digest = digest
+    return digest
+
+
+def _get_token(value: Any) -> bytes:
+    """Return the self-delimiting bytes that represent a value in the digest of the structure containing it."""
+    if isinstance(value, (dict, list)):
+        return b"h" + _get_digest(value)
+    return _get_scalar_token(value)
+
+
+def _get_scalar_token(value: Any) -> bytes:
+    """Return the self-delimiting bytes that represent a scalar value, which are equal for values that compare equal."""
+    if value is None:
+        return b"n"
+    if isinstance(value, str):
+        encoded = value.encode("utf-8", "surrogatepass")
+        tag = b"s"
+    elif isinstance(value, (int, float)):
+        # 1, 1.0 and True are equal, so they're all represented as the integer they're equal to
+        if isinstance(value, float) and not (isfinite(value) and value.is_integer()):
+            encoded, tag = repr(value).encode(), b"f"
+        else:
+            encoded, tag = str(int(value)).encode(), b"i"
+    else:
+        encoded = f"{type(value).__module__}.{type(value).__qualname__}:{value!r}".encode("utf-8", "surrogatepass")
+        tag = b"o"
+    return tag + len(encoded).to_bytes(4, "little") + encoded
@@ -1,12 +1,26 @@
 """The LanguageContext is a singleton that holds the current state of the AaC language, including all definitions and plugin runners."""
-from typing import Any, Type
+import sys
+from collections.abc import Hashable
+from functools import partial
+from types import ModuleType
+from typing import Any, Callable, Iterator, Optional, Type
 from os.path import join, dirname
 from aac.context.language_error import LanguageError
-from aac.execute.plugin_manager import get_plugin_manager
-from aac.execute.plugin_runner import PluginRunner
+from aac.execute.plugin_manager import get_plugin_manager, get_plugin_module_names, register_plugin_module
+from aac.execute.plugin_runner import LazyPluginCallback, PluginRunner
 from aac.context.definition import Definition
+from aac.context.field_chain import get_field_chain_query
 from aac.in_out.parser._parse_source import parse
 from aac.context.definition_parser import DefinitionParser
+from aac.context.language_snapshot import (
+    LanguageSnapshot,
+    PluginManifestEntry,
+    get_file_hash,
+    get_snapshot_source_module_files,
+    is_snapshot_enabled,
+    load_language_snapshot,
+    save_language_snapshot,
+)
 
 AAC_LANG_FILE_NAME = "../aac.aac"
 AAC_LANG_FILE_PATH = join(dirname(__file__), AAC_LANG_FILE_NAME)
@@ -19,21 +33,157 @@ class LanguageContext(object):
         """Create a new instance of the LanguageContext singleton class."""
         if not hasattr(cls, "context_instance"):
             cls.context_instance = super(LanguageContext, cls).__new__(cls)
-            cls.context_instance.definitions = set()
-            cls.context_instance.fully_qualified_name_to_definition: dict[
-                str, Definition
-            ] = {}
-            cls.context_instance.fully_qualified_name_to_class: dict[str, Any] = {}
-            cls.context_instance.plugin_runners = {}
 
-            # load and initialize the AaC language
-            cls.context_instance.parse_and_load(AAC_LANG_FILE_PATH)
-
-            # load plugins
-            get_plugin_manager().hook.register_plugin()
+            # load and initialize the AaC language and plugins, from the language snapshot if it's current
+            snapshot = load_language_snapshot() if is_snapshot_enabled() else None
+            if snapshot is None or not cls.context_instance._bootstrap(snapshot):
+                cls.context_instance._bootstrap(None)
+                if is_snapshot_enabled():
+                    save_language_snapshot(cls.context_instance._get_bootstrap_snapshot())
+            cls.context_instance.bootstrap_loads = None
 
         return cls.context_instance
 
+    def _bootstrap(self, snapshot: Optional[LanguageSnapshot]) -> bool:
+        """
+        Load the AaC language and register the plugins.
+
+        Args:
+            snapshot (Optional[LanguageSnapshot]): A snapshot of a previous bootstrap to restore instead of parsing the AaC files it contains.
+
+        Returns:
+            False if the snapshot didn't contain the same AaC files that the plugins loaded, in which case the context must be bootstrapped again without it.
+        """
+        self.context_instance.definitions = set(snapshot.definitions) if snapshot else set()
+        self.context_instance.fully_qualified_name_to_definition: dict[
+            str, Definition
+        ] = dict(snapshot.fully_qualified_name_to_definition) if snapshot else {}
+        self.context_instance.fully_qualified_name_to_class: dict[str, Any] = dict(snapshot.fully_qualified_name_to_class) if snapshot else {}
+        self.context_instance.name_to_definitions: dict[str, dict[str, tuple[str, Definition]]] = {}
+        self.context_instance.fully_qualified_name_to_children: dict[str, dict[str, Definition]] = {}
+        self.context_instance.fully_qualified_name_to_descendants: dict[str, dict[str, Definition]] = {}
+        self.context_instance.root_key_to_definitions: dict[str, dict[str, Definition]] = {}
+        self.context_instance.root_key_to_defining_schemas: dict[str, dict[str, Definition]] = {}
+        self.context_instance.root_key_to_field_chain_values: dict[str, dict[str, frozenset]] = {}
+        for fully_qualified_name, definition in self.context_instance.fully_qualified_name_to_definition.items():
+            self.context_instance._index_definition(fully_qualified_name, definition)
+        self.context_instance.plugin_runners = {}
+        self.context_instance.lazy_plugin_modules: dict[str, str] = {}
+        self.context_instance.plugin_modules = get_plugin_module_names()
+        self.context_instance.plugin_manifest: Optional[list[PluginManifestEntry]] = None
+        self.context_instance.snapshot_loads: dict[str, list[Definition]] = dict(snapshot.loads) if snapshot else {}
+        self.context_instance.bootstrap_loads: Optional[dict[str, list[Definition]]] = {}
+
+        # load and initialize the AaC language
+        self.context_instance.parse_and_load(AAC_LANG_FILE_PATH)
+
+        if snapshot and snapshot.plugin_modules != self.context_instance.plugin_modules:
+            # plugins were installed or removed since the snapshot was taken
+            return False
+
+        if snapshot and snapshot.plugins is not None:
+            # register the plugins from the snapshot's manifest, deferring the import of each plugin module, and the
+            # loading of its definitions, until one of its commands or constraints is used
+            self.context_instance._register_lazy_plugins(snapshot.plugins)
+            self.context_instance.snapshot_loads = {
+                load: definitions for load, definitions in snapshot.loads.items() if load not in self.context_instance.bootstrap_loads
+            }
+            return True
+
+        # load plugins
+        self.context_instance._register_plugins()
+
+        self.context_instance.snapshot_loads = {}
+        return snapshot is None or self.context_instance.bootstrap_loads.keys() == snapshot.loads.keys()
+
+    def _register_plugins(self) -> None:
+        """Register every plugin through the plugin manager, recording the plugins each module registers in the plugin manifest."""
+        plugin_runners = self.context_instance.plugin_runners
+        plugin_manifest: Optional[list[PluginManifestEntry]] = []
+
+        # call each module's hook in the order the plugin manager would, so the manifest records which module registered which plugin
+        for hook_implementation in reversed(get_plugin_manager().hook.register_plugin.get_hookimpls()):
+            registered_names = set(plugin_runners)
+            hook_implementation.function()
+            if not isinstance(hook_implementation.plugin, ModuleType) or plugin_manifest is None:
+                plugin_manifest = None
+                continue
+            plugin_manifest.extend(
+                PluginManifestEntry(
+                    hook_implementation.plugin.__name__,
+                    runner.plugin_definition,
+                    list(runner.command_to_callback),
+                    list(runner.constraint_to_callback),
+                    list(runner.constraint_to_batch_callback),
+                )
+                for name, runner in plugin_runners.items() if name not in registered_names
+            )
+        self.context_instance.plugin_manifest = plugin_manifest
+
+    def _register_lazy_plugins(self, plugin_manifest: list[PluginManifestEntry]) -> None:
+        """Register a plugin runner for each plugin of the manifest, whose callbacks load the plugin's module when they're first called."""
+        for plugin in plugin_manifest:
+            runner = PluginRunner(plugin_definition=plugin.plugin_definition)
+            for command_name in plugin.command_names:
+                load_callback = partial(self._load_lazy_plugin_callback, plugin.module_name, runner.get_plugin_name(), command_name, PluginRunner.get_command_callback)
+                runner.add_command_callback(command_name, LazyPluginCallback(command_name, load_callback))
+            for constraint_name in plugin.constraint_names:
+                load_callback = partial(self._load_lazy_plugin_callback, plugin.module_name, runner.get_plugin_name(), constraint_name, PluginRunner.get_constraint_callback)
+                runner.add_constraint_callback(constraint_name, LazyPluginCallback(constraint_name, load_callback))
+            for constraint_name in plugin.batch_constraint_names:
+                load_callback = partial(self._load_lazy_plugin_callback, plugin.module_name, runner.get_plugin_name(), constraint_name, PluginRunner.get_batch_constraint_callback)
+                runner.add_batch_constraint_callback(constraint_name, LazyPluginCallback(constraint_name, load_callback))
+            self.context_instance.plugin_runners[runner.get_plugin_name()] = runner
+            self.context_instance.lazy_plugin_modules[runner.get_plugin_name()] = plugin.module_name
+        self.context_instance.plugin_manifest = plugin_manifest
+
+    def _load_lazy_plugin_callback(self, module_name: str, plugin_name: str, callback_name: str, get_callback: Callable) -> Callable:
+        """Load a lazily registered plugin module and return the callback that its plugin registered, looked up with the given PluginRunner getter."""
+        self.load_plugin_module(module_name)
+        return get_callback(self.context_instance.plugin_runners[plugin_name], callback_name)
+
+    def load_plugin_module(self, module_name: str) -> None:
+        """
+        Import a plugin module that was registered from the plugin manifest, and replace its lazily registered plugin runners.
+
+        Args:
+            module_name (str): The name of the plugin module. Nothing is done if the module has already been loaded.
+        """
+        lazy_plugin_names = [name for name, lazy_module_name in self.context_instance.lazy_plugin_modules.items() if lazy_module_name == module_name]
+        if not lazy_plugin_names:
+            return
+
+        plugin_names = list(self.context_instance.plugin_runners)
+        for plugin_name in lazy_plugin_names:
+            del self.context_instance.lazy_plugin_modules[plugin_name]
+            del self.context_instance.plugin_runners[plugin_name]
+        register_plugin_module(module_name)
+
+        # keep the registration order, since constraints run in the order of their plugins
+        plugin_runners = self.context_instance.plugin_runners
+        ordered_plugin_runners = {name: plugin_runners[name] for name in plugin_names if name in plugin_runners}
+        ordered_plugin_runners.update(plugin_runners)
+        self.context_instance.plugin_runners = ordered_plugin_runners
+
+    def _get_bootstrap_snapshot(self) -> LanguageSnapshot:
+        """Return a snapshot of the context as it was loaded by the bootstrap."""
+        snapshot_loads = self.context_instance.bootstrap_loads or {}
+        source_files = {definition.source.uri for definitions in snapshot_loads.values() for definition in definitions}
+        source_files.update(get_snapshot_source_module_files())
+        plugin_manifest = self.context_instance.plugin_manifest
+        if plugin_manifest:
+            module_files = [getattr(sys.modules[plugin.module_name], "__file__", None) for plugin in plugin_manifest]
+            source_files.update(module_file for module_file in module_files if module_file)
+        return LanguageSnapshot(
+            source_hashes={source_file: get_file_hash(source_file) for source_file in source_files},
+            loads=snapshot_loads,
+            definitions=list(self.context_instance.definitions),
+            fully_qualified_name_to_definition=self.context_instance.fully_qualified_name_to_definition,
+            fully_qualified_name_to_class=self.context_instance.fully_qualified_name_to_class,
+            plugin_modules=self.context_instance.plugin_modules,
+            plugins=plugin_manifest,
+        )
+
     def get_aac_core_file_path(self) -> str:
         """
         Function to return the AaC language file path.
@@ -176,10 +326,22 @@ class LanguageContext(object):
             IOError: Exception from _read_arch_file_content
             Exception: Generic exception from _read_arch_file_content
         """
+        bootstrap_loads = self.context_instance.bootstrap_loads
+        if arg in self.context_instance.snapshot_loads:
+            # the definitions were restored from the language snapshot, so there's nothing to parse
+            if bootstrap_loads is None:
+                # a lazily registered plugin loads its definitions once, when its module is loaded
+                return self.context_instance.snapshot_loads.pop(arg)
+            bootstrap_loads[arg] = self.context_instance.snapshot_loads[arg]
+            return bootstrap_loads[arg]
+
         parsed_definitions = parse(arg)
         parser = DefinitionParser()
 
-        return parser.load_definitions(self, parsed_definitions)
+        loaded_definitions = parser.load_definitions(self, parsed_definitions)
+        if bootstrap_loads is not None:
+            bootstrap_loads[arg] = loaded_definitions
+        return loaded_definitions
 
     def remove_definitions(self, definitions: list[Definition]) -> None:
         """
@@ -191,9 +353,91 @@ class LanguageContext(object):
         for definition in definitions:
             definition.source.is_loaded_in_context = False
             self.context_instance.definitions.remove(definition)
+            fully_qualified_name = self.get_lookup_name(definition)
             del self.context_instance.fully_qualified_name_to_definition[
-                f"{definition.package}.{definition.name}"
+                fully_qualified_name
             ]
+            self.context_instance._unindex_definition(fully_qualified_name, definition)
+
+    def get_lookup_name(self, definition: Definition) -> str:
+        """
+        Get the name a definition is stored under in the context's definition lookup.
+
+        Args:
+            definition (Definition): The definition to get the lookup name of.
+
+        Returns:
+            The fully qualified name of the definition, followed by the requirement id for requirements.
+        """
+        fully_qualified_name = f"{definition.package}.{definition.name}"
+        # This is so requirements specifically do not get overwritten.  Although other definition types may still get overwritten, so we may need to find a better solution eventually.
+        if definition.get_root_key() == "req":
+            fully_qualified_name = f"{fully_qualified_name}_{definition.structure['req']['id']}"
+        return fully_qualified_name
+
+    def add_definition(self, fully_qualified_name: str, definition: Definition) -> None:
+        """
+        Add the given definition to the context's definition lookups.
+
+        Args:
+            fully_qualified_name (str): The key the definition is stored under, replacing any definition already stored under it.
+            definition (Definition): The definition to add.
+        """
+        replaced_definition = self.context_instance.fully_qualified_name_to_definition.get(fully_qualified_name)
+        if replaced_definition is not None:
+            self.context_instance._unindex_definition(fully_qualified_name, replaced_definition)
+        self.context_instance.fully_qualified_name_to_definition[fully_qualified_name] = definition
+        self.context_instance._index_definition(fully_qualified_name, definition)
+
+    def _index_definition(self, fully_qualified_name: str, definition: Definition) -> None:
+        # Definitions are indexed by their python class name, which is the last part of their python fully qualified name.
+        python_name = definition.get_fully_qualified_name()
+        short_name = python_name.rsplit(".", 1)[-1]
+        self.context_instance.name_to_definitions.setdefault(short_name, {})[fully_qualified_name] = (python_name, definition)
+
+        for parent_name in self._get_parent_names(definition):
+            self.context_instance.fully_qualified_name_to_children.setdefault(parent_name, {})[fully_qualified_name] = definition
+        self.context_instance.fully_qualified_name_to_descendants.clear()
+
+        self.context_instance.root_key_to_definitions.setdefault(definition.get_root_key(), {})[fully_qualified_name] = definition
+        self.context_instance.root_key_to_field_chain_values.pop(definition.get_root_key(), None)
+        defined_root = self._get_defined_root(definition)
+        if defined_root:
+            self.context_instance.root_key_to_defining_schemas.setdefault(defined_root, {})[fully_qualified_name] = definition
+
+    def _unindex_definition(self, fully_qualified_name: str, definition: Definition) -> None:
+        short_name = definition.get_fully_qualified_name().rsplit(".", 1)[-1]
+        definitions = self.context_instance.name_to_definitions.get(short_name, {})
+        definitions.pop(fully_qualified_name, None)
+        if not definitions:
+            self.context_instance.name_to_definitions.pop(short_name, None)
+
+        for parent_name in self._get_parent_names(definition):
+            children = self.context_instance.fully_qualified_name_to_children.get(parent_name, {})
+            children.pop(fully_qualified_name, None)
+            if not children:
+                self.context_instance.fully_qualified_name_to_children.pop(parent_name, None)
+        self.context_instance.fully_qualified_name_to_descendants.clear()
+        self.context_instance.root_key_to_field_chain_values.pop(definition.get_root_key(), None)
+
+        for index, key in [
+            (self.context_instance.root_key_to_definitions, definition.get_root_key()),
+            (self.context_instance.root_key_to_defining_schemas, self._get_defined_root(definition)),
+        ]:
+            definitions = index.get(key, {})
+            definitions.pop(fully_qualified_name, None)
+            if not definitions:
+                index.pop(key, None)
+
+    def _get_defined_root(self, definition: Definition) -> Optional[str]:
+        if definition.get_root_key() != "schema":
+            return None
+        defined_root = definition.structure["schema"].get("root")
+        return defined_root if isinstance(defined_root, str) else None
+
+    def _get_parent_names(self, definition: Definition) -> list[str]:
+        extends = getattr(definition.instance, "extends", None) or []
+        return [f"{extension.package}.{extension.name}" for extension in extends]
 
     def get_definitions(self) -> list[Definition]:
         """
@@ -214,14 +458,13 @@ class LanguageContext(object):
         Returns:
             A list of definitions with the given name.
         """
-        result = []
         search_name = name
         if "." not in name:
             search_name = f".{name}"
-        for definition in self.get_definitions():
-            if definition.get_fully_qualified_name().endswith(search_name.replace(" ", "")):
-                result.append(definition)
-        return result
+        search_name = search_name.replace(" ", "")
+        # Only definitions with the same python class name as the last part of the search name can match it.
+        candidates = self.context_instance.name_to_definitions.get(search_name.rsplit(".", 1)[-1], {})
+        return [definition for python_name, definition in candidates.values() if python_name.endswith(search_name)]
 
     def get_definitions_by_root(self, root_key: str) -> list[Definition]:
         """
@@ -233,11 +476,19 @@ class LanguageContext(object):
         Returns:
            A list of definitions with the given root key.
         """
-        result = []
-        for definition in self.get_definitions():
-            if definition.get_root_key() == root_key:
-                result.append(definition)
-        return result
+        return list(self.context_instance.root_key_to_definitions.get(root_key, {}).values())
+
+    def get_defining_schemas_for_root(self, root_key: str) -> list[Definition]:
+        """
+        Get all the schema definitions that define a given root key, in the order they were loaded.
+
+        Args:
+            root_key (str): The root key for the schema definition.
+
+        Returns:
+            A list of the schema definitions that declare the given root key.
+        """
+        return list(self.context_instance.root_key_to_defining_schemas.get(root_key, {}).values())
 
     def get_defining_schema_for_root(self, root_key: str) -> Definition:
         """
@@ -252,12 +503,10 @@ class LanguageContext(object):
         Raises:
             LanguageError: When no definition is found for the defining schema, an error message detailing the issue is generated.
         """
-        current_definition: Definition = None
-        for definition in self.get_definitions():
-            current_definition = definition
-            if definition.get_root_key() == "schema":
-                if definition.instance.root == root_key:
-                    return definition
+        defining_schemas = self.get_defining_schemas_for_root(root_key)
+        if defining_schemas:
+            return defining_schemas[0]
+        current_definition: Definition = next(reversed(self.context_instance.fully_qualified_name_to_definition.values()))
         raise LanguageError(
             message=f"Could not find defining schema for root key: {root_key}",
             location=current_definition.source.uri
@@ -331,23 +580,31 @@ class LanguageContext(object):
         Returns:
             A boolean value which equals True if the given definition is an extension, and equals False if it is not.
         """
-        definitions_of_type = self.get_definitions_of_type(package, name)
-        return check_me in definitions_of_type
-
-    def _recurse_type_inheritance(self, check_me: Definition) -> list[Definition]:
-        result = []
-        if "extends" in list(vars(check_me.instance).keys()):
-            for extension in check_me.instance.extends:
-                ext_package = extension.package
-                ext_name = extension.name
-                parent_definition = (
-                    self.context_instance.fully_qualified_name_to_definition[
-                        f"{ext_package}.{ext_name}"
-                    ]
-                )
-                result.append(parent_definition)
-                result.extend(self._recurse_type_inheritance(parent_definition))
-        return result
+        type_name = f"{package}.{name}"
+        type_definition = self.context_instance.fully_qualified_name_to_definition.get(type_name)
+        if type_definition is None:
+            raise LanguageError(f"Could not find definition for {type_name}", "No file to reference")
+
+        # look the definition up by name in the descendant index, rather than comparing it to every definition of the type
+        lookup_name = self.get_lookup_name(check_me)
+        candidate = type_definition if lookup_name == type_name else self._get_descendants(type_name).get(lookup_name)
+        return candidate is not None and candidate == check_me
+
+    def _get_descendants(self, fully_qualified_name: str) -> dict[str, Definition]:
+        """Return the definitions that transitively extend the named definition by their lookup names, in the order they were loaded."""
+        descendants = self.context_instance.fully_qualified_name_to_descendants.get(fully_qualified_name)
+        if descendants is None:
+            found: dict[str, Definition] = {}
+            names_to_visit = [fully_qualified_name]
+            while names_to_visit:
+                children = self.context_instance.fully_qualified_name_to_children.get(names_to_visit.pop(), {})
+                for child_name, child in children.items():
+                    if child_name not in found:
+                        found[child_name] = child
+                        names_to_visit.append(child_name)
+            descendants = {name: definition for name, definition in self.context_instance.fully_qualified_name_to_definition.items() if name in found}
+            self.context_instance.fully_qualified_name_to_descendants[fully_qualified_name] = descendants
+        return descendants
 
     def get_definitions_of_type(self, package: str, name: str) -> list[Definition]:
         """
@@ -375,43 +632,22 @@ class LanguageContext(object):
             f"{package}.{name}"
         ]
         result.append(definition)
-        # loop through all definitions and see if the type we care about is in it's inheritance tree
-        for item in self.get_definitions():
-            inheritance_types = self._recurse_type_inheritance(item)
-            if f"{package}.{name}" in [
-                f"{definition.package}.{definition.name}"
-                for definition in inheritance_types
-            ]:
-                result.append(item)
+        # add all the definitions that have the type we care about in their inheritance tree
+        result.extend(self._get_descendants(f"{package}.{name}").values())
         return result
 
-    def _traverse_field_chain(
-        self, structure_list: list, field_chain: list[str]
-    ) -> list:
-        current_structures = structure_list
-        search_depth = len(field_chain)
-        current_depth = 0
-        values_found = []
-        for field_name in field_chain:
-            next_structures = []
-            for structure in current_structures:
-                if field_name in structure:
-                    if isinstance(structure[field_name], list):
-                        if current_depth == search_depth - 1:
-                            values_found.extend(structure[field_name])
-                        else:
-                            next_structures.extend(structure[field_name])
-                    else:
-                        if (
-                            current_depth == search_depth - 1
-                        ):  # This just means we're at the end of the field chain and should pull the value
-                            values_found.append(structure[field_name])
-                        else:
-                            next_structures.append(structure.get(field_name, []))
-            current_structures = next_structures
-            current_depth += 1
-
-        return values_found
+    def iter_values_by_field_chain(self, search_term: str) -> Iterator[Any]:
+        """
+        Lazily find values from the language context using a dot notation field chain.
+
+        Args:
+            search_term (str): A dot notation field chain. (i.e. root.definition.field)
+
+        Returns:
+            An iterator of the values from the specified fields, found as it's consumed.
+        """
+        query = get_field_chain_query(search_term)
+        return query.iter_values(definition.structure for definition in self.get_definitions_by_root(query.root_key))
 
     def get_values_by_field_chain(self, search_term: str) -> list:
         """
@@ -423,11 +659,24 @@ class LanguageContext(object):
         Returns:
             A list of values from the specified fields.
         """
-        result: list = []
-        root_key = search_term.split(".")[0]
-        candidate_values = self.get_definitions_by_root(root_key)
-        result = self._traverse_field_chain(
-            [definition.structure for definition in candidate_values],
-            search_term.split("."),
-        )
-        return result
+        return list(self.iter_values_by_field_chain(search_term))
+
+    def get_value_set_by_field_chain(self, search_term: str) -> frozenset:
+        """
+        Find the set of values from the language context using a dot notation field chain.
+
+        The set is kept until a definition with the field chain's root key is loaded or removed, so checking many values
+        against the same field chain only traverses the definitions once.
+
+        Args:
+            search_term (str): A dot notation field chain. (i.e. root.definition.field)
+
+        Returns:
+            A set of the hashable values from the specified fields.
+        """
+        field_chain_values = self.context_instance.root_key_to_field_chain_values.setdefault(search_term.split(".")[0], {})
+        values = field_chain_values.get(search_term)
+        if values is None:
+            values = frozenset(value for value in self.iter_values_by_field_chain(search_term) if isinstance(value, Hashable))
+            field_chain_values[search_term] = values
+        return values
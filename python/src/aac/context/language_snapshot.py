@@ -0,0 +1,231 @@
+"""Provides a snapshot of the bootstrapped LanguageContext so later AaC invocations can skip parsing and loading the AaC language."""
+import logging
+import pickle
+from attr import Factory, attrib, attrs, validators
+from enum import Enum, EnumMeta, auto
+from hashlib import md5
+from importlib.util import find_spec
+from os import environ, makedirs, path, remove, replace
+from tempfile import mkstemp
+from typing import Any, Optional
+
+from aac import __version__
+from aac.context.definition import Definition
+from aac.in_out.constants import AAC_LANGUAGE_SNAPSHOT_ENVIRONMENT_VARIABLE
+from aac.in_out.paths import get_user_cache_directory
+
+# The layout of the snapshot file. Changes to the modules that build the snapshot are caught by their source hashes instead.
+SNAPSHOT_FORMAT_VERSION = 7
+SNAPSHOT_DIRECTORY_NAME = "snapshot"
+SNAPSHOT_FILE_NAME = "language_context.pickle"
+
+# The modules that define the pickled objects, or that load the definitions and generate the classes in the snapshot.
+# Their source files are hashed with the snapshot, so changing any of them discards the snapshots taken before the change.
+SNAPSHOT_SOURCE_MODULES = [
+    "aac.context.definition",
+    "aac.context.definition_parser",
+    "aac.context.language_context",
+    "aac.context.language_snapshot",
+    "aac.context.lexeme",
+    "aac.context.lexeme_table",
+    "aac.context.source_location",
+    "aac.context.util",
+    "aac.execute.plugin_runner",
+    "aac.in_out.files.aac_file",
+    "aac.in_out.parser._frozen",
+]
+
+# Generated classes are recorded as specs and rebuilt before the definitions are restored
+CLASS_SPEC_ENUM = "enum"
+CLASS_SPEC_SCHEMA = "schema"
+
+
+@attrs(slots=True)
+class PluginManifestEntry:
+    """A plugin registered while bootstrapping, recorded so it can be registered again without importing its module.
+
+    Attributes:
+        module_name (str): The name of the module whose `register_plugin` hook registered the plugin.
+        plugin_definition (Definition): The plugin's definition, which describes its commands, arguments and help text.
+        command_names (list[str]): The names of the commands the plugin registered callbacks for.
+        constraint_names (list[str]): The names of the constraints the plugin registered callbacks for.
+        batch_constraint_names (list[str]): The names of the primitive constraints the plugin registered batched callbacks for.
+    """
+
+    module_name: str = attrib(validator=validators.instance_of(str))
+    plugin_definition: Definition = attrib(validator=validators.instance_of(Definition))
+    command_names: list[str] = attrib(default=Factory(list), validator=validators.instance_of(list))
+    constraint_names: list[str] = attrib(default=Factory(list), validator=validators.instance_of(list))
+    batch_constraint_names: list[str] = attrib(default=Factory(list), validator=validators.instance_of(list))
+
+
+@attrs
+class LanguageSnapshot:
+    """The state of a fully bootstrapped LanguageContext.
+
+    Attributes:
+        source_hashes (dict[str, str]): The md5 hash of every AaC file that contributed definitions to the
+            snapshot, of every module that registered a plugin, and of the modules that built the snapshot.
+        loads (dict[str, list[Definition]]): The definitions returned for each AaC file loaded while bootstrapping.
+        definitions (list[Definition]): All definitions in the context.
+        fully_qualified_name_to_definition (dict[str, Definition]): The context's definition lookup.
+        fully_qualified_name_to_class (dict[str, Any]): The context's generated Python classes.
+        plugin_modules (list[str]): The names of the plugin modules that were installed when the snapshot was taken.
+        plugins (Optional[list[PluginManifestEntry]]): The plugins registered while bootstrapping, in registration
+            order, or None if a plugin wasn't registered by a module and the plugins can't be registered lazily.
+    """
+
+    source_hashes: dict[str, str] = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+    loads: dict[str, list[Definition]] = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+    definitions: list[Definition] = attrib(default=Factory(list), validator=validators.instance_of(list))
+    fully_qualified_name_to_definition: dict[str, Definition] = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+    fully_qualified_name_to_class: dict[str, Any] = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+    plugin_modules: list[str] = attrib(default=Factory(list), validator=validators.instance_of(list))
+    plugins: Optional[list[PluginManifestEntry]] = attrib(default=None)
+
+    def is_current(self) -> bool:
+        """Return True if none of the AaC files or modules that contributed to the snapshot have changed."""
+        return all(get_file_hash(file_path) == file_hash for file_path, file_hash in self.source_hashes.items())
+
+
+def is_snapshot_enabled() -> bool:
+    """
+    Return True if the LanguageContext should be bootstrapped from, and saved to, a snapshot.
+
+    Snapshots are enabled unless the `AAC_LANGUAGE_SNAPSHOT` environment variable is set to `0`, `false`, or `no`.
+    """
+    return environ.get(AAC_LANGUAGE_SNAPSHOT_ENVIRONMENT_VARIABLE, "").lower() not in ["0", "false", "no"]
+
+
+def get_snapshot_file_path() -> str:
+    """Return the path of the LanguageContext snapshot file."""
+    return path.join(get_user_cache_directory(SNAPSHOT_DIRECTORY_NAME), SNAPSHOT_FILE_NAME)
+
+
+def get_snapshot_source_module_files() -> list[str]:
+    """Return the source files of the modules that built the snapshot, which are hashed along with its AaC files."""
+    return [find_spec(module_name).origin for module_name in SNAPSHOT_SOURCE_MODULES]
+
+
+def get_file_hash(file_path: str) -> str:
+    """Return the md5 hash of a file's content, or an empty string if the file can't be read."""
+    try:
+        with open(file_path, "rb") as snapshot_source:
+            return md5(snapshot_source.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+def save_language_snapshot(snapshot: LanguageSnapshot, snapshot_file_path: Optional[str] = None) -> None:
+    """
+    Write the snapshot to disk.
+
+    Failing to write the snapshot is logged, but otherwise ignored since the snapshot is only an optimization.
+
+    Args:
+        snapshot (LanguageSnapshot): The snapshot to write.
+        snapshot_file_path (Optional[str]): Overrides the location the snapshot is written to.
+    """
+    snapshot_file_path = snapshot_file_path or get_snapshot_file_path()
+    class_specs, class_to_name = _get_class_specs(snapshot.fully_qualified_name_to_class)
+
+    temp_path = None
+    try:
+        makedirs(path.dirname(snapshot_file_path), exist_ok=True)
+        file_descriptor, temp_path = mkstemp(dir=path.dirname(snapshot_file_path), suffix=".tmp")
+        with open(file_descriptor, "wb") as snapshot_file:
+            header = (SNAPSHOT_FORMAT_VERSION, __version__, snapshot.source_hashes, snapshot.plugin_modules, class_specs)
+            pickle.dump(header, snapshot_file, pickle.HIGHEST_PROTOCOL)
+            _GeneratedClassPickler(snapshot_file, class_to_name).dump(
+                (snapshot.loads, snapshot.definitions, snapshot.fully_qualified_name_to_definition, snapshot.plugins)
+            )
+        replace(temp_path, snapshot_file_path)
+    except Exception as error:
+        logging.warning(f"Failed to write the LanguageContext snapshot '{snapshot_file_path}': {error}")
+        if temp_path and path.exists(temp_path):
+            remove(temp_path)
+
+
+def load_language_snapshot(snapshot_file_path: Optional[str] = None) -> Optional[LanguageSnapshot]:
+    """
+    Read the snapshot from disk.
+
+    Args:
+        snapshot_file_path (Optional[str]): Overrides the location the snapshot is read from.
+
+    Returns:
+        The snapshot, or None if there is no snapshot or it was created by a different AaC version or from different AaC files.
+    """
+    snapshot_file_path = snapshot_file_path or get_snapshot_file_path()
+    if not path.exists(snapshot_file_path):
+        return None
+
+    try:
+        with open(snapshot_file_path, "rb") as snapshot_file:
+            format_version, version, source_hashes, *header = pickle.load(snapshot_file)
+            snapshot = LanguageSnapshot(source_hashes)
+            if format_version != SNAPSHOT_FORMAT_VERSION or version != __version__ or not snapshot.is_current():
+                logging.info(f"Discarding the out of date LanguageContext snapshot '{snapshot_file_path}'.")
+                return None
+
+            snapshot.plugin_modules, class_specs = header
+            snapshot.fully_qualified_name_to_class = _build_classes(class_specs)
+            unpickler = _GeneratedClassUnpickler(snapshot_file, snapshot.fully_qualified_name_to_class)
+            snapshot.loads, snapshot.definitions, snapshot.fully_qualified_name_to_definition, snapshot.plugins = unpickler.load()
+    except Exception as error:
+        logging.warning(f"Failed to read the LanguageContext snapshot '{snapshot_file_path}': {error}")
+        return None
+
+    return snapshot
+
+
+class _GeneratedClassPickler(pickle.Pickler):
+    """Pickles references to generated AaC classes, which can't be imported, by their fully qualified name."""
+
+    def __init__(self, file: Any, class_to_name: dict[type, str]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.class_to_name = class_to_name
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if isinstance(obj, type):
+            return self.class_to_name.get(obj)
+        return None
+
+
+class _GeneratedClassUnpickler(pickle.Unpickler):
+    """Resolves references to generated AaC classes written by the _GeneratedClassPickler."""
+
+    def __init__(self, file: Any, name_to_class: dict[str, type]):
+        super().__init__(file)
+        self.name_to_class = name_to_class
+
+    def persistent_load(self, pid: str) -> type:
+        return self.name_to_class[pid]
+
+
+def _get_class_specs(fully_qualified_name_to_class: dict[str, Any]) -> tuple[list[tuple], dict[type, str]]:
+    """Describe the generated classes so they can be rebuilt, in creation order, without the definition parser."""
+    class_to_name = {generated_class: name for name, generated_class in fully_qualified_name_to_class.items()}
+    class_specs = []
+    for name, generated_class in fully_qualified_name_to_class.items():
+        if isinstance(generated_class, EnumMeta):
+            class_specs.append((CLASS_SPEC_ENUM, name, generated_class.__name__, generated_class.__module__, list(generated_class.__members__)))
+        else:
+            base_names = [class_to_name[base] for base in generated_class.__bases__ if base is not object]
+            fields = {field: value for field, value in vars(generated_class).items() if not field.startswith("__")}
+            class_specs.append((CLASS_SPEC_SCHEMA, name, generated_class.__name__, generated_class.__module__, base_names, fields))
+    return class_specs, class_to_name
+
+
+def _build_classes(class_specs: list[tuple]) -> dict[str, Any]:
+    """Rebuild the generated classes from their specs."""
+    fully_qualified_name_to_class: dict[str, Any] = {}
+    for spec_type, name, class_name, module, *spec in class_specs:
+        if spec_type == CLASS_SPEC_ENUM:
+            member_names, = spec
+            fully_qualified_name_to_class[name] = Enum(class_name, {member: auto() for member in member_names}, module=module)
+        else:
+            base_names, fields = spec
+            bases = tuple(fully_qualified_name_to_class[base_name] for base_name in base_names) or (object,)
+            fully_qualified_name_to_class[name] = type(class_name, bases, {"__module__": module, **fields})
+    return fully_qualified_name_to_class
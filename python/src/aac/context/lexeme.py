@@ -6,7 +6,7 @@ from aac.in_out.paths import is_same_file
 from aac.context.source_location import SourceLocation
 
 
-@attrs(eq=False)
+@attrs(eq=False, slots=True)
 class Lexeme:
     """A lexical unit for a parsed AaC definition.
 
@@ -0,0 +1,245 @@
+"""Provides compact, columnar storage for the lexemes parsed from an AaC source."""
+from array import array
+from attr import Factory, attrib, attrs, validators
+from bisect import bisect_left
+from collections.abc import Sequence
+from heapq import merge
+from sys import intern
+from typing import Any, Optional, Union
+
+from aac.context.lexeme import Lexeme
+from aac.context.source_location import SourceLocation
+
+# Booleans are parsed from several YAML spellings, so a boolean value can match any of them.
+BOOLEAN_LEXEME_VALUES = {True: ["True", "true", "yes"], False: ["False", "false"]}
+
+
+@attrs(slots=True)
+class LexemeTable:
+    """The lexemes of a single source stored as columns rather than as individual Lexeme objects.
+
+    Lexeme and SourceLocation objects are only created when a lexeme is accessed, so a parsed source holds
+    a handful of arrays instead of two objects per lexeme.
+
+    Attributes:
+        source (str): The source in which the lexemes were found.
+        lines (array): The line number of each lexeme.
+        columns (array): The column of each lexeme.
+        positions (array): The position of each lexeme relative to the start of the source.
+        spans (array): The number of characters occupied by each lexeme.
+        values (list[str]): The interned value of each lexeme.
+        value_index (Optional[dict[str, list[int]]]): The indices of the lexemes with each value, built on first use.
+    """
+
+    source: str = attrib(validator=validators.instance_of(str))
+    lines: array = attrib(default=Factory(lambda: array("i")), validator=validators.instance_of(array))
+    columns: array = attrib(default=Factory(lambda: array("i")), validator=validators.instance_of(array))
+    positions: array = attrib(default=Factory(lambda: array("q")), validator=validators.instance_of(array))
+    spans: array = attrib(default=Factory(lambda: array("i")), validator=validators.instance_of(array))
+    values: list[str] = attrib(default=Factory(list), validator=validators.instance_of(list))
+    value_index: Optional[dict[str, list[int]]] = attrib(default=None, init=False)
+
+    def __len__(self) -> int:
+        """Return the number of lexemes in the table."""
+        return len(self.values)
+
+    def add(self, line: int, column: int, position: int, span: int, value: str) -> None:
+        """
+        Add a lexeme to the table.
+
+        Args:
+            line (int): The line number on which the lexeme was found.
+            column (int): The character position at which the lexeme was found.
+            position (int): The position relative to the start of the source where the lexeme was found.
+            span (int): The number of characters occupied by the lexeme.
+            value (str): The value of the lexeme.
+        """
+        self.lines.append(line)
+        self.columns.append(column)
+        self.positions.append(position)
+        self.spans.append(span)
+        self.values.append(intern(value) if isinstance(value, str) else value)
+        self.value_index = None
+
+    def get_indices_of_value(self, value: Any) -> list[int]:
+        """
+        Return the indices of the lexemes matching the value, in source order.
+
+        Args:
+            value (Any): The value to find. Lexeme values are strings, so other values are matched by their string
+                representation and booleans are matched by any of their YAML spellings.
+
+        Returns:
+            The sorted indices of the matching lexemes.
+        """
+        if self.value_index is None:
+            self.value_index = {}
+            for index, lexeme_value in enumerate(self.values):
+                self.value_index.setdefault(lexeme_value, []).append(index)
+
+        lexeme_values = _get_lexeme_values(value)
+        if len(lexeme_values) == 1:
+            return self.value_index.get(lexeme_values[0], [])
+        return list(merge(*[self.value_index.get(lexeme_value, []) for lexeme_value in lexeme_values]))
+
+    def moved(self, lines: int, positions: int) -> "LexemeTable":
+        """
+        Return a copy of the table with every lexeme moved by the same offsets, such as when text is inserted above them.
+
+        Args:
+            lines (int): The number of lines to move the lexemes by.
+            positions (int): The number of characters to move the lexemes by.
+
+        Returns:
+            A new table sharing the values of this table.
+        """
+        table = LexemeTable(
+            self.source,
+            array("i", [line + lines for line in self.lines]),
+            self.columns,
+            array("q", [position + positions for position in self.positions]),
+            self.spans,
+            self.values,
+        )
+        table.value_index = self.value_index
+        return table
+
+    def get_location(self, index: int) -> SourceLocation:
+        """Return the location of the lexeme at the index."""
+        return SourceLocation(self.lines[index], self.columns[index], self.positions[index], self.spans[index])
+
+    def get_lexeme(self, index: int) -> Lexeme:
+        """Return the lexeme at the index."""
+        return Lexeme(self.get_location(index), self.source, self.values[index])
+
+    def get_lexemes(self, indices: Sequence[int]) -> "LexemeSequence":
+        """
+        Return a read-only sequence of lexemes backed by the table.
+
+        Args:
+            indices (Sequence[int]): The indices of the lexemes in the table, such as the range of a definition's lexemes.
+
+        Returns:
+            A sequence that creates the lexemes at the indices as they're accessed.
+        """
+        return LexemeSequence(self, indices)
+
+
+@attrs(slots=True, eq=False, repr=False)
+class LexemeSequence(Sequence):
+    """A read-only sequence of lexemes backed by a LexemeTable.
+
+    Attributes:
+        table (LexemeTable): The table that stores the lexemes.
+        indices (Sequence[int]): The indices of the lexemes in the table.
+    """
+
+    table: LexemeTable = attrib(validator=validators.instance_of(LexemeTable))
+    indices: Sequence[int] = attrib(validator=validators.instance_of((range, array)))
+
+    def __len__(self) -> int:
+        """Return the number of lexemes in the sequence."""
+        return len(self.indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Lexeme, "LexemeSequence"]:
+        """Return the lexeme at the index, or a sequence of lexemes for a slice."""
+        if isinstance(index, slice):
+            return LexemeSequence(self.table, self.indices[index])
+        return self.table.get_lexeme(self.indices[index])
+
+    def __iter__(self):
+        """Iterate over the lexemes in the sequence."""
+        for table_index in self.indices:
+            yield self.table.get_lexeme(table_index)
+
+    def __eq__(self, other: Any) -> bool:
+        """Return whether the other sequence holds the same lexemes."""
+        if not isinstance(other, (LexemeSequence, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(lexeme == other_lexeme for lexeme, other_lexeme in zip(self, other))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the lexemes in the sequence."""
+        return repr(list(self))
+
+    def get_positions_of_value(self, value: Any) -> list[int]:
+        """Return the positions in this sequence of the lexemes matching the value, using the table's value index."""
+        table_indices = self.table.get_indices_of_value(value)
+        indices = self.indices
+        if isinstance(indices, range) and indices.step == 1:
+            # Definitions are contiguous ranges of the table, so their matches are a contiguous run of the table's matches.
+            first, last = bisect_left(table_indices, indices.start), bisect_left(table_indices, indices.stop)
+            return [table_index - indices.start for table_index in table_indices[first:last]]
+
+        positions = []
+        for table_index in table_indices:
+            position = bisect_left(indices, table_index)
+            if position < len(indices) and indices[position] == table_index:
+                positions.append(position)
+        return positions
+
+
+def find_lexemes(lexemes: Sequence[Lexeme], value: Any) -> list[Lexeme]:
+    """
+    Return the lexemes matching a value.
+
+    Args:
+        lexemes (Sequence[Lexeme]): The lexemes to search.
+        value (Any): The value to find. Lexeme values are strings, so other values are matched by their string
+            representation and booleans are matched by any of their YAML spellings.
+
+    Returns:
+        The matching lexemes, in source order.
+    """
+    if isinstance(lexemes, LexemeSequence):
+        return [lexemes[position] for position in lexemes.get_positions_of_value(value)]
+
+    lexeme_values = _get_lexeme_values(value)
+    return [lexeme for lexeme in lexemes if lexeme.value in lexeme_values]
+
+
+def find_first_lexeme(lexemes: Sequence[Lexeme], value: Any) -> Optional[Lexeme]:
+    """
+    Return the first lexeme matching a value, without creating the other matching lexemes.
+
+    Args:
+        lexemes (Sequence[Lexeme]): The lexemes to search.
+        value (Any): The value to find, matched the same way as find_lexemes.
+
+    Returns:
+        The first matching lexeme in source order, or None if no lexeme matches.
+    """
+    if isinstance(lexemes, LexemeSequence):
+        positions = lexemes.get_positions_of_value(value)
+        return lexemes[positions[0]] if positions else None
+
+    lexeme_values = _get_lexeme_values(value)
+    return next((lexeme for lexeme in lexemes if lexeme.value in lexeme_values), None)
+
+
+def get_lexemes_from_value(lexemes: Sequence[Lexeme], value: Any) -> Sequence[Lexeme]:
+    """
+    Return the lexemes starting at the first lexeme matching a value.
+
+    Args:
+        lexemes (Sequence[Lexeme]): The lexemes to search.
+        value (Any): The value to find.
+
+    Returns:
+        The lexemes from the first match to the end, or an empty sequence if there is no match.
+    """
+    if isinstance(lexemes, LexemeSequence):
+        positions = lexemes.get_positions_of_value(value)
+        return lexemes[positions[0]:] if positions else lexemes[len(lexemes):]
+
+    lexeme_values = _get_lexeme_values(value)
+    for position, lexeme in enumerate(lexemes):
+        if lexeme.value in lexeme_values:
+            return lexemes[position:]
+    return []
+
+
+def _get_lexeme_values(value: Any) -> list[str]:
+    if value is True or value is False:
+        return BOOLEAN_LEXEME_VALUES[value]
+    return [str(value)]
@@ -3,7 +3,7 @@
 from attr import attrib, attrs, validators
 
 
-@attrs
+@attrs(slots=True)
 class SourceLocation:
     """The position and span of an AaC structure in the YAML source.
 
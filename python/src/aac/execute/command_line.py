@@ -46,7 +46,9 @@ def output_result(result: ExecutionResult):
         result (ExecutionResult): The result from execution the command.
     """
     error_occurred = not result.is_success()
-    secho(result.get_messages_as_string(), err=error_occurred, color=True)
+    # Commands that communicate over standard output, like the language server, return results without messages.
+    if result.messages:
+        secho(result.get_messages_as_string(), err=error_occurred, color=True)
 
     if error_occurred:
         sys.exit(result.status_code.value)
@@ -231,29 +233,28 @@ def initialize_cli():
             secho(f"{e.message}", err=True, color=True)
         sys.exit(1)
 
-    def get_commands() -> list[AacCommand]:
+    def get_commands(runner: PluginRunner) -> list[AacCommand]:
         result: list[AacCommand] = []
 
-        context = LanguageContext()
-        for runner in context.get_plugin_runners():
-            definition = runner.plugin_definition
-            for plugin_command in definition.instance.commands:
-                arguments: list[AacCommandArgument] = get_command_arguments(plugin_command, definition)
-
-                result.append(
-                    AacCommand(
-                        plugin_command.name,
-                        plugin_command.help_text,
-                        runner.command_to_callback[plugin_command.name],
-                        arguments,
-                    )
+        definition = runner.plugin_definition
+        for plugin_command in definition.instance.commands:
+            arguments: list[AacCommandArgument] = get_command_arguments(plugin_command, definition)
+
+            result.append(
+                AacCommand(
+                    plugin_command.name,
+                    plugin_command.help_text,
+                    runner.command_to_callback[plugin_command.name],
+                    arguments,
                 )
+            )
         return result
 
+    # The commands are built from the plugin definitions, so a plugin's module isn't imported until one of its commands runs
     runners: list[PluginRunner] = active_context.get_plugin_runners()
     for runner in runners:
         commands = [
-            to_click_command(runner.get_plugin_name(), cmd) for cmd in get_commands()
+            to_click_command(runner.get_plugin_name(), cmd) for cmd in get_commands(runner)
         ]
         for command in commands:
             cli.add_command(command)
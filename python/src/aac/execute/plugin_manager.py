@@ -1,6 +1,7 @@
 """Provide access to plugins and plugin data."""
 
 from importlib import import_module
+from importlib.metadata import distributions
 from pkgutil import iter_modules
 from types import ModuleType
 from pluggy import PluginManager
@@ -30,6 +31,35 @@ def get_plugin_manager() -> PluginManager:
     return plugin_manager
 
 
+def get_plugin_module_names() -> List[str]:
+    """
+    Get the names of the plugin modules that the plugin manager registers, without importing them.
+
+    Returns:
+        The names of the modules of the plugins installed through setuptools entry points, followed by the names of
+        the core plugin modules.
+    """
+    module_names = [
+        entry_point.module
+        for distribution in distributions()
+        for entry_point in distribution.entry_points
+        if entry_point.group == PLUGIN_PROJECT_NAME
+    ]
+    plugins_package = import_module("aac.plugins")
+    module_names.extend(f"aac.plugins.{module_name}" for _, module_name, _ in iter_modules(plugins_package.__path__))
+    return module_names
+
+
+def register_plugin_module(module_name: str) -> None:
+    """
+    Import a plugin module and register its plugin, without the plugin manager.
+
+    Args:
+        module_name (str): The name of the plugin module, which implements the `register_plugin` hook.
+    """
+    import_module(module_name).register_plugin()
+
+
 def register_plugins_in_package(package: str) -> List[ModuleType]:
     """
     Register all the plugins in the specified package.
@@ -1,9 +1,12 @@
 """A simple data class to collect AaC command info from plugins."""
 
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Union
 
 from attr import Factory, attrib, attrs, validators
 from aac.context.definition import Definition
+from aac.context.source_location import SourceLocation
+from aac.execute.aac_execution_result import ExecutionResult
+from aac.in_out.files.aac_file import AaCFile
 
 
 @attrs
@@ -51,6 +54,26 @@ class AacCommand:
         return hash(self.name)
 
 
+@attrs(slots=True)
+class PrimitiveConstraintValue:
+    """
+    A value passed to a batched primitive constraint callback, with the arguments a primitive constraint callback takes.
+
+    Attributes:
+        value: The value being checked.
+        type_declaration: The type declaration of the field the value was found in.
+        arguments: The arguments of the constraint assignment.
+        source: The source file of the definition the value was found in.
+        location: The location of the value's field within the source file.
+    """
+
+    value: Any = attrib()
+    type_declaration: str = attrib()
+    arguments: Any = attrib()
+    source: Optional[AaCFile] = attrib()
+    location: Optional[SourceLocation] = attrib()
+
+
 @attrs(hash=False)
 class PluginRunner:
     """
@@ -63,14 +86,19 @@ class PluginRunner:
         plugin_definition: The definition for the plugin.
         command_to_callback: Dictionary mapping command names to command callbacks.
         constraint_to_callback: Dictionary mapping constraint names to constraint callbacks.
+        constraint_to_batch_callback: Dictionary mapping primitive constraint names to batched constraint callbacks,
+            which check a list of PrimitiveConstraintValues in one call and return the index and result of each failure.
     """
 
     plugin_definition: Definition = attrib(validator=validators.instance_of(Definition))
     command_to_callback: dict[str, Callable] = attrib(
-        default={}, validator=validators.instance_of(dict)
+        default=Factory(dict), validator=validators.instance_of(dict)
     )
     constraint_to_callback: dict[str, Callable] = attrib(
-        default={}, validator=validators.instance_of(dict)
+        default=Factory(dict), validator=validators.instance_of(dict)
+    )
+    constraint_to_batch_callback: dict[str, Callable[[list[PrimitiveConstraintValue]], list[tuple[int, ExecutionResult]]]] = attrib(
+        default=Factory(dict), validator=validators.instance_of(dict)
     )
 
     # Add constraints here
@@ -91,6 +119,14 @@ class PluginRunner:
             raise TypeError("Constraint Callback is not Callable")
         self.constraint_to_callback[constraint_name] = constraint_callback
 
+    def add_batch_constraint_callback(
+        self, constraint_name: str, batch_callback: Callable
+    ) -> None:
+        """Add a batched callback for a primitive constraint, which the check command uses in place of the constraint callback."""
+        if not callable(batch_callback):
+            raise TypeError("Batch Constraint Callback is not Callable")
+        self.constraint_to_batch_callback[constraint_name] = batch_callback
+
     def get_command_callback(self, command_name: str) -> Callable:
         """Return the callback for the given constraint name."""
         return self.command_to_callback[command_name]
@@ -99,6 +135,35 @@ class PluginRunner:
         """Return the callback for the given constraint name."""
         return self.constraint_to_callback[constraint_name]
 
+    def get_batch_constraint_callback(self, constraint_name: str) -> Callable:
+        """Return the batched callback for the given primitive constraint name."""
+        return self.constraint_to_batch_callback[constraint_name]
+
     def get_plugin_name(self) -> str:
         """Return the name of the plugin."""
         return self.plugin_definition.name
+
+
+@attrs(slots=True, eq=False)
+class LazyPluginCallback:
+    """
+    A command or constraint callback of a plugin whose module hasn't been imported yet.
+
+    The plugin is imported and registered the first time the callback is called, and the call is passed on to the
+    callback that the plugin registered.
+
+    Attributes:
+        name: The name of the command or constraint.
+        load_callback: A function that registers the plugin and returns the callback it registered.
+        callback: The callback registered by the plugin, once it's been loaded. (default: None)
+    """
+
+    name: str = attrib(validator=validators.instance_of(str))
+    load_callback: Callable[[], Callable] = attrib(validator=validators.is_callable())
+    callback: Optional[Callable] = attrib(default=None, init=False)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Call the plugin's callback, loading the plugin first if it hasn't been loaded."""
+        if self.callback is None:
+            self.callback = self.load_callback()
+        return self.callback(*args, **kwargs)
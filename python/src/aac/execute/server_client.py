@@ -0,0 +1,217 @@
+"""The entry-point for the aac tool that forwards commands to a running `aac serve` server, when there is one.
+
+A server keeps the AaC language, plugins and parsed files loaded between commands, so forwarding a command to it skips
+the start-up cost of bootstrapping the language. This module is imported before the language is bootstrapped, so it
+only imports what it needs to find a server and forward a command to it.
+"""
+import json
+import os
+import sys
+from attr import attrib, attrs, validators
+from click import secho
+from os import path
+from typing import Optional
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+from aac import __version__
+from aac.context.source_location import SourceLocation
+from aac.execute.aac_execution_result import ExecutionMessage, ExecutionResult, ExecutionStatus, MessageLevel
+from aac.in_out.constants import AAC_SERVER_ENVIRONMENT_VARIABLE
+from aac.in_out.paths import get_user_cache_directory
+
+SERVER_DIRECTORY_NAME = "server"
+SERVER_FILE_NAME = "server.json"
+
+# A server that doesn't answer a health check this quickly is treated as not running, so the command runs locally.
+HEALTH_CHECK_TIMEOUT_SECONDS = 0.5
+
+# The commands that only read the model and write files relative to the working directory, so they run the same on a server.
+FORWARDED_COMMANDS = ["check", "print-defs"]
+NO_PROMPT_FORWARDED_COMMANDS = ["generate"]
+NO_PROMPT_OPTION = "--no-prompt"
+HELP_OPTIONS = ["-h", "--help"]
+
+
+@attrs(slots=True)
+class ServerInfo:
+    """The information a client needs to find and use a running `aac serve` server.
+
+    Attributes:
+        url (str): The base URL of the server.
+        token (str): The secret that authorizes requests to the server.
+        pid (int): The id of the server's process.
+        version (str): The AaC version the server is running.
+    """
+
+    url: str = attrib(validator=validators.instance_of(str))
+    token: str = attrib(validator=validators.instance_of(str))
+    pid: int = attrib(validator=validators.instance_of(int))
+    version: str = attrib(validator=validators.instance_of(str))
+
+
+def get_server_file_path() -> str:
+    """Return the path of the file that a running server advertises itself in."""
+    return path.join(get_user_cache_directory(SERVER_DIRECTORY_NAME), SERVER_FILE_NAME)
+
+
+def write_server_info(server_info: ServerInfo, server_file_path: Optional[str] = None) -> None:
+    """
+    Advertise a running server to clients.
+
+    The file is only readable by the current user since it contains the server's token.
+
+    Args:
+        server_info (ServerInfo): The information about the running server.
+        server_file_path (Optional[str]): Overrides the location the server is advertised in.
+    """
+    server_file_path = server_file_path or get_server_file_path()
+    os.makedirs(path.dirname(server_file_path), exist_ok=True)
+    temp_path = f"{server_file_path}.{os.getpid()}.tmp"
+    file_descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with open(file_descriptor, "w") as server_file:
+        json.dump({"url": server_info.url, "token": server_info.token, "pid": server_info.pid, "version": server_info.version}, server_file)
+    os.replace(temp_path, server_file_path)
+
+
+def read_server_info(server_file_path: Optional[str] = None) -> Optional[ServerInfo]:
+    """
+    Read the information about the last server that was started.
+
+    Args:
+        server_file_path (Optional[str]): Overrides the location the server is advertised in.
+
+    Returns:
+        The information about the server, or None if no server is advertised.
+    """
+    server_file_path = server_file_path or get_server_file_path()
+    try:
+        with open(server_file_path) as server_file:
+            server_info = json.load(server_file)
+        return ServerInfo(server_info["url"], server_info["token"], server_info["pid"], server_info["version"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def remove_server_info(server_info: ServerInfo, server_file_path: Optional[str] = None) -> None:
+    """
+    Stop advertising a server, unless another server has replaced it since it was started.
+
+    Args:
+        server_info (ServerInfo): The information about the server that's stopping.
+        server_file_path (Optional[str]): Overrides the location the server is advertised in.
+    """
+    server_file_path = server_file_path or get_server_file_path()
+    if read_server_info(server_file_path) == server_info:
+        try:
+            os.remove(server_file_path)
+        except OSError:
+            pass
+
+
+def find_server(server_file_path: Optional[str] = None) -> Optional[ServerInfo]:
+    """
+    Find a running server that can run commands for this version of AaC.
+
+    Args:
+        server_file_path (Optional[str]): Overrides the location the server is advertised in.
+
+    Returns:
+        The information about the server, or None if there's no server running this version of AaC.
+    """
+    server_info = read_server_info(server_file_path)
+    if server_info is None or server_info.version != __version__:
+        return None
+
+    try:
+        health = _send_request(server_info, "GET", "/health", None, HEALTH_CHECK_TIMEOUT_SECONDS)
+    except (OSError, ValueError):
+        return None
+    return server_info if health.get("version") == __version__ else None
+
+
+def forward_command(server_info: ServerInfo, command_name: str, arguments: list[str], working_directory: str) -> Optional[ExecutionResult]:
+    """
+    Run a command on a server.
+
+    Args:
+        server_info (ServerInfo): The server to run the command on.
+        command_name (str): The name of the command to run.
+        arguments (list[str]): The command line arguments of the command.
+        working_directory (str): The directory that relative paths in the arguments are relative to.
+
+    Returns:
+        The result of the command, or None if the server couldn't be reached.
+    """
+    body = {"arguments": arguments, "working_directory": working_directory}
+    try:
+        return result_from_dict(_send_request(server_info, "POST", f"/commands/{command_name}", body, None))
+    except URLError:
+        return None
+
+
+def is_forwarded(arguments: list[str]) -> bool:
+    """Return True if the command line arguments run a command that can be forwarded to a server."""
+    if os.environ.get(AAC_SERVER_ENVIRONMENT_VARIABLE, "1").lower() in ["0", "false", "no", "off"]:
+        return False
+    if not arguments or any(argument in HELP_OPTIONS for argument in arguments):
+        return False
+
+    command_name = arguments[0]
+    return command_name in FORWARDED_COMMANDS or (command_name in NO_PROMPT_FORWARDED_COMMANDS and NO_PROMPT_OPTION in arguments)
+
+
+def result_to_dict(result: ExecutionResult) -> dict:
+    """Return a JSON compatible representation of an execution result."""
+    return {
+        "plugin_name": result.plugin_name,
+        "plugin_command_name": result.plugin_command_name,
+        "status_code": result.status_code.name,
+        "messages": [
+            {
+                "message": message.message,
+                "level": message.level.name,
+                "source": message.source,
+                "location": message.location.to_tuple() if message.location else None,
+            }
+            for message in result.messages
+        ],
+    }
+
+
+def result_from_dict(result: dict) -> ExecutionResult:
+    """Return the execution result with the JSON compatible representation."""
+    messages = [
+        ExecutionMessage(
+            message["message"],
+            MessageLevel[message["level"]],
+            message["source"],
+            SourceLocation(*message["location"]) if message["location"] else None,
+        )
+        for message in result["messages"]
+    ]
+    return ExecutionResult(result["plugin_name"], result["plugin_command_name"], ExecutionStatus[result["status_code"]], messages)
+
+
+def main() -> None:
+    """Run the aac command on a running server if there is one, or bootstrap the AaC language and run it locally otherwise."""
+    arguments = sys.argv[1:]
+    if is_forwarded(arguments):
+        server_info = find_server()
+        result = forward_command(server_info, arguments[0], arguments[1:], os.getcwd()) if server_info else None
+        if result is not None:
+            # Output the result like the command line's result callback does.
+            error_occurred = not result.is_success()
+            secho(result.get_messages_as_string(), err=error_occurred, color=True)
+            sys.exit(result.status_code.value if error_occurred else 0)
+
+    from aac.execute.command_line import cli
+    cli()
+
+
+def _send_request(server_info: ServerInfo, method: str, route: str, body: Optional[dict], timeout: Optional[float]) -> dict:
+    data = json.dumps(body).encode() if body is not None else None
+    headers = {"Authorization": f"Bearer {server_info.token}", "Content-Type": "application/json"}
+    request = Request(f"{server_info.url}{route}", data=data, headers=headers, method=method)
+    with urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
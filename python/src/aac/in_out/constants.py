@@ -6,3 +6,10 @@ DEFINITION_SEPARATOR = f"{YAML_DOCUMENT_SEPARATOR}{linesep}"
 DEFAULT_SOURCE_URI = "No file to reference"
 YAML_DOCUMENT_EXTENSION = ".yaml"
 AAC_DOCUMENT_EXTENSION = ".aac"
+
+AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = "AAC_CACHE_DIR"
+AAC_PERSISTENT_PARSE_CACHE_ENVIRONMENT_VARIABLE = "AAC_PERSISTENT_PARSE_CACHE"
+AAC_LANGUAGE_SNAPSHOT_ENVIRONMENT_VARIABLE = "AAC_LANGUAGE_SNAPSHOT"
+AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE = "AAC_PARSE_JOBS"
+AAC_CACHE_APPLICATION_NAME = "aac"
+AAC_SERVER_ENVIRONMENT_VARIABLE = "AAC_SERVER"
@@ -2,14 +2,17 @@
 
 from aac.in_out.parser._parse_source import parse
 from aac.in_out.parser._parser_error import ParserError
-from aac.in_out.parser._yaml import scan_yaml, parse_yaml
+from aac.in_out.parser._yaml import scan_yaml, parse_yaml, parse_and_scan_yaml
 from aac.in_out.parser._cache_manager import get_cache, reset_cache
+from aac.in_out.parser._frozen import thaw
 
 __all__ = (
     ParserError.__name__,
     parse.__name__,
     scan_yaml.__name__,
     parse_yaml.__name__,
+    parse_and_scan_yaml.__name__,
     get_cache.__name__,
     reset_cache.__name__,
+    thaw.__name__,
 )
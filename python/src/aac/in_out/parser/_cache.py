@@ -1,15 +1,20 @@
 """Provides a YAML Cache for parsed files or strings."""
 import logging
 from attr import Factory, attrib, attrs, validators
+from concurrent.futures import ProcessPoolExecutor
 from hashlib import md5
 from os.path import lexists
 from typing import Optional
 from yaml import Token
 
 from aac.in_out.paths import sanitize_filesystem_path
-from aac.in_out.parser._yaml import parse_yaml, scan_yaml
+from aac.in_out.parser._frozen import freeze
+from aac.in_out.parser._persistent_cache import PersistentYamlCache, _compact_tokens, _expand_tokens
+from aac.in_out.parser._yaml import parse_and_scan_yaml
 
 STRING_YAML_SOURCE = "string"
+# Starting a process pool costs more than parsing a few small files, so smaller batches are parsed in-process.
+PARALLEL_PARSE_MINIMUM_STRINGS = 8
 
 
 @attrs(hash=False)
@@ -19,7 +24,7 @@ class CacheEntry:
     Attributes:
         hash (str): The hash value for the entry.
         yaml_structures (dict[str, Any]): A dictionary of string hashes to yaml dict/maps.
-        yaml_tokens (list[Token]): A list of YAML tokens used to scan the content.
+        yaml_tokens (list[Token]): The value and document boundary YAML tokens from scanning the content.
         times_accessed (int): The number of times this entry has been accessed.
     """
     hash: str = attrib(validator=validators.instance_of(str))
@@ -35,11 +40,15 @@ class YamlLFUCache:
     Attributes:
         capacity (int): The number of cached files/strings before clearing space according to LFU cache behavior.
         cache (dict[str, CacheEntry]): The internal cache data structure -- this is intended to be private, don't access it directly.
+        persistent_cache (Optional[PersistentYamlCache]): An optional on-disk tier consulted before parsing content that isn't cached in memory.
     """
 
     capacity: int = attrib(default=300, validator=validators.instance_of(int))
     # The internal cache is using a dict with sorting O(n log n) rather than a more complex linked list which would be capable of linear time
     cache: dict[str, CacheEntry] = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+    persistent_cache: Optional[PersistentYamlCache] = attrib(
+        default=None, validator=validators.optional(validators.instance_of(PersistentYamlCache))
+    )
 
     def parse_string(self, string: str, source: str = STRING_YAML_SOURCE) -> list[dict]:
         """Parse the YAML string and return the YAML dictionaries."""
@@ -60,6 +69,47 @@ class YamlLFUCache:
         """Parse the YAML string and return the YAML tokens."""
         return self._get_or_parse_string(source, string).yaml_tokens
 
+    def parse_strings(self, sources_to_strings: dict[str, str], max_workers: int = 1) -> dict[str, CacheEntry]:
+        """
+        Parse several YAML strings, parsing the uncached strings across a process pool.
+
+        Args:
+            sources_to_strings (dict[str, str]): The YAML strings to parse, keyed by their source.
+            max_workers (int): The maximum number of processes to parse with. Strings are parsed in-process if this
+                is 1 or if there are only a few uncached strings.
+
+        Returns:
+            The cache entry for each source, in the same order as the strings. The entries are returned rather than
+            looked up later because parsing more strings than the cache capacity evicts some of them.
+
+        Raises:
+            If any string is invalid YAML, the ParserError of the first invalid string is raised.
+        """
+        entries: dict[str, Optional[CacheEntry]] = {}
+        uncached_strings: dict[str, tuple[str, str]] = {}
+        for source, string in sources_to_strings.items():
+            content_hash = str(md5(string.encode()).hexdigest())
+            entries[source] = self._get_cached_entry(content_hash, source)
+            if not entries[source]:
+                uncached_strings[source] = (content_hash, string)
+
+        if max_workers > 1 and len(uncached_strings) >= PARALLEL_PARSE_MINIMUM_STRINGS:
+            with ProcessPoolExecutor(min(max_workers, len(uncached_strings))) as executor:
+                futures = {source: executor.submit(_parse_and_compact_yaml, source, string) for source, (_, string) in uncached_strings.items()}
+                # Every future is waited on before raising so that the first error is the same no matter which process finishes first.
+                results = {source: future.exception() or future.result() for source, future in futures.items()}
+
+            for source, result in results.items():
+                if isinstance(result, BaseException):
+                    raise result
+                yaml_dicts, compact_tokens = result
+                entries[source] = self._add_entry(uncached_strings[source][0], yaml_dicts, _expand_tokens(source, compact_tokens))
+        else:
+            for source, (content_hash, string) in uncached_strings.items():
+                entries[source] = self._get_or_parse_string(source, string)
+
+        return entries
+
     def scan_file(self, file_path: str) -> list[Token]:
         """Parse the YAML file and return the YAML tokens."""
         token_list = []
@@ -106,12 +156,40 @@ class YamlLFUCache:
     def _get_or_parse_string(self, content_source: str, content_string: str) -> CacheEntry:
         """Get the cached entry or parse the string and cache it."""
         content_hash = str(md5(content_string.encode()).hexdigest())
-        cache_entry = self._get_entry(content_hash)
+        cache_entry = self._get_cached_entry(content_hash, content_source)
 
         if not cache_entry:
-            yaml_dicts = parse_yaml(content_source, content_string)
-            yaml_tokens = scan_yaml(content_source, content_string)
-            cache_entry = CacheEntry(content_hash, yaml_dicts, yaml_tokens)
-            self._put_entry(cache_entry.hash, cache_entry)
+            yaml_dicts, yaml_tokens = parse_and_scan_yaml(content_source, content_string)
+            cache_entry = self._add_entry(content_hash, yaml_dicts, yaml_tokens)
 
         return cache_entry
+
+    def _get_cached_entry(self, content_hash: str, content_source: str) -> Optional[CacheEntry]:
+        """Get the entry from memory, or from the persistent tier if it isn't in memory."""
+        cache_entry = self._get_entry(content_hash)
+        persistent_entry = None
+
+        if not cache_entry and self.persistent_cache:
+            persistent_entry = self.persistent_cache.get(content_hash, content_source)
+
+        if persistent_entry:
+            yaml_dicts, yaml_tokens = persistent_entry
+            cache_entry = self._add_entry(content_hash, yaml_dicts, yaml_tokens, persist=False)
+
+        return cache_entry
+
+    def _add_entry(self, content_hash: str, yaml_dicts: list[dict], yaml_tokens: list[Token], persist: bool = True) -> CacheEntry:
+        """Cache newly parsed YAML structures and tokens."""
+        if persist and self.persistent_cache:
+            self.persistent_cache.put(content_hash, yaml_dicts, yaml_tokens)
+
+        # Cached structures are frozen because they're shared by every caller that parses the same content.
+        cache_entry = CacheEntry(content_hash, freeze(yaml_dicts), yaml_tokens)
+        self._put_entry(cache_entry.hash, cache_entry)
+        return cache_entry
+
+
+def _parse_and_compact_yaml(source: str, content: str) -> tuple[list[dict], list[tuple]]:
+    """Parse the YAML string in a worker process, compacting the tokens so they're cheap to send back."""
+    yaml_dicts, yaml_tokens = parse_and_scan_yaml(source, content)
+    return yaml_dicts, _compact_tokens(yaml_tokens)
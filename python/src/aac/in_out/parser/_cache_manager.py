@@ -1,5 +1,15 @@
 """This module manages a singleton instance of the YAML Parser Cache."""
+import logging
+from multiprocessing import parent_process
+from os import environ
+from typing import Optional
+
+from aac.in_out.constants import AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE, AAC_PERSISTENT_PARSE_CACHE_ENVIRONMENT_VARIABLE
 from aac.in_out.parser._cache import YamlLFUCache
+from aac.in_out.parser._persistent_cache import PersistentYamlCache
+from aac.in_out.paths import get_user_cache_directory
+
+PERSISTENT_PARSE_CACHE_DIRECTORY_NAME = "yaml"
 
 
 YAML_CACHE: YamlLFUCache = None
@@ -15,7 +25,7 @@ def get_cache() -> YamlLFUCache:
     global YAML_CACHE
 
     if not YAML_CACHE:
-        YAML_CACHE = YamlLFUCache()
+        YAML_CACHE = YamlLFUCache(persistent_cache=get_persistent_cache())
 
     return YAML_CACHE
 
@@ -23,4 +33,40 @@ def get_cache() -> YamlLFUCache:
 def reset_cache() -> None:
     """Resets the cache clearing all data."""
     global YAML_CACHE
-    YAML_CACHE = YamlLFUCache()
+    YAML_CACHE = YamlLFUCache(persistent_cache=get_persistent_cache())
+
+
+def get_persistent_cache() -> Optional[PersistentYamlCache]:
+    """
+    Return the on-disk YAML Parser Cache tier if it has been enabled.
+
+    The persistent tier is enabled by setting the `AAC_PERSISTENT_PARSE_CACHE` environment variable
+    to `1`, `true`, or `yes`.
+
+    Returns:
+        The persistent YAML Parser Cache, or None if it isn't enabled.
+    """
+    if environ.get(AAC_PERSISTENT_PARSE_CACHE_ENVIRONMENT_VARIABLE, "").lower() not in ["1", "true", "yes"]:
+        return None
+
+    return PersistentYamlCache(get_user_cache_directory(PERSISTENT_PARSE_CACHE_DIRECTORY_NAME))
+
+
+def get_parse_jobs() -> int:
+    """
+    Return the number of processes used to parse the files in an import graph.
+
+    Files are parsed in the current process unless more processes are requested with the `AAC_PARSE_JOBS`
+    environment variable. Worker processes, such as those of `check --jobs`, always parse in-process so that process
+    pools aren't nested.
+
+    Returns:
+        The maximum number of parsing processes.
+    """
+    jobs = environ.get(AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE, "")
+    if jobs and not (jobs.isdigit() and int(jobs) > 0):
+        logging.warning(f"Ignoring the invalid {AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE} value '{jobs}', it must be a positive integer.")
+    elif jobs and parent_process() is None:
+        return int(jobs)
+
+    return 1
@@ -0,0 +1,107 @@
+"""Provides immutable YAML structures so parsed content can be shared between the parser cache and its callers."""
+from typing import Any, NoReturn
+from yaml import Dumper, SafeDumper
+from yaml.representer import SafeRepresenter
+
+
+class FrozenDict(dict):
+    """An immutable dict used for cached YAML mappings.
+
+    Reads behave exactly like a dict, but any attempt to modify the mapping raises a TypeError. Use
+    `thaw` to get a mutable copy.
+
+    Since it can't change, the content digest of the mapping is memoized on it by `aac.context.fingerprint`.
+    """
+
+    __slots__ = ("digest",)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is immutable, use thaw() to get a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> "FrozenDict":
+        """Return the structure itself, since it can't change."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenDict":
+        """Return the structure itself, since neither it nor anything it contains can change."""
+        return self
+
+    def __reduce__(self) -> tuple:
+        """Pickle the mapping as a FrozenDict built from a plain copy of its items."""
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """An immutable list used for cached YAML sequences.
+
+    Reads behave exactly like a list, but any attempt to modify the sequence raises a TypeError. Use
+    `thaw` to get a mutable copy.
+
+    Since it can't change, the content digest of the sequence is memoized on it by `aac.context.fingerprint`.
+    """
+
+    __slots__ = ("digest",)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is immutable, use thaw() to get a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __copy__(self) -> "FrozenList":
+        """Return the structure itself, since it can't change."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenList":
+        """Return the structure itself, since neither it nor anything it contains can change."""
+        return self
+
+    def __reduce__(self) -> tuple:
+        """Pickle the sequence as a FrozenList built from a plain copy of its items."""
+        return FrozenList, (list(self),)
+
+
+def freeze(structure: Any) -> Any:
+    """
+    Return an immutable version of a YAML structure.
+
+    Args:
+        structure (Any): A YAML structure made of dicts, lists and scalar values.
+
+    Returns:
+        The structure with every dict replaced by a FrozenDict and every list replaced by a FrozenList. Structures
+        that are already frozen are returned as-is.
+    """
+    if isinstance(structure, (FrozenDict, FrozenList)):
+        return structure
+    if isinstance(structure, dict):
+        return FrozenDict({key: freeze(value) for key, value in structure.items()})
+    if isinstance(structure, list):
+        return FrozenList([freeze(item) for item in structure])
+    return structure
+
+
+def thaw(structure: Any) -> Any:
+    """
+    Return a mutable copy of a YAML structure.
+
+    Args:
+        structure (Any): A YAML structure, which may contain frozen dicts and lists.
+
+    Returns:
+        A copy of the structure made of plain dicts and lists that is safe to modify.
+    """
+    if isinstance(structure, dict):
+        return {key: thaw(value) for key, value in structure.items()}
+    if isinstance(structure, list):
+        return [thaw(item) for item in structure]
+    return structure
+
+
+# Frozen structures are dumped exactly like the dicts and lists they were created from.
+for _dumper in [Dumper, SafeDumper]:
+    _dumper.add_representer(FrozenDict, SafeRepresenter.represent_dict)
+    _dumper.add_representer(FrozenList, SafeRepresenter.represent_list)
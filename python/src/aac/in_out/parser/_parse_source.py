@@ -7,17 +7,21 @@ to find a certain type in a model by just looking for that key.
 """
 import logging
 
-from copy import deepcopy
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Sequence
 from os import path, linesep
-from yaml import Mark, Token, StreamStartToken, StreamEndToken, DocumentStartToken
+from yaml import Token, StreamStartToken, StreamEndToken, DocumentStartToken
 
 from aac.context.constants import DEFINITION_FIELD_NAME, ROOT_KEY_IMPORT
 from aac.context.definition import Definition
 from aac.context.lexeme import Lexeme
-from aac.context.source_location import SourceLocation
+from aac.context.lexeme_table import LexemeTable
 from aac.in_out.constants import DEFAULT_SOURCE_URI, YAML_DOCUMENT_EXTENSION, AAC_DOCUMENT_EXTENSION
 from aac.in_out.files.aac_file import AaCFile
-from aac.in_out.parser._cache_manager import get_cache
+from aac.in_out.parser._cache import CacheEntry
+from aac.in_out.parser._cache_manager import get_cache, get_parse_jobs
 from aac.in_out.paths import sanitize_filesystem_path
 
 
@@ -60,21 +64,54 @@ def _parse_file(arch_file: str) -> list[Definition]:
     """
     definitions_list = []
     parsed_files = set()
+    file_contents, cache_entries = _parse_import_graph(arch_file)
 
     def parse_file_contents(file: str):
         if file not in parsed_files:
-            file_content = _read_arch_file_content(file)
+            file_content = file_contents.get(file)
             parsed_files.add(file)
 
             if file_content:
-                parsed_definitions = _parse_str(file, file_content)
+                parsed_definitions = _create_definitions(file, file_content, cache_entries[file])
                 definitions_list.extend(parsed_definitions)
                 [parse_file_contents(imp_file) for imp_file in _get_files_to_import_from_definitions(file, parsed_definitions)]
 
+    # The files were parsed level by level, but the definitions are always returned in depth-first import order.
     parse_file_contents(arch_file)
     return definitions_list
 
 
+def _parse_import_graph(arch_file: str) -> tuple[dict[str, str], dict[str, CacheEntry]]:
+    """
+    Read and parse an Architecture-as-Code YAML file and every file it imports, directly or indirectly.
+
+    The import graph is walked one level at a time, and the files in each level are parsed in parallel.
+
+    Args:
+        arch_file (str): The Architecture-as-Code YAML file to be parsed.
+
+    Returns:
+        The content of each file in the import graph, and the parser cache entry for each file with content.
+    """
+    file_contents: dict[str, str] = {}
+    cache_entries: dict[str, CacheEntry] = {}
+    parse_jobs = get_parse_jobs()
+
+    files_to_parse = [arch_file]
+    while files_to_parse:
+        level_contents = {file: _read_arch_file_content(file) for file in files_to_parse}
+        file_contents.update(level_contents)
+        cache_entries.update(YAML_CACHE.parse_strings({file: content for file, content in level_contents.items() if content}, parse_jobs))
+
+        imported_files = {}
+        for file in files_to_parse:
+            if file in cache_entries:
+                imported_files.update(dict.fromkeys(_get_files_to_import(file, cache_entries[file].yaml_structures)))
+        files_to_parse = [file for file in imported_files if file not in file_contents]
+
+    return file_contents, cache_entries
+
+
 def _parse_str(source: str, model_content: str) -> list[Definition]:
     """
     Parse a string containing one or more YAML model definitions.
@@ -86,29 +123,53 @@ def _parse_str(source: str, model_content: str) -> list[Definition]:
     Returns:
         The AaC definitions that were built from the model contents.
     """
+    return _create_definitions(source, model_content, YAML_CACHE.parse_strings({source: model_content})[source])
 
-    def mark_to_source_location(start: Mark, end: Mark) -> SourceLocation:
-        return SourceLocation(start.line, start.column, start.index, end.column - start.column)
 
-    def get_lexemes_for_definition(value_tokens, content_start, content_end) -> list[Lexeme]:
-        definition_tokens = [token for token in value_tokens if is_token_between_locations(token, content_start, content_end)]
-        definition_lexemes = []
-        for token in definition_tokens:
-            location = mark_to_source_location(token.start_mark, token.end_mark)
-            definition_lexemes.append(Lexeme(location, source, token.value))
-        return definition_lexemes
+def _create_definitions(source: str, model_content: str, cache_entry: CacheEntry) -> list[Definition]:
+    """
+    Create the definitions for YAML model content that has already been parsed.
+
+    Args:
+        source:  The file the content came from (to help with better logging)
+        model_content:  The YAML that was parsed
+        cache_entry:  The parser cache entry for the content
+
+    Returns:
+        The AaC definitions that were built from the model contents.
+    """
+
+    def get_lexemes_for_definition(value_tokens, content_start, content_end) -> Sequence[Lexeme]:
+        # The value tokens are in document order, so only the tokens starting within the content's lines need to be checked.
+        first_token_index = bisect_left(value_token_start_lines, content_start)
+        last_token_index = bisect_right(value_token_start_lines, content_end)
+        definition_token_indices = [
+            index for index in range(first_token_index, last_token_index) if is_token_between_locations(value_tokens[index], content_start, content_end)
+        ]
+        if len(definition_token_indices) == last_token_index - first_token_index:
+            return lexeme_table.get_lexemes(range(first_token_index, last_token_index))
+        return lexeme_table.get_lexemes(array("i", definition_token_indices))
 
     def is_token_between_locations(token, inclusive_line_start: int, inclusive_line_end: int) -> list[Lexeme]:
         return token.start_mark.line >= inclusive_line_start and token.end_mark.line <= inclusive_line_end
 
-    yaml_tokens: list[Token] = YAML_CACHE.scan_string(model_content, source)
+    yaml_tokens: list[Token] = cache_entry.yaml_tokens
     value_tokens: list[Token] = [token for token in yaml_tokens if hasattr(token, "value")]
+    value_token_start_lines: list[int] = [token.start_mark.line for token in value_tokens]
+
+    # The lexemes of every definition in the content share a single table rather than each being an object.
+    lexeme_table = LexemeTable(source)
+    for token in value_tokens:
+        start, end = token.start_mark, token.end_mark
+        lexeme_table.add(start.line, start.column, start.index, end.column - start.column, token.value)
     doc_start_token: list[StreamStartToken] = [token for token in yaml_tokens if isinstance(token, StreamStartToken)]
     doc_end_token: list[StreamEndToken] = [token for token in yaml_tokens if isinstance(token, StreamEndToken)]
     doc_segment_tokens: list[DocumentStartToken] = [token for token in yaml_tokens if isinstance(token, DocumentStartToken)]
     doc_tokens = [*doc_start_token, *doc_segment_tokens, *doc_end_token]
 
-    yaml_dicts: list[dict] = deepcopy(YAML_CACHE.parse_string(model_content, source))
+    # The cached YAML structures are immutable, so they're shared with the definitions instead of being copied.
+    yaml_dicts: deque[dict] = deque(cache_entry.yaml_structures)
+    content_lines = model_content.splitlines()
 
     source_files: dict[str, AaCFile] = {}
     definitions: list[Definition] = []
@@ -119,7 +180,7 @@ def _parse_str(source: str, model_content: str) -> list[Definition]:
         content_start_line = start_doc_token.start_mark.line
         content_end_line = end_doc_token.end_mark.line + (1 if isinstance(end_doc_token, StreamEndToken) else 0)
 
-        yaml_text = linesep.join(model_content.splitlines()[content_start_line:content_end_line])
+        yaml_text = linesep.join(content_lines[content_start_line:content_end_line])
         yaml_text += linesep
 
         if yaml_text.strip():
@@ -131,7 +192,7 @@ def _parse_str(source: str, model_content: str) -> list[Definition]:
                     source_file = AaCFile(source, True, False)
                     source_files[source] = source_file
 
-                root_yaml = yaml_dicts.pop(0)
+                root_yaml = yaml_dicts.popleft()
                 root_type, *_ = root_yaml.keys()
                 definition_name = root_yaml.get(root_type, {}).get(DEFINITION_FIELD_NAME, "")
                 definition_package = root_yaml.get(root_type, {}).get("package", "")
@@ -219,13 +280,24 @@ def _get_files_to_import_from_definitions(source_file_path: str, definitions: li
     This function assumes the list of definitions contains some import definitions, and it returns
     the list of file paths to import adjusted with the location of the source in case of relative import paths.
     """
-    import_paths = set()
-
     import_definitions = get_definitions_by_root_key(ROOT_KEY_IMPORT, definitions)
-    for definition in import_definitions:
-        for import_path in definition.structure[ROOT_KEY_IMPORT]["files"] or []:
-            arch_file_dir = path.dirname(path.realpath(source_file_path))
-            parse_path = path.join(arch_file_dir, import_path.removeprefix(f".{path.sep}"))
-            import_paths.add(sanitize_filesystem_path(parse_path))
+    return _get_files_to_import(source_file_path, [definition.structure for definition in import_definitions])
+
+
+def _get_files_to_import(source_file_path: str, yaml_structures: list[dict]) -> list[str]:
+    """
+    Return the list of files imported by the import definitions among the parsed YAML structures.
+
+    The file paths are adjusted with the location of the source in case of relative import paths, and are returned
+    in the order they're imported.
+    """
+    import_paths = {}
+
+    for structure in yaml_structures:
+        if ROOT_KEY_IMPORT in structure:
+            for import_path in structure[ROOT_KEY_IMPORT]["files"] or []:
+                arch_file_dir = path.dirname(path.realpath(source_file_path))
+                parse_path = path.join(arch_file_dir, import_path.removeprefix(f".{path.sep}"))
+                import_paths[sanitize_filesystem_path(parse_path)] = None
 
     return list(import_paths)
@@ -0,0 +1,172 @@
+"""Provides an on-disk tier for the YAML parser cache so parse results survive across AaC invocations."""
+import logging
+import pickle
+from attr import attrib, attrs, validators
+from os import listdir, makedirs, path, remove, replace, stat, utime
+from tempfile import mkstemp
+from typing import Optional
+from yaml import Mark, Token, tokens as yaml_tokens
+
+PERSISTENT_CACHE_FORMAT_VERSION = 1
+PERSISTENT_CACHE_FILE_EXTENSION = ".pickle"
+DEFAULT_PERSISTENT_CACHE_SIZE = 256 * 1024 * 1024
+
+
+@attrs
+class PersistentYamlCache:
+    """A size-limited, on-disk YAML-Parsing cache keyed by the content hash of the parsed string.
+
+    Entries are written to a temporary file and atomically moved into place, so concurrent AaC processes
+    can safely share a cache directory. When the cache exceeds its size limit, the least recently used
+    entries are evicted.
+
+    The cache directory is only listed when the cache is first written to and when the size of the entries, as
+    tracked in memory since the last listing, exceeds the size limit. Entries written by other processes are counted
+    at the next listing, so a shared cache directory may briefly exceed its limit.
+
+    Attributes:
+        directory (str): The directory in which cache entries are stored.
+        max_size (int): The maximum number of bytes the cache entries may occupy on disk.
+    """
+
+    directory: str = attrib(validator=validators.instance_of(str))
+    max_size: int = attrib(default=DEFAULT_PERSISTENT_CACHE_SIZE, validator=validators.instance_of(int))
+    _total_size: Optional[int] = attrib(default=None, init=False, repr=False)
+
+    def get(self, content_hash: str, source: str) -> Optional[tuple[list[dict], list[Token]]]:
+        """
+        Return the cached YAML structures and tokens for the content hash, if present.
+
+        Args:
+            content_hash (str): The hash of the parsed content.
+            source (str): The source of the content, used to rebuild the token marks.
+
+        Returns:
+            A tuple of the YAML structures and the YAML tokens, or None if the entry isn't cached.
+        """
+        entry_path = self._get_entry_path(content_hash)
+        if not path.exists(entry_path):
+            return None
+
+        try:
+            with open(entry_path, "rb") as entry_file:
+                format_version, yaml_structures, compact_tokens = pickle.load(entry_file)
+            # Touch the entry so that eviction is based on the most recent use.
+            utime(entry_path)
+        except Exception as error:
+            logging.warning(f"Discarding unreadable persistent YAML cache entry '{entry_path}': {error}")
+            self._remove_entry(entry_path)
+            return None
+
+        if format_version != PERSISTENT_CACHE_FORMAT_VERSION:
+            self._remove_entry(entry_path)
+            return None
+
+        return yaml_structures, _expand_tokens(source, compact_tokens)
+
+    def put(self, content_hash: str, yaml_structures: list[dict], tokens: list[Token]) -> None:
+        """
+        Store the YAML structures and tokens for the content hash.
+
+        Args:
+            content_hash (str): The hash of the parsed content.
+            yaml_structures (list[dict]): The parsed YAML structures.
+            tokens (list[Token]): The scanned YAML tokens.
+        """
+        temp_path = None
+        try:
+            makedirs(self.directory, exist_ok=True)
+            # Write to a unique temporary file and then atomically move it into place so that
+            # concurrent readers never observe a partially written entry.
+            file_descriptor, temp_path = mkstemp(dir=self.directory, suffix=".tmp")
+            with open(file_descriptor, "wb") as entry_file:
+                pickle.dump((PERSISTENT_CACHE_FORMAT_VERSION, yaml_structures, _compact_tokens(tokens)), entry_file, pickle.HIGHEST_PROTOCOL)
+                entry_size = entry_file.tell()
+            replace(temp_path, self._get_entry_path(content_hash))
+        except Exception as error:
+            # The persistent tier is only an optimization, so failing to write it must not fail the parse.
+            logging.warning(f"Failed to write persistent YAML cache entry for '{content_hash}': {error}")
+            if temp_path:
+                self._remove_entry(temp_path)
+            return
+
+        if self._total_size is None:
+            self._evict_entries()
+        else:
+            # An entry that replaced an identical one is counted twice, which only brings the next listing forward.
+            self._total_size += entry_size
+            if self._total_size > self.max_size:
+                self._evict_entries()
+
+    def clear(self) -> None:
+        """Remove all entries from the persistent cache."""
+        for entry_path, *_ in self._get_entries():
+            self._remove_entry(entry_path)
+        self._total_size = 0
+
+    # Private Methods #
+
+    def _get_entry_path(self, content_hash: str) -> str:
+        return path.join(self.directory, f"{content_hash}{PERSISTENT_CACHE_FILE_EXTENSION}")
+
+    def _get_entries(self) -> list[tuple[str, float, int]]:
+        """Return the (path, last used time, size) of each entry in the cache."""
+        entries = []
+        if not path.isdir(self.directory):
+            return entries
+
+        for file_name in listdir(self.directory):
+            if file_name.endswith(PERSISTENT_CACHE_FILE_EXTENSION):
+                entry_path = path.join(self.directory, file_name)
+                try:
+                    entry_stat = stat(entry_path)
+                except FileNotFoundError:
+                    # Another process evicted the entry while we were looking at it.
+                    continue
+                entries.append((entry_path, entry_stat.st_mtime, entry_stat.st_size))
+
+        return entries
+
+    def _evict_entries(self) -> None:
+        """List the cache entries, evicting the least recently used until the cache fits its size limit."""
+        entries = sorted(self._get_entries(), key=lambda entry: entry[1])
+        total_size = sum(size for *_, size in entries)
+        eviction_count = 0
+        while eviction_count < len(entries) and total_size > self.max_size:
+            entry_path, _, size = entries[eviction_count]
+            self._remove_entry(entry_path)
+            total_size -= size
+            eviction_count += 1
+            logging.debug(f"The persistent YAML cache has hit its limit, evicted '{entry_path}'. Maximum size: {self.max_size}")
+        self._total_size = total_size
+
+    def _remove_entry(self, entry_path: str) -> None:
+        try:
+            remove(entry_path)
+        except OSError:
+            pass
+
+
+def _compact_tokens(tokens: list[Token]) -> list[tuple]:
+    """Reduce tokens to the document boundary and value tokens, dropping the content buffers held by their marks."""
+    compact_tokens = []
+    for token in tokens:
+        if hasattr(token, "value") or isinstance(token, (yaml_tokens.StreamStartToken, yaml_tokens.StreamEndToken, yaml_tokens.DocumentStartToken)):
+            start, end = token.start_mark, token.end_mark
+            compact_tokens.append(
+                (type(token).__name__, getattr(token, "value", None), start.line, start.column, start.index, end.line, end.column, end.index)
+            )
+    return compact_tokens
+
+
+def _expand_tokens(source: str, compact_tokens: list[tuple]) -> list[Token]:
+    """Rebuild YAML tokens from their compact form."""
+    tokens = []
+    for token_type, value, start_line, start_column, start_index, end_line, end_column, end_index in compact_tokens:
+        token = Token.__new__(getattr(yaml_tokens, token_type))
+        if value is not None:
+            token.value = value
+        token.start_mark = Mark(source, start_index, start_line, start_column, None, None)
+        token.end_mark = Mark(source, end_index, end_line, end_column, None, None)
+        tokens.append(token)
+    return tokens
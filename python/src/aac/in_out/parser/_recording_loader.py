@@ -0,0 +1,115 @@
+"""YAML loaders that record the value and document boundary tokens consumed while loading."""
+from typing import Optional, Union
+from yaml import Mark, SafeLoader, Token, __with_libyaml__
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import AliasEvent, DocumentStartEvent, Event, ScalarEvent, StreamEndEvent, StreamStartEvent
+from yaml.resolver import Resolver
+from yaml.tokens import AliasToken, DocumentStartToken, ScalarToken, StreamEndToken, StreamStartToken
+
+if __with_libyaml__:
+    from yaml.cyaml import CParser
+
+# The characters that separate the anchor and tag of a node from each other and from the node's value.
+_PROPERTY_SEPARATORS = " \t\r\n"
+
+
+def get_recording_loader(content: str) -> Union["_RecordingLoader", "_RecordingCLoader"]:
+    """
+    Return a loader for the content that records its tokens, using libyaml when PyYAML is built with it.
+
+    Args:
+        content (str): The YAML content to load.
+
+    Returns:
+        A loader whose `get_recorded_tokens` returns the tokens that `scan_yaml` would have returned with a value, or
+        that start or end a document.
+    """
+    return _RecordingCLoader(content) if __with_libyaml__ else _RecordingLoader(content)
+
+
+class _RecordingLoader(SafeLoader):
+    """A SafeLoader that records the value and document boundary tokens consumed by the parser."""
+
+    def __init__(self, stream: str):
+        super().__init__(stream)
+        self.recorded_tokens: list[Token] = []
+
+    def get_token(self) -> Optional[Token]:
+        token = super().get_token()
+        if hasattr(token, "value") or isinstance(token, (StreamStartToken, DocumentStartToken, StreamEndToken)):
+            self.recorded_tokens.append(token)
+        return token
+
+    def get_recorded_tokens(self) -> list[Token]:
+        return self.recorded_tokens
+
+
+if __with_libyaml__:
+
+    class _RecordingCLoader(Composer, CParser, SafeConstructor, Resolver):
+        """A libyaml loader that records tokens rebuilt from the parser events.
+
+        The Python Composer comes first so that the nodes are composed from events pulled through `get_event`,
+        where they can be recorded, rather than by libyaml's own composer. Anchor and tag tokens have no events
+        of their own, so they aren't recorded.
+        """
+
+        def __init__(self, stream: str):
+            CParser.__init__(self, stream)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+            Composer.__init__(self)
+            self.content = stream
+            self.recorded_tokens: list[Token] = []
+
+        def get_event(self) -> Event:
+            event = CParser.get_event(self)
+            token = self._get_scalar_token(event) if isinstance(event, ScalarEvent) else _get_event_token(event)
+            if token:
+                self.recorded_tokens.append(token)
+            return event
+
+        def get_recorded_tokens(self) -> list[Token]:
+            # The composer may stop at the end of the stream without consuming the stream end event.
+            if self.check_event(StreamEndEvent):
+                self.get_event()
+            return self.recorded_tokens
+
+        def _get_scalar_token(self, event: ScalarEvent) -> Optional[ScalarToken]:
+            start_mark, end_mark = event.start_mark, event.end_mark
+            # Empty scalars are implied by the parser and have no token, except for quoted empty strings.
+            if start_mark.index == end_mark.index:
+                return None
+            if event.anchor is not None or event.tag is not None:
+                # The event starts at the node's anchor or tag, but the scanned token starts at the value.
+                start_mark = _skip_node_properties(self.content, start_mark)
+            return ScalarToken(event.value, event.implicit[0], start_mark, end_mark, event.style)
+
+
+def _get_event_token(event: Event) -> Optional[Token]:
+    """Return the token that starts the non-scalar event, if it's one the loader records."""
+    start_mark, end_mark = event.start_mark, event.end_mark
+    if isinstance(event, AliasEvent):
+        return AliasToken(event.anchor, start_mark, end_mark)
+    if isinstance(event, DocumentStartEvent):
+        # Implicit documents have no document start token.
+        return DocumentStartToken(start_mark, end_mark) if event.explicit else None
+    if isinstance(event, StreamStartEvent):
+        return StreamStartToken(start_mark, end_mark, event.encoding)
+    if isinstance(event, StreamEndEvent):
+        return StreamEndToken(start_mark, end_mark)
+    return None
+
+
+def _skip_node_properties(content: str, mark: Mark) -> Mark:
+    """Return the mark of the first character after the anchor and tag that start at the mark, and the space after them."""
+    index, line, column = mark.index, mark.line, mark.column
+    while index < len(content) and content[index] in "&!#":
+        # Anchors and tags can't contain spaces, and a comment runs to the end of its line.
+        end_characters = "\n" if content[index] == "#" else _PROPERTY_SEPARATORS
+        while index < len(content) and content[index] not in end_characters:
+            index, column = index + 1, column + 1
+        while index < len(content) and content[index] in _PROPERTY_SEPARATORS:
+            index, line, column = (index + 1, line + 1, 0) if content[index] == "\n" else (index + 1, line, column + 1)
+    return Mark(mark.name, index, line, column, mark.buffer, mark.pointer)
@@ -7,6 +7,7 @@ from yaml.parser import ParserError as YAMLParserError
 from yaml.scanner import ScannerError as YAMLScannerError
 
 from aac.in_out.parser._parser_error import ParserError
+from aac.in_out.parser._recording_loader import get_recording_loader
 
 
 def scan_yaml(source: str, content: str) -> list[Token]:
@@ -75,6 +76,57 @@ def parse_yaml(source: str, content: str) -> list[dict]:
         return models
 
 
+def parse_and_scan_yaml(source: str, content: str) -> tuple[list[dict], list[Token]]:
+    """
+    Parse content as a YAML string and capture its value and document boundary tokens in the same pass.
+
+    This is equivalent to calling `parse_yaml` and keeping the tokens from `scan_yaml` that have a value or that
+    start or end a document, but the content is only tokenized once. When PyYAML is built with libyaml, the
+    content is scanned and parsed by libyaml and the tokens are rebuilt from the parser events.
+
+    Be sure to use the YAML Parser Cache instead of this function.
+
+    Args:
+        source (str): The source of the YAML content. Used to provide better error messages.
+        content (str): The YAML content to be parsed.
+
+    Returns:
+        A tuple of the parsed YAML content and the value and document boundary tokens.
+
+    Raises:
+        If the YAML is invalid, a ParserError is raised.
+        If the model is not a dictionary, a ParserError is raised.
+        If the model does not have (at least) a "name" field, a ParserError is raised.
+    """
+    try:
+        loader = get_recording_loader(content)
+        try:
+            models = []
+            while loader.check_data():
+                model = loader.get_data()
+                if model:
+                    models.append(model)
+            tokens = loader.get_recorded_tokens()
+        finally:
+            loader.dispose()
+        _error_if_not_yaml(source, content, models)
+        _error_if_not_complete(source, content, models)
+    except YAMLParserError as error:
+        error_messages = _yaml_error_messages("parser", error, content)
+        _log_yaml_error(source, error_messages)
+        raise ParserError(source, error_messages, error)
+    except YAMLScannerError as error:
+        error_messages = _yaml_error_messages("scanner", error, content)
+        _log_yaml_error(source, error_messages)
+        raise ParserError(source, error_messages, error)
+    except Exception as error:
+        logging.error(f"Error: {error}. Encountered in: {source}")
+        logging.error(f"Content of error: {content}")
+        raise ParserError(source, [f"Encountered the following error: {error}"]) from None
+    else:
+        return models, tokens
+
+
 def _error_if_not_yaml(source, content, models):
     """Raise a ParserError if the model is not a YAML model we can parse."""
 
@@ -3,8 +3,11 @@
 import logging
 import os
 import unicodedata
+from platformdirs import user_cache_dir
 from urllib.parse import unquote
 
+from aac.in_out.constants import AAC_CACHE_APPLICATION_NAME, AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE
+
 
 def sanitize_filesystem_path(file_path: str) -> str:
     r"""
@@ -69,3 +72,20 @@ def is_same_file(path1: str, path2: str) -> bool:
         Return True if both paths refer to the same file; False, otherwise.
     """
     return os.path.normcase(path1) == os.path.normcase(path2)
+
+
+def get_user_cache_directory(*sub_directories: str) -> str:
+    """
+    Return the directory AaC uses to persist cached data between invocations.
+
+    The location defaults to the platform-specific user cache directory, but it can be overridden by
+    setting the `AAC_CACHE_DIR` environment variable.
+
+    Args:
+        sub_directories (str): Optional sub-directory names to join to the cache directory.
+
+    Returns:
+        A sanitized, absolute path to the requested cache directory. The directory is not created.
+    """
+    cache_directory = os.environ.get(AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE) or user_cache_dir(AAC_CACHE_APPLICATION_NAME)
+    return sanitize_filesystem_path(os.path.join(cache_directory, *sub_directories))
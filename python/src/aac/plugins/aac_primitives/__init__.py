@@ -8,7 +8,7 @@ from aac.execute.aac_execution_result import ExecutionResult
 from aac.execute import hookimpl
 from aac.context.language_context import LanguageContext
 from aac.in_out.files.aac_file import AaCFile
-from aac.execute.plugin_runner import PluginRunner
+from aac.execute.plugin_runner import PluginRunner, PrimitiveConstraintValue
 from aac.context.source_location import SourceLocation
 
 
@@ -24,6 +24,13 @@ from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_int
 from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_number
 from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_dataref
 from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_typeref
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_bool_batch
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_date_batch
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_directory_batch
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_file_batch
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_string_batch
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_int_batch
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_number_batch
 
 
 aac_primitive_constraints_aac_file_name = "aac_primitive_constraints.aac"
@@ -137,6 +144,62 @@ def run_check_typeref(
     return check_typeref(value, type_declaration, source, location)
 
 
+def run_check_bool_batch(
+    values: list[PrimitiveConstraintValue],
+) -> list[tuple[int, ExecutionResult]]:
+    """Verify that a batch of boolean values are True or False, returning the failures."""
+
+    return check_bool_batch(values)
+
+
+def run_check_date_batch(
+    values: list[PrimitiveConstraintValue],
+) -> list[tuple[int, ExecutionResult]]:
+    """Verify that a batch of date values are interpretable as dates, returning the failures."""
+
+    return check_date_batch(values)
+
+
+def run_check_directory_batch(
+    values: list[PrimitiveConstraintValue],
+) -> list[tuple[int, ExecutionResult]]:
+    """Verify that a batch of directory values are interpretable as directories, returning the failures."""
+
+    return check_directory_batch(values)
+
+
+def run_check_file_batch(
+    values: list[PrimitiveConstraintValue],
+) -> list[tuple[int, ExecutionResult]]:
+    """Verify that a batch of file values are interpretable as files, returning the failures."""
+
+    return check_file_batch(values)
+
+
+def run_check_string_batch(
+    values: list[PrimitiveConstraintValue],
+) -> list[tuple[int, ExecutionResult]]:
+    """Verify that a batch of string values are interpretable as strings, returning the failures."""
+
+    return check_string_batch(values)
+
+
+def run_check_int_batch(
+    values: list[PrimitiveConstraintValue],
+) -> list[tuple[int, ExecutionResult]]:
+    """Verify that a batch of integer values are interpretable as integers, returning the failures."""
+
+    return check_int_batch(values)
+
+
+def run_check_number_batch(
+    values: list[PrimitiveConstraintValue],
+) -> list[tuple[int, ExecutionResult]]:
+    """Verify that a batch of number values are interpretable as numbers, returning the failures."""
+
+    return check_number_batch(values)
+
+
 @hookimpl
 def register_plugin() -> None:
     """
@@ -174,4 +237,12 @@ def register_plugin() -> None:
     plugin_runner.add_constraint_callback("Check dataref", run_check_dataref)
     plugin_runner.add_constraint_callback("Check typeref", run_check_typeref)
 
+    plugin_runner.add_batch_constraint_callback("Check bool", run_check_bool_batch)
+    plugin_runner.add_batch_constraint_callback("Check date", run_check_date_batch)
+    plugin_runner.add_batch_constraint_callback("Check directory", run_check_directory_batch)
+    plugin_runner.add_batch_constraint_callback("Check file", run_check_file_batch)
+    plugin_runner.add_batch_constraint_callback("Check string", run_check_string_batch)
+    plugin_runner.add_batch_constraint_callback("Check int", run_check_int_batch)
+    plugin_runner.add_batch_constraint_callback("Check number", run_check_number_batch)
+
     active_context.register_plugin_runner(plugin_runner)
@@ -12,13 +12,19 @@ from aac.in_out.files.aac_file import AaCFile
 from aac.context.source_location import SourceLocation
 from aac.context.language_context import LanguageContext
 from aac.context.language_error import LanguageError
+from aac.execute.plugin_runner import PrimitiveConstraintValue
 
 from os import linesep
 from datetime import datetime
+from typing import Any, Callable
+import re
 
 
 plugin_name = "AaC Primitive Constraints"
 
+# File paths made only of these characters pass the Check file constraint, so they don't need to be split into entries.
+VALID_FILE_PATH_PATTERN = re.compile(r"[A-Za-z0-9\-_./\\]*")
+
 
 def check_bool(
     value: str, type_declaration: str, source: AaCFile, location: SourceLocation
@@ -387,8 +393,9 @@ def check_dataref(
         messages.append(error_msg)
 
     context: LanguageContext = LanguageContext()
-    found_values = context.get_values_by_field_chain(dataref_target)
-    if clean_value not in found_values:
+    if clean_value not in context.get_value_set_by_field_chain(dataref_target):
+        # the failure lists the values found in source order, so only look them up when the value isn't found
+        found_values = context.get_values_by_field_chain(dataref_target)
         status = ExecutionStatus.CONSTRAINT_FAILURE
         error_msg = ExecutionMessage(
             message=f"Dataref constraint failed for value '{clean_value}': '{clean_value}' not found in '{dataref_target}' values '{found_values}'",
@@ -472,3 +479,74 @@ def check_typeref(
             messages.append(error_msg)
 
     return ExecutionResult(plugin_name, "Check typeref", status, messages)
+
+
+def _check_batch(
+    values: list[PrimitiveConstraintValue], is_valid: Callable[[Any], bool], check: Callable[..., ExecutionResult]
+) -> list[tuple[int, ExecutionResult]]:
+    """
+    Run a constraint on a batch of values, only building results for the values that fail.
+
+    Args:
+        values (list[PrimitiveConstraintValue]): The values being checked.
+        is_valid (Callable[[Any], bool]): A quick test that's only True for values that pass the constraint.
+        check (Callable[..., ExecutionResult]): The constraint's business logic, which is run on the other values.
+
+    Returns:
+        list[tuple[int, ExecutionResult]]: The index and result of each value that failed the constraint, in order.
+    """
+    failures = []
+    for index, value in enumerate(values):
+        if is_valid(value.value):
+            continue
+        result = check(value.value, value.type_declaration, value.source, value.location)
+        if not result.is_success():
+            failures.append((index, result))
+    return failures
+
+
+def _is_valid_date(value: Any) -> bool:
+    try:
+        datetime.fromisoformat(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_valid_file(value: Any) -> bool:
+    return isinstance(value, str) and VALID_FILE_PATH_PATTERN.fullmatch(value) is not None
+
+
+def check_bool_batch(values: list[PrimitiveConstraintValue]) -> list[tuple[int, ExecutionResult]]:
+    """Run the Check bool constraint on a batch of values, returning the index and result of each failure."""
+    return _check_batch(values, lambda value: isinstance(value, bool), check_bool)
+
+
+def check_date_batch(values: list[PrimitiveConstraintValue]) -> list[tuple[int, ExecutionResult]]:
+    """Run the Check date constraint on a batch of values, returning the index and result of each failure."""
+    return _check_batch(values, _is_valid_date, check_date)
+
+
+def check_directory_batch(values: list[PrimitiveConstraintValue]) -> list[tuple[int, ExecutionResult]]:
+    """Run the Check directory constraint on a batch of values, returning the index and result of each failure."""
+    return _check_batch(values, _is_valid_file, check_directory)
+
+
+def check_file_batch(values: list[PrimitiveConstraintValue]) -> list[tuple[int, ExecutionResult]]:
+    """Run the Check file constraint on a batch of values, returning the index and result of each failure."""
+    return _check_batch(values, _is_valid_file, check_file)
+
+
+def check_string_batch(values: list[PrimitiveConstraintValue]) -> list[tuple[int, ExecutionResult]]:
+    """Run the Check string constraint on a batch of values, returning the index and result of each failure."""
+    return _check_batch(values, lambda value: isinstance(value, str), check_string)
+
+
+def check_int_batch(values: list[PrimitiveConstraintValue]) -> list[tuple[int, ExecutionResult]]:
+    """Run the Check int constraint on a batch of values, returning the index and result of each failure."""
+    return _check_batch(values, lambda value: isinstance(value, int), check_int)
+
+
+def check_number_batch(values: list[PrimitiveConstraintValue]) -> list[tuple[int, ExecutionResult]]:
+    """Run the Check number constraint on a batch of values, returning the index and result of each failure."""
+    return _check_batch(values, lambda value: isinstance(value, (int, float)), check_number)
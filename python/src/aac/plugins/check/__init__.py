@@ -18,12 +18,12 @@ from aac.plugins.check.check_aac_impl import plugin_name, check
 checkaac_aac_file_name = "check_aac.aac"
 
 
-def run_check(aac_file, fail_on_warn, verbose) -> ExecutionResult:
+def run_check(aac_file, fail_on_warn, verbose, jobs, incremental) -> ExecutionResult:
     """Perform AaC file quality checks using defined constraints in the AaC models."""
 
     result = ExecutionResult(plugin_name, "check", ExecutionStatus.SUCCESS, [])
 
-    check_result = check(aac_file, fail_on_warn, verbose)
+    check_result = check(aac_file, fail_on_warn, verbose, jobs, incremental)
     if not check_result.is_success():
         return check_result
     else:
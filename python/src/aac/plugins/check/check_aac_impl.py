@@ -2,9 +2,34 @@
 # NOTE: It is safe to edit this file.
 # This file is only initially generated by aac gen-plugin, and it won't be overwritten if the file already exists.
 
-from typing import Callable, Any
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from operator import itemgetter
+from multiprocessing import get_all_start_methods, get_context
+from os import cpu_count
+from attr import Factory, attrib, attrs, validators
+from typing import Callable, Any, Optional
 from aac.context.language_context import LanguageContext
 from aac.context.definition import Definition
+from aac.context.lexeme_table import find_first_lexeme
+from aac.execute.plugin_runner import PrimitiveConstraintValue
+from aac.plugins.check.check_state import (
+    DEPENDENCY_DATAREF,
+    DEPENDENCY_FILE,
+    DEPENDENCY_NAME,
+    DEPENDENCY_ROOT,
+    DEPENDENCY_TYPE,
+    CheckState,
+    DefinitionCheckState,
+    DependencyFingerprints,
+    get_absolute_results,
+    get_definition_key,
+    get_environment_hash,
+    get_relative_results,
+    load_check_state,
+    save_check_state,
+)
 from aac.execute.aac_execution_result import (
     ExecutionResult,
     ExecutionStatus,
@@ -12,73 +37,233 @@ from aac.execute.aac_execution_result import (
     MessageLevel,
 )
 from aac.context.language_error import LanguageError
+from aac.in_out.parser._parse_source import _get_files_to_import
 from aac.in_out.parser._parser_error import ParserError
 
 plugin_name = "Check AaC"
+# Definitions are checked in more chunks than processes so a few expensive definitions don't leave the other processes idle.
+CHECK_CHUNKS_PER_JOB = 4
+
+
+@attrs(slots=True)
+class ConstraintCall:
+    """A constraint assignment with its resolved callback.
+
+    Attributes:
+        name (str): The name of the assigned constraint.
+        arguments (Any): The arguments of the constraint assignment.
+        callback (Callable): The function that runs the constraint.
+        batch_callback (Optional[Callable]): The function that runs a primitive constraint on a batch of values, if its plugin provides one.
+    """
+
+    name: str = attrib(validator=validators.instance_of(str))
+    arguments: Any = attrib()
+    callback: Callable = attrib()
+    batch_callback: Optional[Callable] = attrib(default=None)
+
+
+@attrs(slots=True)
+class PrimitiveConstraintBatch:
+    """The values queued for a batched primitive constraint, which are checked in one call once every definition has been walked.
+
+    Attributes:
+        batch_callback (Callable): The function that runs the primitive constraint on the batch of values.
+        values (list[PrimitiveConstraintValue]): The queued values, in the order they were found.
+        result_lists (list[list[ExecutionResult]]): The constraint results that the failure of each value is added to.
+    """
+
+    batch_callback: Callable = attrib()
+    values: list[PrimitiveConstraintValue] = attrib(default=Factory(list), init=False)
+    result_lists: list[list[ExecutionResult]] = attrib(default=Factory(list), init=False)
+
+    def add(self, value: PrimitiveConstraintValue, results: list[ExecutionResult]) -> None:
+        """Queue a value, whose failure will be added to the given constraint results."""
+        self.values.append(value)
+        self.result_lists.append(results)
+
+    def run(self) -> None:
+        """Check the queued values in one call, adding each failure to the constraint results it was queued with."""
+        for index, result in sorted(self.batch_callback(self.values), key=itemgetter(0)):
+            self.result_lists[index].append(result)
+
+
+@attrs(slots=True)
+class FieldCheckPlan:
+    """The metadata needed to check a schema field, resolved from its type declaration.
+
+    Attributes:
+        field (Any): The field being checked.
+        is_list (bool): True if the field is declared as a list.
+        type_name (str): The name of the field type, without the list brackets or parameters.
+        primitive_declaration (str): The declaration passed to primitive constraints, which is the field type without the list brackets.
+        defining_definitions (list[Definition]): The definitions whose name matches the field type, which should be exactly one.
+        is_primitive (bool): True if the field type is uniquely defined by a primitive.
+        primitive_constraints (Optional[list[ConstraintCall]]): The constraints of a primitive field type, resolved when first needed.
+    """
+
+    field: Any = attrib()
+    is_list: bool = attrib(validator=validators.instance_of(bool))
+    type_name: str = attrib(validator=validators.instance_of(str))
+    primitive_declaration: str = attrib(validator=validators.instance_of(str))
+    defining_definitions: list[Definition] = attrib(validator=validators.instance_of(list))
+    is_primitive: bool = attrib(init=False)
+    primitive_constraints: Optional[list[ConstraintCall]] = attrib(default=None, init=False)
+
+    @is_primitive.default
+    def _is_primitive(self) -> bool:
+        return len(self.defining_definitions) == 1 and self.defining_definitions[0].get_root_key() == "primitive"
+
+
+@attrs(slots=True)
+class SchemaCheckPlan:
+    """The constraints and fields to check for each value of a schema.
+
+    Attributes:
+        schema (Any): The schema the plan was compiled for.
+        schema_constraints (list[ConstraintCall]): The universal constraints followed by the constraints assigned to the schema.
+        fields (list[FieldCheckPlan]): The plan for each of the schema's fields.
+    """
+
+    schema: Any = attrib()
+    schema_constraints: list[ConstraintCall] = attrib(validator=validators.instance_of(list))
+    fields: list[FieldCheckPlan] = attrib(validator=validators.instance_of(list))
+
+
+@attrs
+class CheckPlans:
+    """Compiles, and keeps for the rest of the check, the plan for each schema that values are checked against.
+
+    Attributes:
+        all_constraints_by_name (dict[str, Callable]): A dictionary of all constraint names and function calls.
+        all_batch_constraints_by_name (dict[str, Callable]): A dictionary of the primitive constraint names and batched function calls.
+        schema_plans (dict[int, Optional[SchemaCheckPlan]]): The compiled plans by the id of their schema, or None for objects that aren't schemas.
+        universal_constraints (Optional[list[ConstraintCall]]): The universal schema constraints, resolved when the first plan is compiled.
+        pending_batches (Optional[dict[str, PrimitiveConstraintBatch]]): The values queued for each batched primitive
+            constraint while check_definitions walks the definitions, or None if primitive constraints run one value at a time.
+    """
+
+    all_constraints_by_name: dict[str, Callable] = attrib(validator=validators.instance_of(dict))
+    all_batch_constraints_by_name: dict[str, Callable] = attrib(
+        default=Factory(lambda: _collect_all_batch_constraints_by_name()), validator=validators.instance_of(dict)
+    )
+    schema_plans: dict[int, Optional[SchemaCheckPlan]] = attrib(default=Factory(dict), init=False)
+    universal_constraints: Optional[list[ConstraintCall]] = attrib(default=None, init=False)
+    pending_batches: Optional[dict[str, PrimitiveConstraintBatch]] = attrib(default=None, init=False)
+
+    def get_schema_plan(self, check_against: Any) -> Optional[SchemaCheckPlan]:
+        """
+        Return the check plan for a schema, compiling it the first time the schema is checked against.
+
+        Args:
+            check_against (Any): The schema we are comparing values against.
+
+        Returns:
+            The schema's check plan, or None if check_against isn't a schema.
+        """
+        key = id(check_against)
+        if key not in self.schema_plans:
+            self.schema_plans[key] = self._compile_schema_plan(check_against)
+        return self.schema_plans[key]
+
+    def get_primitive_constraints(self, field_plan: FieldCheckPlan) -> list[ConstraintCall]:
+        """Return the constraints of a primitive field, resolving them the first time a value of the field is checked."""
+        if field_plan.primitive_constraints is None:
+            defining_primitive = field_plan.defining_definitions[0].instance
+            field_plan.primitive_constraints = [
+                self._get_constraint_call(assignment, self.all_batch_constraints_by_name.get(assignment.name)) for assignment in defining_primitive.constraints
+            ]
+        return field_plan.primitive_constraints
+
+    def _compile_schema_plan(self, check_against: Any) -> Optional[SchemaCheckPlan]:
+        context = LanguageContext()
+        # make sure we've got a schema
+        if not context.is_aac_instance(check_against, "aac.lang.Schema"):
+            return None
+
+        if self.universal_constraints is None:
+            self.universal_constraints = [self._get_constraint_call(assignment) for assignment in _collect_universal_schema_constraints()]
+        schema_constraints = self.universal_constraints + [self._get_constraint_call(assignment) for assignment in check_against.constraints or []]
+
+        fields = []
+        for field in check_against.fields:
+            # get the name of the schema that defines the field, special handling for arrays and references
+            type_name = field.type
+            is_list = False
+            # if type name ends with "[]", remove the brackets and set is_list to True
+            if field.type.endswith("[]"):
+                type_name = field.type[: -2]
+                is_list = True
+            # if type name has parameters in parens, remove them
+            if type_name.find("(") > -1:
+                type_name = type_name[: type_name.find("(")]
+
+            fields.append(FieldCheckPlan(field, is_list, type_name, field.type[: -2] if is_list else field.type, context.get_definitions_by_name(type_name)))
+
+        return SchemaCheckPlan(check_against, schema_constraints, fields)
+
+    def _get_constraint_call(self, constraint_assignment: Any, batch_callback: Optional[Callable] = None) -> ConstraintCall:
+        return ConstraintCall(constraint_assignment.name, constraint_assignment.arguments, self.all_constraints_by_name[constraint_assignment.name], batch_callback)
 
 
 # we'll need to recurse our way through the schema to check all the constraints
 # so we'll create a couple functions to help us navigate the way
 def check_primitive_constraint(
-    field: Any,
+    field_plan: FieldCheckPlan,
     source_definition: Definition,
     value_to_check: Any,
-    primitive_declaration: str,
-    defining_primitive,
-    all_constraints_by_name: (dict[str, Callable]),
+    check_plans: CheckPlans,
     constraint_results: dict[str, list[ExecutionResult]]
 ) -> dict[str, list[ExecutionResult]]:
     """
     Helper method that runs all the constraints for a given primitive.
 
     Args:
-        field (Any):                                                  The field being checked
+        field_plan (FieldCheckPlan):                            The plan for the field being checked
         source_definition (Definition):                         Source of the check_me field that we are evaluating
         value_to_check (Any):                                   The field value being checked
-        primitive_declaration (str):                            The declaration of the primitive
-        defining_primitive:                                     The defining primitive constraints
-        all_constraints_by_name (dict[str, Callable]):          A dictionary of all constraint names and function calls.
+        check_plans (CheckPlans):                               The compiled check plans.
         constraint_results (dict[str, list[ExecutionResult]]):  A dictionary of constraint results.
 
     Returns:
         dict[str, list[ExecutionResult]]: An updated dictionary of constraint results.
     """
+    primitive_constraints = check_plans.get_primitive_constraints(field_plan)
+    if not primitive_constraints:
+        return constraint_results
+
+    # The field's location is the same for every constraint, so look it up once in the definition's lexemes.
+    field_lexeme = find_first_lexeme(source_definition.lexemes, field_plan.field.name)
+    location = field_lexeme.location if field_lexeme else None
 
     # Check the value_to_check against the defining_primitive
-    defining_primitive_instance = defining_primitive
-    for constraint_assignment in defining_primitive_instance.constraints:
-        constraint_name = constraint_assignment.name
-        constraint_args = constraint_assignment.arguments
-        callback = all_constraints_by_name[constraint_name]
-        # This location code feels like a hack!  Is there a better way?
-        locations = [
-            lexeme.location
-            for lexeme in source_definition.lexemes
-            if lexeme.value == field.name
-        ]
-        location = None
-        if len(locations) > 0:
-            location = locations[0]
-
-        result: ExecutionResult = callback(
+    pending_batches = check_plans.pending_batches
+    for constraint in primitive_constraints:
+        # The constraint's results are added here, even if the value is queued, so the constraints are reported in the same order.
+        results = constraint_results.setdefault(constraint.name, [])
+        if constraint.batch_callback is not None and pending_batches is not None:
+            batch = pending_batches.get(constraint.name)
+            if batch is None:
+                batch = pending_batches[constraint.name] = PrimitiveConstraintBatch(constraint.batch_callback)
+            value = PrimitiveConstraintValue(value_to_check, field_plan.primitive_declaration, constraint.arguments, source_definition.source, location)
+            batch.add(value, results)
+            continue
+
+        result: ExecutionResult = constraint.callback(
             value_to_check,
-            primitive_declaration,
-            constraint_args,
+            field_plan.primitive_declaration,
+            constraint.arguments,
             source_definition.source,
             location,
         )
-        if constraint_name not in constraint_results:
-            constraint_results[constraint_name] = []
-        constraint_results[constraint_name].append(result)
+        results.append(result)
     return constraint_results
 
 
 def _run_primitive_constraint_list(
     check_me: Any,
-    field: Any,
+    field_plan: FieldCheckPlan,
     source_definition: Definition,
-    field_defining_schema: Definition,
-    all_constraints_by_name: dict[str, Callable],
+    check_plans: CheckPlans,
     constraint_results: dict[str, list[ExecutionResult]]
 ) -> dict[str, list[ExecutionResult]]:
     """
@@ -86,15 +271,15 @@ def _run_primitive_constraint_list(
 
     Args:
         check_me (Any):                                         The field value being checked
-        field (Any):                                            The field being checked
+        field_plan (FieldCheckPlan):                            The plan for the field being checked
         source_definition (Definition):                         Source of the check_me field that we are evaluating
-        field_defining_schema: (Definition):                    The definition in which the primitive is declared
-        all_constraints_by_name (dict[str, Callable]):          A dictionary of all constraint names and function calls.
+        check_plans (CheckPlans):                               The compiled check plans.
         constraint_results (dict[str, list[ExecutionResult]]):  A dictionary of constraint results.
 
     Returns:
         dict[str, list[ExecutionResult]]: An updated dictionary of constraint results.
     """
+    field = field_plan.field
     if type(getattr(check_me, field.name)) != list:
         raise LanguageError(
             f"Value of '{field.name}' was expected to be list, but was '{type(getattr(check_me, field.name))}'",
@@ -104,25 +289,15 @@ def _run_primitive_constraint_list(
     for item in getattr(check_me, field.name):
         value_to_check = item
         if value_to_check is not None:
-
-            constraint_results = check_primitive_constraint(
-                field,
-                source_definition,
-                item,
-                field.type[:-2],
-                field_defining_schema[0].instance,
-                all_constraints_by_name,
-                constraint_results
-            )
+            constraint_results = check_primitive_constraint(field_plan, source_definition, item, check_plans, constraint_results)
     return constraint_results
 
 
 def _run_primitive_constraint_not_list(
     check_me: Any,
-    field: Any,
+    field_plan: FieldCheckPlan,
     source_definition: Definition,
-    field_defining_schema: Definition,
-    all_constraints_by_name: (dict[str, Callable]),
+    check_plans: CheckPlans,
     constraint_results: dict[str, list[ExecutionResult]]
 ) -> dict[str, list[ExecutionResult]]:
     """
@@ -130,38 +305,26 @@ def _run_primitive_constraint_not_list(
 
     Args:
         check_me (Any):                                         The field value being checked
-        field (Any):                                            The field being checked
+        field_plan (FieldCheckPlan):                            The plan for the field being checked
         source_definition (Definition):                         Source of the check_me field that we are evaluating
-        field_defining_schema: (Definition):                    The definition in which the primitive is declared
-        all_constraints_by_name (dict[str, Callable]):          A dictionary of all constraint names and function calls.
+        check_plans (CheckPlans):                               The compiled check plans.
         constraint_results (dict[str, list[ExecutionResult]]):  A dictionary of constraint results.
 
     Returns:
         dict[str, list[ExecutionResult]]: An updated dictionary of constraint results.
     """
-    value_to_check = getattr(check_me, field.name)
+    value_to_check = getattr(check_me, field_plan.field.name)
     if value_to_check is not None:
-        constraint_results = check_primitive_constraint(
-            field,
-            source_definition,
-            value_to_check,
-            field.type,
-            field_defining_schema[0].instance,
-            all_constraints_by_name,
-            constraint_results
-        )
+        constraint_results = check_primitive_constraint(field_plan, source_definition, value_to_check, check_plans, constraint_results)
     return constraint_results
 
 
-def _collect_schema_constraints(check_against: Definition) -> list:
+def _collect_universal_schema_constraints() -> list:
     """
-    Collects applicable constraints for the current schema.
-
-    Args:
-        check_against (Definition): The Constraint we are checking against
+    Collects the universal schema constraints, which apply to every schema.
 
     Returns:
-        list: A list of collected schema constraints.
+        list: A list of constraint assignments for the universal schema constraints.
     """
     schema_constraints = []
     context = LanguageContext()
@@ -175,87 +338,66 @@ def _collect_schema_constraints(check_against: Definition) -> list:
                         {"name": constraint.name, "arguments": []},
                     )
                 )
-    if check_against.constraints:
-        for constraint_assignment in check_against.constraints:
-            schema_constraints.append(constraint_assignment)
     return schema_constraints
 
 
 def _check_against_defined_schema_constraints(
-    schema_constraints: list,
+    schema_plan: SchemaCheckPlan,
     source_definition: Definition,
     check_me: Any,
-    check_against: Definition,
-    all_constraints_by_name: dict[str, Callable],
     constraint_results: dict[str, list[ExecutionResult]]
 ) -> dict[str, list[ExecutionResult]]:
     """
     Checks a value against constraints defined in the defining schema.
 
     Args:
-        schema_constraints (list):                              A list of collected schema constraints to check the value against.
+        schema_plan (SchemaCheckPlan):                          The plan of the schema we are comparing the check_me field against
         source_definition (Definition):                         Source of the check_me field that we are evaluating
         check_me (Any):                                         The field value being checked
-        check_against (Any):                                    The schema we are comparing the check_me field against
-        all_constraints_by_name (dict[str, Callable]):          A dictionary of all constraint names and function calls.
         constraint_results (dict[str, list[ExecutionResult]]):  A dictionary of constraint results.
 
     Returns:
         dict[str, list[ExecutionResult]]: An updated dictionary of constraint results.
     """
-    for constraint_assignment in schema_constraints:
-        constraint_name = constraint_assignment.name
-        constraint_args = constraint_assignment.arguments
-        callback = all_constraints_by_name[constraint_name]
-        result: ExecutionResult = callback(
-            check_me, source_definition, check_against, constraint_args
+    for constraint in schema_plan.schema_constraints:
+        result: ExecutionResult = constraint.callback(
+            check_me, source_definition, schema_plan.schema, constraint.arguments
         )
 
-        if constraint_name not in constraint_results:
-            constraint_results[constraint_name] = []
-        constraint_results[constraint_name].append(result)
+        if constraint.name not in constraint_results:
+            constraint_results[constraint.name] = []
+        constraint_results[constraint.name].append(result)
     return constraint_results
 
 
 def _check_field_against_constraint(
+    schema_plan: SchemaCheckPlan,
     source_definition: Definition,
     check_me: Any,
-    check_against: Definition,
-    all_constraints_by_name: dict[str, Callable],
+    check_plans: CheckPlans,
     constraint_results: dict[str, list[ExecutionResult]]
 ) -> dict[str, list[ExecutionResult]]:
     """
     Loops through each field in the check_against schema.
 
     Args:
+        schema_plan (SchemaCheckPlan):                          The plan of the schema we are comparing the check_me field against
         source_definition (Definition):                         Source of the check_me field that we are evaluating
         check_me (Any):                                         The field value being checked
-        check_against (Definition):                             The schema we are comparing the check_me field against
-        all_constraints_by_name (dict[str, Callable]):          A dictionary of all constraint names and function calls.
+        check_plans (CheckPlans):                               The compiled check plans.
         constraint_results (dict[str, list[ExecutionResult]]):  A dictionary of constraint results.
 
     Returns:
         dict[str, list[ExecutionResult]]: An updated dictionary of constraint results.
     """
-    context = LanguageContext()
-    for field in check_against.fields:
+    for field_plan in schema_plan.fields:
+        field = field_plan.field
         # only check the field if it is present
         if not hasattr(check_me, field.name):
             continue
 
-        # get the name of the schema that defines the field, special handling for arrays and references
-        type_name = field.type
-        is_list = False
-        # if type name ends with "[]", remove the brackets and set is_list to True
-        if field.type.endswith("[]"):
-            type_name = field.type[: -2]
-            is_list = True
-        # if type name has parameters in parens, remove them
-        if type_name.find("(") > -1:
-            type_name = type_name[: type_name.find("(")]
-
-        # get the definition that defines the field
-        field_defining_schema = context.get_definitions_by_name(type_name)
+        # the definition that defines the field
+        field_defining_schema = field_plan.defining_definitions
 
         if len(field_defining_schema) != 1:
             # Question: should we convert this to a Constraint Failure?
@@ -264,16 +406,16 @@ def _check_field_against_constraint(
                 source_definition.source.uri
             )
 
-        if field_defining_schema[0].get_root_key() == "primitive":
+        if field_plan.is_primitive:
             # if the field is a primitive, run the primitive constraints
 
-            if is_list:
-                constraint_results = _run_primitive_constraint_list(check_me, field, source_definition, field_defining_schema, all_constraints_by_name, constraint_results)
+            if field_plan.is_list:
+                constraint_results = _run_primitive_constraint_list(check_me, field_plan, source_definition, check_plans, constraint_results)
             else:
-                constraint_results = _run_primitive_constraint_not_list(check_me, field, source_definition, field_defining_schema, all_constraints_by_name, constraint_results)
+                constraint_results = _run_primitive_constraint_not_list(check_me, field_plan, source_definition, check_plans, constraint_results)
         else:
             # if the field is a schema, run the schema constraints
-            if is_list:
+            if field_plan.is_list:
                 # if the field is a list, check each item in the list
                 for item in getattr(check_me, field.name):
 
@@ -281,7 +423,7 @@ def _check_field_against_constraint(
                         source_definition,
                         item,
                         field_defining_schema[0].instance,
-                        all_constraints_by_name,
+                        check_plans,
                         constraint_results
                     )
             else:
@@ -289,7 +431,7 @@ def _check_field_against_constraint(
                     source_definition,
                     getattr(check_me, field.name),
                     field_defining_schema[0].instance,
-                    all_constraints_by_name,
+                    check_plans,
                     constraint_results
                 )
     return constraint_results
@@ -299,7 +441,7 @@ def check_schema_constraint(
     source_definition: Definition,
     check_me: Any,
     check_against: Definition,
-    all_constraints_by_name: dict[str, Callable],
+    check_plans: CheckPlans,
     constraint_results: dict[str, list[ExecutionResult]]
 ) -> dict[str, list[ExecutionResult]]:
     """
@@ -309,7 +451,7 @@ def check_schema_constraint(
         source_definition (Definition):                         Source of the check_me field that we are evaluating
         check_me (Any):                                         The field being checked
         check_against (Definition):                             The schema we are comparing the check_me field against
-        all_constraints_by_name (dict[str, Callable]):          A dictionary of all constraint names and function calls.
+        check_plans (CheckPlans):                               The compiled check plans.
         constraint_results (dict[str, list[ExecutionResult]]):  A dictionary of constraint results.
 
     Returns:
@@ -319,18 +461,16 @@ def check_schema_constraint(
         LanguageError: If unique schema definition for field type not found for field name
         LanguageError: If value of field name was something other than a list
     """
-    # make sure we've got a schema
-    context = LanguageContext()
-    if not context.is_aac_instance(check_against, "aac.lang.Schema"):
+    # the plan is None if check_against isn't a schema
+    schema_plan = check_plans.get_schema_plan(check_against)
+    if not schema_plan:
         return constraint_results
-    # collect applicable constraints
-    schema_constraints = _collect_schema_constraints(check_against)
     # Check the check_me against constraints in the defining_schema
-    constraint_results = _check_against_defined_schema_constraints(schema_constraints, source_definition, check_me, check_against, all_constraints_by_name, constraint_results)
+    constraint_results = _check_against_defined_schema_constraints(schema_plan, source_definition, check_me, constraint_results)
 
     # loop through the fields on the check_against schema
 
-    return _check_field_against_constraint(source_definition, check_me, check_against, all_constraints_by_name, constraint_results)
+    return _check_field_against_constraint(schema_plan, source_definition, check_me, check_plans, constraint_results)
 
 
 def check_context_constraint(
@@ -399,7 +539,7 @@ def _check_constraint_results(constraint_results: dict[str, list[ExecutionResult
     return status, messages
 
 
-def _collect_all_constraints_by_name() -> dict[str, Callable]:
+def collect_all_constraints_by_name() -> dict[str, Callable]:
     """
     Collects all constraints found in Language Context into a dictionary.
 
@@ -414,6 +554,184 @@ def _collect_all_constraints_by_name() -> dict[str, Callable]:
     return all_constraints_by_name
 
 
+def _collect_all_batch_constraints_by_name() -> dict[str, Callable]:
+    """
+    Collects the batched primitive constraints found in Language Context into a dictionary.
+
+    Returns:
+        dict[str, Callable]: A dictionary of the batched primitive constraints.
+    """
+    context = LanguageContext()
+    all_batch_constraints_by_name: dict[str, Callable] = {}
+    for runner in context.get_plugin_runners():
+        for name, batch_callback in runner.constraint_to_batch_callback.items():
+            all_batch_constraints_by_name[name] = batch_callback
+    return all_batch_constraints_by_name
+
+
+def check_definitions(
+    definitions_to_check: list[Definition],
+    check_plans: CheckPlans
+) -> list[dict[str, list[ExecutionResult]]]:
+    """
+    Helper method that runs the schema constraints for each definition in order.
+
+    The values of primitive constraints that have a batched callback are queued while the definitions are walked, and
+    checked in one call per constraint at the end. Batched constraints only report their failures.
+
+    Args:
+        definitions_to_check (list[Definition]):                The definitions to check.
+        check_plans (CheckPlans):                               The compiled check plans.
+
+    Returns:
+        list[dict[str, list[ExecutionResult]]]: The constraint results of each definition.
+
+    Raises:
+        LanguageError: Passed up LanguageError from get_defining_schema_for_root
+    """
+    context: LanguageContext = LanguageContext()
+    definition_results = []
+    check_plans.pending_batches = {}
+    try:
+        for check_me in definitions_to_check:
+            try:
+                defining_schema = context.get_defining_schema_for_root(check_me.get_root_key())
+            except LanguageError as e:
+                raise LanguageError(e.message, check_me.source.uri)
+            # We now check the schema constraints.  The primitive constraints are also called as a part of the schema constraints check.
+            definition_results.append(check_schema_constraint(check_me, check_me.instance, defining_schema.instance, check_plans, {}))
+        for batch in check_plans.pending_batches.values():
+            batch.run()
+    finally:
+        check_plans.pending_batches = None
+    return definition_results
+
+
+def check_definitions_in_parallel(
+    definitions_to_check: list[Definition],
+    check_plans: CheckPlans,
+    jobs: int
+) -> list[dict[str, list[ExecutionResult]]]:
+    """
+    Helper method that runs the schema constraints for each definition across a pool of worker processes.
+
+    The workers are forked from this process, so each one has a read-only copy of the LanguageContext. The definitions
+    are split into contiguous chunks and the results of each chunk are collected in order, so the constraint results are
+    the same as if the definitions were checked one at a time.
+
+    Args:
+        definitions_to_check (list[Definition]):                The definitions to check.
+        check_plans (CheckPlans):                               The compiled check plans.
+        jobs (int):                                             The number of worker processes.
+
+    Returns:
+        list[dict[str, list[ExecutionResult]]]: The constraint results of each definition.
+
+    Raises:
+        LanguageError: Passed up LanguageError from get_defining_schema_for_root
+    """
+    if "fork" not in get_all_start_methods():
+        logging.info("Checking definitions in a single process because worker processes can't be forked on this platform.")
+        return check_definitions(definitions_to_check, check_plans)
+
+    chunk_size = ceil(len(definitions_to_check) / (jobs * CHECK_CHUNKS_PER_JOB))
+    chunks = [range(start, min(start + chunk_size, len(definitions_to_check))) for start in range(0, len(definitions_to_check), chunk_size)]
+    definition_results = []
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(chunks)),
+        mp_context=get_context("fork"),
+        initializer=_initialize_check_worker,
+        initargs=(definitions_to_check, check_plans),
+    ) as executor:
+        for chunk_results in executor.map(_check_definitions_chunk, chunks):
+            definition_results.extend(chunk_results)
+    return definition_results
+
+
+# The definitions and check plans a forked check worker was started with.
+_worker_definitions_to_check: list[Definition] = []
+_worker_check_plans: Optional[CheckPlans] = None
+
+
+def _initialize_check_worker(definitions_to_check: list[Definition], check_plans: CheckPlans) -> None:
+    """Keep the definitions and check plans in the worker so that only chunk ranges are sent to it."""
+    global _worker_definitions_to_check, _worker_check_plans
+    _worker_definitions_to_check = definitions_to_check
+    _worker_check_plans = check_plans
+
+
+def _check_definitions_chunk(chunk: range) -> list[dict[str, list[ExecutionResult]]]:
+    """Check a chunk of the definitions in a worker process."""
+    return check_definitions([_worker_definitions_to_check[index] for index in chunk], _worker_check_plans)
+
+
+def collect_definition_dependencies(definition: Definition, check_plans: CheckPlans) -> set[str]:
+    """
+    Collects the keys of everything in the context, other than the definition itself, that its constraint results depend on.
+
+    The dependencies are the schemas the definition's values are checked against, the targets of its typeref and
+    dataref values, and the files imported by import definitions. Schemas that the dependencies extend are included
+    in their fingerprints.
+
+    Args:
+        definition (Definition):    The definition being checked.
+        check_plans (CheckPlans):   The compiled check plans.
+
+    Returns:
+        set[str]: The dependency keys of the definition.
+    """
+    context: LanguageContext = LanguageContext()
+    root_key = definition.get_root_key()
+    dependencies = {f"{DEPENDENCY_ROOT}:{root_key}"}
+    if definition.is_import():
+        dependencies.update(f"{DEPENDENCY_FILE}:{file}" for file in _get_files_to_import(definition.source.uri, [definition.structure]))
+
+    defining_schemas = context.get_defining_schemas_for_root(root_key)
+    if len(defining_schemas) == 1:
+        _collect_value_dependencies(definition.instance, defining_schemas[0].instance, check_plans, dependencies)
+    return dependencies
+
+
+def _collect_value_dependencies(check_me: Any, check_against: Any, check_plans: CheckPlans, dependencies: set[str]) -> None:
+    """Collects the dependencies of a value by walking the same fields as check_schema_constraint."""
+    schema_plan = check_plans.get_schema_plan(check_against)
+    if not schema_plan:
+        return
+
+    dependencies.add(f"{DEPENDENCY_NAME}:{schema_plan.schema.name}")
+    for field_plan in schema_plan.fields:
+        if not hasattr(check_me, field_plan.field.name):
+            continue
+
+        dependencies.add(f"{DEPENDENCY_NAME}:{field_plan.type_name}")
+        value = getattr(check_me, field_plan.field.name)
+        values = value if field_plan.is_list and isinstance(value, list) else [value]
+        if field_plan.is_primitive:
+            _collect_reference_dependencies(field_plan.primitive_declaration, values, dependencies)
+        elif len(field_plan.defining_definitions) == 1:
+            for item in values:
+                _collect_value_dependencies(item, field_plan.defining_definitions[0].instance, check_plans, dependencies)
+
+
+def _collect_reference_dependencies(declaration: str, values: list, dependencies: set[str]) -> None:
+    """Collects the dependencies of the values of a primitive field, which only typeref and dataref fields have."""
+    is_typeref = declaration.startswith("typeref")
+    if not is_typeref and not declaration.startswith("dataref"):
+        return
+
+    target = declaration[declaration.find("(") + 1: declaration.find(")")]
+    for item in values:
+        if item is None:
+            continue
+        # Clean up the values the same way the typeref and dataref constraints do.
+        clean_value = str(item).strip().removesuffix("[]").strip()
+        if is_typeref:
+            clean_value = clean_value.split("(")[0].strip()
+            dependencies.update([f"{DEPENDENCY_NAME}:{clean_value}", f"{DEPENDENCY_TYPE}:{target}"])
+        else:
+            dependencies.update([f"{DEPENDENCY_NAME}:{clean_value}", f"{DEPENDENCY_DATAREF}:{target}:{clean_value}"])
+
+
 def find_definitions_to_check(aac_file: str) -> (list[Definition], ExecutionStatus):
     """
     Lower level helper method to collect the definitions to check by calling parse_and_load and handling any LanguageError or ParserErrors returned from parse_and_load.
@@ -465,7 +783,92 @@ def find_definitions_to_check(aac_file: str) -> (list[Definition], ExecutionStat
     return (definitions_to_check, None)
 
 
-def check(aac_file: str, fail_on_warn: bool, verbose: bool) -> ExecutionResult:
+def _check_schema_constraints(
+    aac_file: str,
+    definitions_to_check: list[Definition],
+    check_plans: CheckPlans,
+    jobs: int,
+    incremental: bool,
+    constraint_results: dict[str, list[ExecutionResult]],
+) -> dict[str, list[ExecutionResult]]:
+    """Check the schema constraints of each definition, adding the results to the constraint results in definition order."""
+    if incremental:
+        definition_results = _check_definitions_incrementally(aac_file, definitions_to_check, check_plans, jobs)
+    else:
+        definition_results = _check_definitions(definitions_to_check, check_plans, jobs)
+
+    # merge the results of each definition in order, as if they had been checked one at a time
+    for results in definition_results:
+        for constraint_name, constraint_name_results in results.items():
+            constraint_results.setdefault(constraint_name, []).extend(constraint_name_results)
+    return constraint_results
+
+
+def _check_definitions(definitions_to_check: list[Definition], check_plans: CheckPlans, jobs: int) -> list[dict[str, list[ExecutionResult]]]:
+    """Check the definitions in a single process, or across a pool of worker processes if there are enough of both."""
+    jobs = jobs or cpu_count() or 1
+    if jobs > 1 and len(definitions_to_check) > 1:
+        return check_definitions_in_parallel(definitions_to_check, check_plans, jobs)
+    return check_definitions(definitions_to_check, check_plans)
+
+
+def _check_definitions_incrementally(
+    aac_file: str,
+    definitions_to_check: list[Definition],
+    check_plans: CheckPlans,
+    jobs: int
+) -> list[dict[str, list[ExecutionResult]]]:
+    """
+    Check only the definitions that changed since the last incremental check of the AaC file, replaying the saved results of the others.
+
+    A definition is re-checked if its content changed, or if the fingerprint of any of its dependencies changed. The
+    check state is saved after the definitions are checked, so a check that raises an error doesn't update it.
+
+    Args:
+        aac_file (str):                             The AaC file being processed
+        definitions_to_check (list[Definition]):    The definitions to check.
+        check_plans (CheckPlans):                   The compiled check plans.
+        jobs (int):                                 The number of processes used to check the changed definitions.
+
+    Returns:
+        list[dict[str, list[ExecutionResult]]]: The constraint results of each definition.
+    """
+    environment_hash = get_environment_hash()
+    saved_state = load_check_state(aac_file)
+    if saved_state is None or saved_state.environment_hash != environment_hash:
+        saved_state = CheckState(environment_hash)
+
+    fingerprints = DependencyFingerprints()
+    definition_keys = [get_definition_key(definition) for definition in definitions_to_check]
+    definition_results: list[Optional[dict[str, list[ExecutionResult]]]] = []
+    changed_indices = []
+    for index, (definition, definition_key) in enumerate(zip(definitions_to_check, definition_keys)):
+        definition_state = saved_state.definitions.get(definition_key)
+        if definition_state and fingerprints.is_current(definition_state.dependencies):
+            definition_results.append(get_absolute_results(definition, definition_state.constraint_results))
+        else:
+            definition_results.append(None)
+            changed_indices.append(index)
+
+    logging.info(f"Checking {len(changed_indices)} of {len(definitions_to_check)} definitions that changed since the last incremental check.")
+    checked_results = _check_definitions([definitions_to_check[index] for index in changed_indices], check_plans, jobs)
+
+    check_state = CheckState(environment_hash)
+    for index, results in zip(changed_indices, checked_results):
+        definition = definitions_to_check[index]
+        definition_results[index] = results
+        dependencies = fingerprints.get_fingerprints(collect_definition_dependencies(definition, check_plans))
+        check_state.definitions[definition_keys[index]] = DefinitionCheckState(dependencies, get_relative_results(definition, results))
+    for definition_key in definition_keys:
+        if definition_key not in check_state.definitions:
+            check_state.definitions[definition_key] = saved_state.definitions[definition_key]
+    if check_state.definitions.keys() != saved_state.definitions.keys() or changed_indices:
+        save_check_state(check_state, aac_file)
+
+    return definition_results
+
+
+def check(aac_file: str, fail_on_warn: bool, verbose: bool, jobs: int = 1, incremental: bool = False) -> ExecutionResult:
     """
     Checks relevant constraints for given definition(s).  Runs context constraints (global constraints), then runs schema constraints (specifically assigned constraints). Primitive constraints are ran as a part of schema constraints.
 
@@ -473,6 +876,8 @@ def check(aac_file: str, fail_on_warn: bool, verbose: bool) -> ExecutionResult:
         aac_file (str):         The AaC file being processed
         fail_on_warn (bool):    Flag to fail when warnings are discovered
         verbose (bool):         Flag for verbose mode. When true add success messages as encountered.
+        jobs (int):             The number of processes used to check the definitions, or 0 to use one process per CPU.
+        incremental (bool):     Flag to only check the definitions that changed since the last incremental check of the AaC file.
 
     Returns:
         ExecutionResult:        Method result containing: plugin_name ("Check AaC"), "check", status, message
@@ -487,7 +892,7 @@ def check(aac_file: str, fail_on_warn: bool, verbose: bool) -> ExecutionResult:
     context: LanguageContext = LanguageContext()
 
     # collect all constraints for easy access
-    all_constraints_by_name = _collect_all_constraints_by_name()
+    all_constraints_by_name = collect_all_constraints_by_name()
 
     messages = []
 
@@ -507,13 +912,11 @@ def check(aac_file: str, fail_on_warn: bool, verbose: bool) -> ExecutionResult:
         # we want to check context constraints, but not the ones that are defined in the aac_file we're checking to avoid gen-plugin circular logic
         for context_constraint in plugin.instance.context_constraints:
             constraint_results = check_context_constraint(context_constraint, definitions_to_check, all_constraints_by_name, constraint_results)
-    for check_me in definitions_to_check:
-        try:
-            defining_schema = context.get_defining_schema_for_root(check_me.get_root_key())
-        except LanguageError as e:
-            raise LanguageError(e.message, check_me.source.uri)
-        # We now check the schema constraints.  The primitive constraints are also called as a part of the schema constraints check.
-        constraint_results = check_schema_constraint(check_me, check_me.instance, defining_schema.instance, all_constraints_by_name, constraint_results)
+
+    # Then check the schema constraints of each definition, which are independent of each other
+    # The constraints and fields of each schema are resolved once, the first time a value is checked against the schema
+    check_plans = CheckPlans(all_constraints_by_name)
+    constraint_results = _check_schema_constraints(aac_file, definitions_to_check, check_plans, jobs, incremental, constraint_results)
 
     # loop through all the constraint results and see if any of them failed
     status, messages = _check_constraint_results(constraint_results, verbose, fail_on_warn)
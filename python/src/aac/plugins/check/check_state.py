@@ -0,0 +1,251 @@
+"""Provides the state kept between `aac check --incremental` runs so unchanged definitions don't need to be re-checked."""
+import logging
+import pickle
+from attr import Factory, attrib, attrs, validators
+from hashlib import md5
+from os import makedirs, path, remove, replace
+from tempfile import mkstemp
+from typing import Optional
+
+from aac import __version__
+from aac.context.definition import Definition
+from aac.context.language_context import LanguageContext
+from aac.context.language_error import LanguageError
+from aac.context.language_snapshot import get_file_hash
+from aac.context.source_location import SourceLocation
+from aac.execute.aac_execution_result import ExecutionMessage, ExecutionResult
+from aac.in_out.paths import get_user_cache_directory
+
+CHECK_STATE_FORMAT_VERSION = 2
+CHECK_STATE_DIRECTORY_NAME = "check"
+
+# The kinds of dependency a definition's constraint results can have, used as prefixes of the dependency keys.
+DEPENDENCY_NAME = "name"
+DEPENDENCY_ROOT = "root"
+DEPENDENCY_TYPE = "type"
+DEPENDENCY_DATAREF = "dataref"
+DEPENDENCY_FILE = "file"
+
+# Dependencies that can't be resolved still get a fingerprint, so they're re-checked once they can be.
+MISSING_FINGERPRINT = "missing"
+FOUND_FINGERPRINT = "found"
+
+
+@attrs(slots=True)
+class DefinitionCheckState:
+    """The constraint results of a checked definition and the fingerprints of everything the results depend on.
+
+    Attributes:
+        dependencies (dict[str, str]): The fingerprint of each dependency of the definition by its dependency key.
+        constraint_results (dict[str, list[ExecutionResult]]): The constraint results of the definition, with their
+            locations relative to the start of the definition.
+    """
+
+    dependencies: dict[str, str] = attrib(validator=validators.instance_of(dict))
+    constraint_results: dict[str, list[ExecutionResult]] = attrib(validator=validators.instance_of(dict))
+
+
+@attrs(slots=True)
+class CheckState:
+    """The state of the last incremental check of an AaC file.
+
+    Attributes:
+        environment_hash (str): The fingerprint of the AaC version and plugins the definitions were checked with.
+        definitions (dict[str, DefinitionCheckState]): The state of each checked definition by its definition key.
+    """
+
+    environment_hash: str = attrib(validator=validators.instance_of(str))
+    definitions: dict[str, DefinitionCheckState] = attrib(default=Factory(dict), validator=validators.instance_of(dict))
+
+
+@attrs(slots=True)
+class DependencyFingerprints:
+    """Computes, and remembers for the rest of the check, the fingerprint of each dependency key.
+
+    A dependency key is a kind followed by a colon and the dependency, such as `name:MySchema`, and its fingerprint
+    changes whenever a change to the context could change the constraint results of the definitions that depend on it.
+
+    Attributes:
+        fingerprints (dict[str, str]): The fingerprints computed so far by dependency key.
+    """
+
+    fingerprints: dict[str, str] = attrib(default=Factory(dict), init=False)
+
+    def get_fingerprint(self, dependency_key: str) -> str:
+        """
+        Return the current fingerprint of a dependency.
+
+        Args:
+            dependency_key (str): The key of the dependency.
+
+        Returns:
+            The fingerprint of the dependency in the current context.
+        """
+        if dependency_key not in self.fingerprints:
+            # Extends chains can be circular, so a dependency refers to itself by name while it's being fingerprinted.
+            self.fingerprints[dependency_key] = dependency_key
+            self.fingerprints[dependency_key] = self._compute_fingerprint(dependency_key)
+        return self.fingerprints[dependency_key]
+
+    def get_fingerprints(self, dependency_keys: set[str]) -> dict[str, str]:
+        """Return the current fingerprint of each of the dependencies."""
+        return {dependency_key: self.get_fingerprint(dependency_key) for dependency_key in sorted(dependency_keys)}
+
+    def is_current(self, dependencies: dict[str, str]) -> bool:
+        """Return True if none of the dependencies have changed since their fingerprints were taken."""
+        return all(self.get_fingerprint(dependency_key) == fingerprint for dependency_key, fingerprint in dependencies.items())
+
+    def _compute_fingerprint(self, dependency_key: str) -> str:
+        kind, _, dependency = dependency_key.partition(":")
+        context = LanguageContext()
+        if kind == DEPENDENCY_NAME:
+            return self._get_definitions_fingerprint(context.get_definitions_by_name(dependency))
+        if kind == DEPENDENCY_ROOT:
+            return self._get_definitions_fingerprint(context.get_defining_schemas_for_root(dependency))
+        if kind == DEPENDENCY_TYPE:
+            package, _, name = dependency.rpartition(".")
+            try:
+                definitions_of_type = context.get_definitions_of_type(package, name)
+            except LanguageError:
+                return MISSING_FINGERPRINT
+            return _hash([definition.get_fully_qualified_name() for definition in definitions_of_type])
+        if kind == DEPENDENCY_DATAREF:
+            target, _, value = dependency.partition(":")
+            # A failed dataref reports every value found at its target, but a satisfied one only depends on finding the value.
+            if value in context.get_value_set_by_field_chain(target):
+                return FOUND_FINGERPRINT
+            return _hash(context.get_values_by_field_chain(target))
+        if kind == DEPENDENCY_FILE:
+            return get_file_hash(dependency) or MISSING_FINGERPRINT
+        raise ValueError(f"Unknown check dependency '{dependency_key}'.")
+
+    def _get_definitions_fingerprint(self, definitions: list[Definition]) -> str:
+        if not definitions:
+            return MISSING_FINGERPRINT
+
+        context = LanguageContext()
+        parts = []
+        for definition in definitions:
+            # Dependents' results only hold their own locations, so reformatting a dependency doesn't change them.
+            parts.extend([definition.source.uri, definition.get_fingerprint()])
+            # A definition's meaning also depends on the schema for its root and on the schemas it extends.
+            parts.extend(schema.get_fully_qualified_name() for schema in context.get_defining_schemas_for_root(definition.get_root_key()))
+            for extension in (definition.structure.get("schema") or {}).get("extends") or []:
+                if isinstance(extension, dict) and "name" in extension:
+                    parts.append(self.get_fingerprint(f"{DEPENDENCY_NAME}:{extension['name']}"))
+        return _hash(parts)
+
+
+def get_check_state_file_path(aac_file: str) -> str:
+    """Return the path of the file that holds the incremental check state of an AaC file."""
+    file_name = md5(path.realpath(aac_file).encode()).hexdigest()
+    return path.join(get_user_cache_directory(CHECK_STATE_DIRECTORY_NAME), f"{file_name}.pickle")
+
+
+def get_environment_hash() -> str:
+    """Return a fingerprint of the AaC version and the plugins that provide the constraints."""
+    plugins = LanguageContext().get_definitions_by_root("plugin")
+    return _hash([CHECK_STATE_FORMAT_VERSION, __version__] + sorted(f"{plugin.source.uri}:{plugin.content}" for plugin in plugins))
+
+
+def get_definition_key(definition: Definition) -> str:
+    """Return the key that identifies a definition's content in the check state."""
+    return _hash([definition.source.uri, definition.content])
+
+
+def get_relative_results(definition: Definition, constraint_results: dict[str, list[ExecutionResult]]) -> dict[str, list[ExecutionResult]]:
+    """Return the definition's constraint results with their locations relative to the start of the definition."""
+    line, position = _get_definition_start(definition)
+    return _move_results(definition, constraint_results, -line, -position)
+
+
+def get_absolute_results(definition: Definition, constraint_results: dict[str, list[ExecutionResult]]) -> dict[str, list[ExecutionResult]]:
+    """Return the definition's relative constraint results with their locations in the definition's source."""
+    line, position = _get_definition_start(definition)
+    return _move_results(definition, constraint_results, line, position)
+
+
+def save_check_state(check_state: CheckState, aac_file: str, check_state_file_path: Optional[str] = None) -> None:
+    """
+    Write the check state of an AaC file to disk.
+
+    Failing to write the check state is logged, but otherwise ignored since the check state is only an optimization.
+
+    Args:
+        check_state (CheckState): The check state to write.
+        aac_file (str): The AaC file that was checked.
+        check_state_file_path (Optional[str]): Overrides the location the check state is written to.
+    """
+    check_state_file_path = check_state_file_path or get_check_state_file_path(aac_file)
+
+    temp_path = None
+    try:
+        makedirs(path.dirname(check_state_file_path), exist_ok=True)
+        file_descriptor, temp_path = mkstemp(dir=path.dirname(check_state_file_path), suffix=".tmp")
+        with open(file_descriptor, "wb") as check_state_file:
+            pickle.dump((CHECK_STATE_FORMAT_VERSION, __version__, check_state), check_state_file, pickle.HIGHEST_PROTOCOL)
+        replace(temp_path, check_state_file_path)
+    except Exception as error:
+        logging.warning(f"Failed to write the check state '{check_state_file_path}': {error}")
+        if temp_path and path.exists(temp_path):
+            remove(temp_path)
+
+
+def load_check_state(aac_file: str, check_state_file_path: Optional[str] = None) -> Optional[CheckState]:
+    """
+    Read the check state of an AaC file from disk.
+
+    Args:
+        aac_file (str): The AaC file being checked.
+        check_state_file_path (Optional[str]): Overrides the location the check state is read from.
+
+    Returns:
+        The check state, or None if the file hasn't been checked incrementally or was checked by a different AaC version.
+    """
+    check_state_file_path = check_state_file_path or get_check_state_file_path(aac_file)
+    if not path.exists(check_state_file_path):
+        return None
+
+    try:
+        with open(check_state_file_path, "rb") as check_state_file:
+            format_version, version, check_state = pickle.load(check_state_file)
+    except Exception as error:
+        logging.warning(f"Failed to read the check state '{check_state_file_path}': {error}")
+        return None
+
+    if format_version != CHECK_STATE_FORMAT_VERSION or version != __version__:
+        logging.info(f"Discarding the out of date check state '{check_state_file_path}'.")
+        return None
+    return check_state
+
+
+def _hash(parts: list) -> str:
+    return md5("\0".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _get_definition_start(definition: Definition) -> tuple[int, int]:
+    """Return the line and position of the start of the definition in its source."""
+    if not definition.lexemes:
+        return 0, 0
+    location = definition.lexemes[0].location
+    return location.line, location.position
+
+
+def _move_results(
+    definition: Definition, constraint_results: dict[str, list[ExecutionResult]], lines: int, positions: int
+) -> dict[str, list[ExecutionResult]]:
+    """Return the constraint results with the locations in the definition's source moved by the offsets, copying only the results that move."""
+    def move_result(result: ExecutionResult) -> ExecutionResult:
+        if not any(message.location for message in result.messages):
+            # Most results are successes without messages, which can be shared since nothing in them moves.
+            return result
+        return ExecutionResult(result.plugin_name, result.plugin_command_name, result.status_code, [move_message(message) for message in result.messages])
+
+    def move_message(message: ExecutionMessage) -> ExecutionMessage:
+        location = message.location
+        if location is None or message.source != definition.source.uri:
+            return ExecutionMessage(message.message, message.level, message.source, location)
+        moved_location = SourceLocation(location.line + lines, location.column, location.position + positions, location.span)
+        return ExecutionMessage(message.message, message.level, message.source, moved_location)
+
+    return {constraint_name: [move_result(result) for result in results] for constraint_name, results in constraint_results.items()}
@@ -22,7 +22,7 @@ def before_gen_plugin_check(
 ) -> ExecutionResult:
     """Run the Check AaC command before the gen-plugin command."""
 
-    return run_check(aac_plugin_file, False, False)
+    return run_check(aac_plugin_file, False, False, 1, False)
 
 
 def gen_plugin(
@@ -76,7 +76,7 @@ def before_gen_project_check(
 ) -> ExecutionResult:
     """Run the Check AaC command before the gen-project command."""
 
-    return run_check(aac_project_file, False, False)
+    return run_check(aac_project_file, False, False, 1, False)
 
 
 def gen_project(
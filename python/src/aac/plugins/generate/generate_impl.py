@@ -3,7 +3,7 @@
 import logging
 from os import path, makedirs, walk, remove
 import importlib
-from typing import Callable, Any
+from typing import TYPE_CHECKING, Callable, Any, Optional
 from aac.execute.aac_execution_result import (
     ExecutionResult,
     ExecutionStatus,
@@ -12,11 +12,10 @@ from aac.execute.aac_execution_result import (
     ExecutionMessage,
     MessageLevel,
 )
-from jinja2 import Environment, FileSystemLoader, Template
-import black
 from aac.context.language_context import LanguageContext
 from aac.context.language_error import LanguageError
 from aac.context.definition import Definition
+from aac.context.field_chain import get_field_chain_query
 from aac.in_out.parser._parse_source import parse
 from aac.in_out.paths import sanitize_filesystem_path
 from aac.plugins.generate.helpers.python_helpers import (
@@ -25,6 +24,10 @@ from aac.plugins.generate.helpers.python_helpers import (
 )
 from aac.in_out.parser._parser_error import ParserError
 
+# jinja2 and black are slow to import, so they're only imported once something is generated
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 
 plugin_name = "Generate"
 
@@ -52,12 +55,27 @@ def _write_to_file(file_path: str, content: str):
         logging.error(f"Unexpected error when opening {file_path} with {error}")
 
 
+def _format_python(content: str) -> str:
+    """
+    Format generated Python code with black.
+
+    Args:
+        content (str): The Python code to format.
+
+    Returns:
+        The formatted Python code.
+    """
+    import black
+
+    return black.format_str(content, mode=black.Mode())
+
+
 def output_to_jinja_template(
     evaluate: bool,
     force_overwrite: bool,
     source: Any,
     template: Any,
-    jinja_template: Template,
+    jinja_template: "Template",
     code_out_dir: str,
     test_out_dir: str,
     doc_out_dir: str,
@@ -82,7 +100,7 @@ def output_to_jinja_template(
     context = LanguageContext()
     source_data_package = source_data_def.package
     jinja_output = jinja_template.render(source_data_structure)
-    output = black.format_str(jinja_output, mode=black.Mode()) if template.output_file_extension == "py" else jinja_output
+    output = _format_python(jinja_output) if template.output_file_extension == "py" else jinja_output
 
     # write output to files to the target in the template, respecting the overwrite indicator
     root_out_dir = code_out_dir
@@ -134,16 +152,50 @@ def output_to_jinja_template(
                 _write_to_file(evaluate_file_path, output)
 
 
+def get_source_data_structures(source: Any, source_data_def: Definition) -> list[dict]:
+    """
+    Navigates the structure of a data source definition to the data_content of a generator source.
+
+    Args:
+        source (Any): An instance of the source generator file definition.
+        source_data_def (Definition): The definition of the source aac data.
+
+    Returns:
+        list[dict]: The structures that content is generated for, which is the definition's structure if the source has no data_content.
+
+    Raises:
+        ExecutionError: When the content of the data source file is invalid.
+    """
+    if not source.data_content:
+        # we'll just use the root structure
+        return [source_data_def.structure]
+
+    # we've got to navigate the structure to get the right data
+    query = get_field_chain_query(source.data_content)
+    if query.root_key != source_data_def.get_root_key():
+        raise ExecutionError(
+            f"Invalid data_content for generator source {source.name}. The data_content must be the root key of the data source."
+        )
+    try:
+        # it is possible that fields are optional and may not be present, so the query skips them
+        return list(query.iter_structures([source_data_def.structure]))
+    except LanguageError:
+        raise ExecutionError(
+            f"Invalid data_content {source.data_content} for generator source {source.name}. The data_content must be a field chain in the data source that represents a structure of data, not a primitive."
+        )
+
+
 def generate_content(
     evaluate: bool,
     force_overwrite: bool,
     source: Any,
     template: Any,
-    jinja_template: Template,
+    jinja_template: "Template",
     code_out_dir: str,
     test_out_dir: str,
     doc_out_dir: str,
-    source_data_def: Definition
+    source_data_def: Definition,
+    source_data_structures: Optional[list[dict]] = None
 ):
     """
     Generates file content for use by the jinja template.
@@ -158,39 +210,13 @@ def generate_content(
         test_out_dir (str): Output path for generated test files.
         doc_out_dir (str): Output path for generated doc files.
         source_data_def (Definition): The definition of the source aac data.
+        source_data_structures (Optional[list[dict]]): The data_content structures of the source data, if they've already been found.
 
     Raises:
         ExecutionError: When the content of the data source file is invalid.
     """
-    source_data_structures = []
-    if not source.data_content:
-        # we'll just use the root structure
-        source_data_structures = [source_data_def.structure]
-    else:
-        # we've got to navigate the structure to get the right data
-        content_split = source.data_content.split(".")
-        if content_split[0] != source_data_def.get_root_key():
-            raise ExecutionError(
-                f"Invalid data_content for generator source {source.name}. The data_content must be the root key of the data source."
-            )
-        else:
-            source_data_structures = [source_data_def.structure]
-            for field_name in content_split:
-                new_source_data_structures = []
-                for structure in source_data_structures:
-                    if field_name not in structure:
-                        # it is possible that fields are optional and may not be present, so continue if not present
-                        continue
-                    field_value = structure[field_name]
-                    if isinstance(field_value, list):
-                        new_source_data_structures.extend(field_value)
-                    elif isinstance(field_value, dict):
-                        new_source_data_structures.append(field_value)
-                    else:
-                        raise ExecutionError(
-                            f"Invalid data_content {source.data_content} for generator source {source.name}. The data_content must be a field chain in the data source that represents a structure of data, not a primitive."
-                        )
-                source_data_structures = new_source_data_structures
+    if source_data_structures is None:
+        source_data_structures = get_source_data_structures(source, source_data_def)
     for source_data_structure in source_data_structures:
         output_to_jinja_template(evaluate, force_overwrite, source, template, jinja_template, code_out_dir, test_out_dir, doc_out_dir, source_data_structure, source_data_def)
 
@@ -228,6 +254,9 @@ def generate_data_from_source(
         # no data for this particular generator
         return
 
+    # the data_content of each definition is the same for every template, so only navigate to it once
+    source_data_structures_by_definition: dict[int, list[dict]] = {}
+
     # go through each generator template
     for template in source.templates:
         # figure out how to load func_dict into the jinja2 environment
@@ -249,7 +278,10 @@ def generate_data_from_source(
 
         # loop over the parsed definitions and generate content for each
         for source_data_def in source_data_definitions:
-            generate_content(evaluate, force_overwrite, source, template, jinja_template, code_out_dir, test_out_dir, doc_out_dir, source_data_def)
+            if id(source_data_def) not in source_data_structures_by_definition:
+                source_data_structures_by_definition[id(source_data_def)] = get_source_data_structures(source, source_data_def)
+            source_data_structures = source_data_structures_by_definition[id(source_data_def)]
+            generate_content(evaluate, force_overwrite, source, template, jinja_template, code_out_dir, test_out_dir, doc_out_dir, source_data_def, source_data_structures)
 
 
 def process_parser_error(pe: ParserError) -> str:
@@ -560,7 +592,7 @@ def get_callable(package_name: str, file_name: str, function_name: str) -> Calla
 
 def load_template(
     template_abs_path: str, helper_functions: dict[str, Callable] = {}
-) -> Template:
+) -> "Template":
     """
     Load a jinja2 template from a file.
 
@@ -571,6 +603,8 @@ def load_template(
     Returns:
         template (Template): Jinja2 Template object.
     """
+    from jinja2 import Environment, FileSystemLoader
+
     env = Environment(loader=FileSystemLoader("/"))
     env.globals.update(helper_functions)
     template = env.get_template(template_abs_path)
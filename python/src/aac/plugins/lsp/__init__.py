@@ -0,0 +1,59 @@
+"""__init__.py module for the Language Server plugin."""
+# WARNING - DO NOT EDIT - YOUR CHANGES WILL NOT BE PROTECTED.
+# This file is auto-generated by the aac gen-plugin and may be overwritten.
+
+from os.path import join, dirname
+from aac.execute.aac_execution_result import (
+    ExecutionResult,
+    ExecutionStatus,
+)
+from aac.execute import hookimpl
+from aac.context.language_context import LanguageContext
+from aac.execute.plugin_runner import PluginRunner
+
+
+from aac.plugins.lsp.lsp_impl import plugin_name, lsp
+
+
+lsp_aac_file_name = "lsp.aac"
+
+
+def run_lsp(host, port, debounce) -> ExecutionResult:
+    """Run the AaC language server, communicating with the client over standard input and output or over TCP."""
+
+    result = ExecutionResult(plugin_name, "lsp", ExecutionStatus.SUCCESS, [])
+
+    lsp_result = lsp(host, port, debounce)
+    if not lsp_result.is_success():
+        return lsp_result
+    else:
+        result.add_messages(lsp_result.messages)
+
+    return result
+
+
+@hookimpl
+def register_plugin() -> None:
+    """
+    Returns information about the plugin.
+
+    Returns:
+        A collection of information about the plugin and what it contributes.
+    """
+
+    active_context = LanguageContext()
+    lsp_aac_file = join(dirname(__file__), lsp_aac_file_name)
+    definitions = active_context.parse_and_load(lsp_aac_file)
+
+    lsp_plugin_definition = [
+        definition for definition in definitions if definition.name == plugin_name
+    ][0]
+
+    plugin_instance = lsp_plugin_definition.instance
+    for file_to_load in plugin_instance.definition_sources:
+        active_context.parse_and_load(file_to_load)
+
+    plugin_runner = PluginRunner(plugin_definition=lsp_plugin_definition)
+    plugin_runner.add_command_callback("lsp", run_lsp)
+
+    active_context.register_plugin_runner(plugin_runner)
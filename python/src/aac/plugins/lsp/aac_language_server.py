@@ -0,0 +1,131 @@
+"""Provides the AaC language server, which publishes diagnostics for and resolves definitions in open AaC documents."""
+import asyncio
+from attr import Factory, attrib, attrs, validators
+from typing import Callable
+
+from aac.context.source_location import SourceLocation
+from aac.execute.aac_execution_result import MessageLevel
+from aac.plugins.lsp.workspace import DocumentDiagnostic, Workspace
+
+LANGUAGE_SERVER_NAME = "aac"
+
+
+@attrs(slots=True)
+class Debouncer:
+    """Delays callbacks until their key has been quiet for a while, so a burst of edits is only validated once.
+
+    Attributes:
+        delay (float): The number of seconds to wait after the last call for a key before running its callback.
+        handles (dict[str, asyncio.TimerHandle]): The scheduled callback of each key.
+    """
+
+    delay: float = attrib(validator=validators.instance_of((int, float)))
+    handles: dict[str, asyncio.TimerHandle] = attrib(default=Factory(dict), init=False)
+
+    def schedule(self, key: str, callback: Callable[[], None]) -> None:
+        """
+        Run a callback once the delay passes without another callback being scheduled for the same key.
+
+        Args:
+            key (str): The key of the callback, such as the URI of the document it validates.
+            callback (Callable[[], None]): The callback to run, which replaces any callback still waiting for the key.
+        """
+        self.cancel(key)
+
+        def run() -> None:
+            self.handles.pop(key, None)
+            callback()
+
+        self.handles[key] = asyncio.get_event_loop().call_later(self.delay, run)
+
+    def cancel(self, key: str) -> None:
+        """Cancel the callback waiting for a key, if there is one."""
+        handle = self.handles.pop(key, None)
+        if handle:
+            handle.cancel()
+
+
+def create_language_server(workspace: Workspace, debounce_delay: float):
+    """
+    Create the AaC language server.
+
+    Args:
+        workspace (Workspace): The workspace that keeps the open documents.
+        debounce_delay (float): The number of seconds to wait after the last edit to a document before validating it.
+
+    Returns:
+        The pygls language server.
+    """
+    from pygls.lsp.methods import DEFINITION, TEXT_DOCUMENT_DID_CHANGE, TEXT_DOCUMENT_DID_CLOSE, TEXT_DOCUMENT_DID_OPEN
+    from pygls.lsp.types import (
+        DefinitionParams,
+        Diagnostic,
+        DiagnosticSeverity,
+        DidChangeTextDocumentParams,
+        DidCloseTextDocumentParams,
+        DidOpenTextDocumentParams,
+        Location,
+        Position,
+        Range,
+    )
+    from pygls.server import LanguageServer
+    from pygls.uris import from_fs_path, to_fs_path
+
+    severities = {
+        MessageLevel.DEBUG: DiagnosticSeverity.Hint,
+        MessageLevel.INFO: DiagnosticSeverity.Information,
+        MessageLevel.WARNING: DiagnosticSeverity.Warning,
+        MessageLevel.ERROR: DiagnosticSeverity.Error,
+    }
+
+    def to_range(location: SourceLocation) -> Range:
+        return Range(
+            start=Position(line=location.line, character=location.column),
+            end=Position(line=location.line, character=location.column + location.span),
+        )
+
+    def to_diagnostic(diagnostic: DocumentDiagnostic) -> Diagnostic:
+        return Diagnostic(
+            range=to_range(diagnostic.location),
+            message=diagnostic.message,
+            severity=severities[diagnostic.level],
+            source=LANGUAGE_SERVER_NAME,
+        )
+
+    server = LanguageServer()
+    debouncer = Debouncer(debounce_delay)
+
+    def publish_diagnostics(uri: str) -> None:
+        path = to_fs_path(uri)
+        if path in workspace.documents:
+            server.publish_diagnostics(uri, [to_diagnostic(diagnostic) for diagnostic in workspace.validate(path)])
+
+    @server.feature(TEXT_DOCUMENT_DID_OPEN)
+    def did_open(language_server: LanguageServer, params: DidOpenTextDocumentParams) -> None:
+        workspace.open_document(to_fs_path(params.text_document.uri), params.text_document.text)
+        publish_diagnostics(params.text_document.uri)
+
+    @server.feature(TEXT_DOCUMENT_DID_CHANGE)
+    def did_change(language_server: LanguageServer, params: DidChangeTextDocumentParams) -> None:
+        uri = params.text_document.uri
+        # The workspace of the server applies the changes, whether they're incremental or the full text.
+        workspace.change_document(to_fs_path(uri), language_server.workspace.get_document(uri).source)
+        debouncer.schedule(uri, lambda: publish_diagnostics(uri))
+
+    @server.feature(TEXT_DOCUMENT_DID_CLOSE)
+    def did_close(language_server: LanguageServer, params: DidCloseTextDocumentParams) -> None:
+        uri = params.text_document.uri
+        debouncer.cancel(uri)
+        workspace.close_document(to_fs_path(uri))
+        language_server.publish_diagnostics(uri, [])
+
+    @server.feature(DEFINITION)
+    def definition(language_server: LanguageServer, params: DefinitionParams) -> list[Location]:
+        position = params.position
+        found_definition = workspace.find_definition(to_fs_path(params.text_document.uri), position.line, position.character)
+        if found_definition is None:
+            return []
+        source, location = found_definition
+        return [Location(uri=from_fs_path(source), range=to_range(location))]
+
+    return server
@@ -0,0 +1,146 @@
+"""Provides the parse state of an open AaC document, which is re-parsed one YAML document at a time as it's edited."""
+import re
+from attr import Factory, attrib, attrs, validators
+from typing import Optional
+
+from aac.context.definition import Definition
+from aac.in_out.constants import YAML_DOCUMENT_SEPARATOR
+from aac.in_out.parser import ParserError, parse
+
+YAML_DOCUMENT_SEPARATOR_PATTERN = re.compile(rf"{YAML_DOCUMENT_SEPARATOR}(\s|$)")
+
+
+@attrs(slots=True)
+class YamlDocument:
+    """A YAML document of an AaC document and the definitions parsed from it.
+
+    Attributes:
+        text (str): The text of the YAML document, starting with its document separator, if it has one.
+        start_line (int): The line of the AaC document that the YAML document starts on.
+        start_position (int): The position in the AaC document that the YAML document starts at.
+        definitions (list[Definition]): The definitions parsed from the YAML document.
+        parser_error (Optional[ParserError]): The error raised if the YAML document couldn't be parsed, with locations
+            relative to the start of the YAML document.
+    """
+
+    text: str = attrib(validator=validators.instance_of(str))
+    start_line: int = attrib(validator=validators.instance_of(int))
+    start_position: int = attrib(validator=validators.instance_of(int))
+    definitions: list[Definition] = attrib(default=Factory(list), validator=validators.instance_of(list))
+    parser_error: Optional[ParserError] = attrib(default=None)
+
+    def move_to(self, start_line: int, start_position: int) -> None:
+        """Move the YAML document and the lexemes of its definitions to a new start in the AaC document."""
+        lines, positions = start_line - self.start_line, start_position - self.start_position
+        if lines or positions:
+            # The definitions of a YAML document share a lexeme table, so it only needs to be moved once.
+            moved_tables = {}
+            for definition in self.definitions:
+                table = definition.lexemes.table
+                if id(table) not in moved_tables:
+                    moved_tables[id(table)] = table.moved(lines, positions)
+                definition.lexemes = moved_tables[id(table)].get_lexemes(definition.lexemes.indices)
+            self.start_line, self.start_position = start_line, start_position
+
+
+@attrs(slots=True)
+class DocumentState:
+    """The parse state of an open AaC document.
+
+    Attributes:
+        path (str): The path of the AaC document, which is the source of its definitions.
+        text (str): The current text of the AaC document.
+        yaml_documents (list[YamlDocument]): The YAML documents parsed from the text, in order.
+    """
+
+    path: str = attrib(validator=validators.instance_of(str))
+    text: str = attrib(default="", validator=validators.instance_of(str))
+    yaml_documents: list[YamlDocument] = attrib(default=Factory(list), init=False)
+
+    def update(self, text: str) -> tuple[list[YamlDocument], list[YamlDocument]]:
+        """
+        Update the document's text, parsing only the YAML documents that changed.
+
+        YAML documents with the same text as before are reused, and moved if text was inserted or removed above them.
+
+        Args:
+            text (str): The new text of the AaC document.
+
+        Returns:
+            The YAML documents that were parsed, and the previous YAML documents that were discarded.
+        """
+        previous_documents: dict[str, list[YamlDocument]] = {}
+        for yaml_document in self.yaml_documents:
+            previous_documents.setdefault(yaml_document.text, []).append(yaml_document)
+
+        parsed_documents = []
+        yaml_documents = []
+        for document_text, start_line, start_position in split_yaml_documents(text):
+            reusable_documents = previous_documents.get(document_text)
+            if reusable_documents:
+                yaml_document = reusable_documents.pop(0)
+                yaml_document.move_to(start_line, start_position)
+            else:
+                yaml_document = parse_yaml_document(self.path, document_text, start_line, start_position)
+                parsed_documents.append(yaml_document)
+            yaml_documents.append(yaml_document)
+
+        self.text = text
+        self.yaml_documents = yaml_documents
+        discarded_documents = [yaml_document for yaml_documents in previous_documents.values() for yaml_document in yaml_documents]
+        return parsed_documents, discarded_documents
+
+    def get_definitions(self) -> list[Definition]:
+        """Return the definitions parsed from the document, in order."""
+        return [definition for yaml_document in self.yaml_documents for definition in yaml_document.definitions]
+
+
+def split_yaml_documents(text: str) -> list[tuple[str, int, int]]:
+    """
+    Split the text of an AaC document into its YAML documents.
+
+    Args:
+        text (str): The text of the AaC document.
+
+    Returns:
+        The text of each YAML document, which starts with its document separator if it has one, followed by the line
+        and position that it starts at.
+    """
+    yaml_documents = []
+    document_lines: list[str] = []
+    start_line = start_position = position = 0
+    for line_number, line in enumerate(text.splitlines(keepends=True)):
+        if YAML_DOCUMENT_SEPARATOR_PATTERN.match(line) and document_lines:
+            yaml_documents.append(("".join(document_lines), start_line, start_position))
+            document_lines, start_line, start_position = [], line_number, position
+        document_lines.append(line)
+        position += len(line)
+    if document_lines:
+        yaml_documents.append(("".join(document_lines), start_line, start_position))
+    return yaml_documents
+
+
+def parse_yaml_document(path: str, text: str, start_line: int, start_position: int) -> YamlDocument:
+    """
+    Parse a YAML document of an AaC document on its own.
+
+    Args:
+        path (str): The path of the AaC document.
+        text (str): The text of the YAML document.
+        start_line (int): The line of the AaC document that the YAML document starts on.
+        start_position (int): The position in the AaC document that the YAML document starts at.
+
+    Returns:
+        The parsed YAML document.
+    """
+    # The YAML document is parsed as if it started the AaC document, and then moved to where it starts, so each edit
+    # only parses the text of the YAML documents that changed.
+    yaml_document = YamlDocument(text, 0, 0)
+    if YAML_DOCUMENT_SEPARATOR_PATTERN.sub("", text, count=1).strip():
+        try:
+            # Content without a line break would be taken for a file path.
+            yaml_document.definitions = parse(text if "\n" in text else f"{text}\n", path)
+        except ParserError as error:
+            yaml_document.parser_error = error
+    yaml_document.move_to(start_line, start_position)
+    return yaml_document
@@ -0,0 +1,42 @@
+"""The AaC Language Server plugin implementation module."""
+# NOTE: It is safe to edit this file.
+# This file is only initially generated by aac gen-plugin, and it won't be overwritten if the file already exists.
+
+import logging
+
+from aac.execute.aac_execution_result import (
+    ExecutionResult,
+    ExecutionStatus,
+    ExecutionMessage,
+    MessageLevel,
+)
+from aac.plugins.lsp.aac_language_server import create_language_server
+from aac.plugins.lsp.workspace import Workspace
+
+plugin_name = "Language Server"
+
+
+def lsp(host: str, port: int, debounce: int) -> ExecutionResult:
+    """
+    Business logic for the lsp command.
+
+    Args:
+        host (str): The address to listen on when communicating over TCP.
+        port (int): The port to listen on for a TCP client, or 0 to communicate over standard input and output.
+        debounce (int): The number of milliseconds to wait after the last edit to a document before checking it.
+
+    Returns:
+        ExecutionResult: The result of the lsp command once the client disconnects.
+    """
+    server = create_language_server(Workspace(), debounce / 1000)
+    if port:
+        logging.info(f"Starting the AaC language server on {host}:{port}.")
+        server.start_tcp(host, port)
+        message = f"Stopped the AaC language server on {host}:{port}."
+        return ExecutionResult(plugin_name, "lsp", ExecutionStatus.SUCCESS, [ExecutionMessage(message, MessageLevel.INFO, None, None)])
+
+    # Standard output carries the protocol, and is closed when the client exits, so nothing else can be written to it.
+    logging.info("Starting the AaC language server on standard input and output.")
+    server.start_io()
+    logging.info("Stopped the AaC language server.")
+    return ExecutionResult(plugin_name, "lsp", ExecutionStatus.SUCCESS, [])
@@ -0,0 +1,335 @@
+"""Provides the AaC documents open in a language server client, loaded into the warm LanguageContext."""
+from attr import Factory, attrib, attrs, validators
+from typing import Callable, Optional
+
+from aac.context.definition import Definition
+from aac.context.definition_parser import DefinitionParser
+from aac.context.language_context import LanguageContext
+from aac.context.language_error import LanguageError
+from aac.context.lexeme_table import find_first_lexeme
+from aac.context.source_location import SourceLocation
+from aac.execute.aac_execution_result import ExecutionResult, MessageLevel
+from aac.plugins.check.check_aac_impl import (
+    CheckPlans,
+    check_context_constraint,
+    check_definitions,
+    collect_all_constraints_by_name,
+    collect_definition_dependencies,
+)
+from aac.plugins.check.check_state import (
+    DefinitionCheckState,
+    DependencyFingerprints,
+    get_absolute_results,
+    get_definition_key,
+    get_relative_results,
+)
+from aac.plugins.lsp.document_state import DocumentState, YamlDocument
+
+DOCUMENT_START = SourceLocation(0, 0, 0, 0)
+
+
+@attrs(slots=True)
+class DocumentDiagnostic:
+    """A problem found in an open document.
+
+    Attributes:
+        message (str): The description of the problem.
+        level (MessageLevel): The severity of the problem.
+        location (SourceLocation): The location of the problem in the document.
+    """
+
+    message: str = attrib(validator=validators.instance_of(str))
+    level: MessageLevel = attrib(validator=validators.instance_of(MessageLevel))
+    location: SourceLocation = attrib(validator=validators.instance_of(SourceLocation))
+
+
+@attrs(slots=True)
+class OpenDocument:
+    """An open document and the state that's kept between its edits.
+
+    Attributes:
+        state (DocumentState): The parse state of the document.
+        pending_text (Optional[str]): The text of the latest edit, until the document is parsed again.
+        load_errors (dict[int, LanguageError]): The error raised while loading each definition that couldn't be loaded, by its id.
+        check_states (dict[str, DefinitionCheckState]): The constraint results of each definition by its definition key.
+    """
+
+    state: DocumentState = attrib(validator=validators.instance_of(DocumentState))
+    pending_text: Optional[str] = attrib(default=None)
+    load_errors: dict[int, LanguageError] = attrib(default=Factory(dict), init=False)
+    check_states: dict[str, DefinitionCheckState] = attrib(default=Factory(dict), init=False)
+
+
+@attrs(slots=True)
+class Workspace:
+    """The AaC documents open in a language server client.
+
+    The definitions of the open documents are loaded into the LanguageContext, so they can refer to each other and to
+    the AaC language. Edits are only parsed when a document's diagnostics or definitions are needed, and only the
+    YAML documents that changed are parsed and loaded again.
+
+    Attributes:
+        documents (dict[str, OpenDocument]): The open documents by their path.
+    """
+
+    documents: dict[str, OpenDocument] = attrib(default=Factory(dict), init=False)
+
+    def open_document(self, path: str, text: str) -> None:
+        """
+        Open a document.
+
+        Args:
+            path (str): The path of the document.
+            text (str): The text of the document.
+        """
+        if path in self.documents:
+            self.close_document(path)
+        self.documents[path] = OpenDocument(DocumentState(path), text)
+
+    def change_document(self, path: str, text: str) -> None:
+        """
+        Record an edit to a document, which is parsed the next time the document is used.
+
+        Args:
+            path (str): The path of the document.
+            text (str): The full text of the document after the edit.
+        """
+        if path not in self.documents:
+            self.open_document(path, text)
+        self.documents[path].pending_text = text
+
+    def close_document(self, path: str) -> None:
+        """Close a document and unload its definitions."""
+        document = self.documents.pop(path, None)
+        if document:
+            _unload_definitions(document.state.get_definitions())
+
+    def get_document_state(self, path: str) -> Optional[DocumentState]:
+        """
+        Return the parse state of an open document, parsing its latest edit first.
+
+        Args:
+            path (str): The path of the document.
+
+        Returns:
+            The parse state of the document, or None if the document isn't open.
+        """
+        document = self.documents.get(path)
+        if document is None:
+            return None
+
+        if document.pending_text is not None:
+            parsed_documents, discarded_documents = document.state.update(document.pending_text)
+            document.pending_text = None
+
+            _unload_definitions([definition for yaml_document in discarded_documents for definition in yaml_document.definitions])
+
+            # Definitions that failed to load before are retried, since the edit may have fixed what they depend on.
+            parsed_definitions = {id(definition) for yaml_document in parsed_documents for definition in yaml_document.definitions}
+            definitions_to_load = [
+                definition for definition in document.state.get_definitions() if id(definition) in parsed_definitions or id(definition) in document.load_errors
+            ]
+            document.load_errors = _load_definitions(definitions_to_load)
+        return document.state
+
+    def validate(self, path: str) -> list[DocumentDiagnostic]:
+        """
+        Check an open document with the constraints of the check command.
+
+        The constraint results of a definition are reused until its content or anything the results depend on changes,
+        so only the definitions affected by an edit are checked again.
+
+        Args:
+            path (str): The path of the document.
+
+        Returns:
+            The problems found in the document, which is empty if the document isn't open.
+        """
+        state = self.get_document_state(path)
+        if state is None:
+            return []
+
+        document = self.documents[path]
+        diagnostics, loaded_definitions = _get_load_diagnostics(state, document.load_errors)
+        all_constraints_by_name = collect_all_constraints_by_name()
+        diagnostics.extend(_get_context_constraint_diagnostics(path, loaded_definitions, all_constraints_by_name))
+
+        check_plans = CheckPlans(all_constraints_by_name)
+        fingerprints = DependencyFingerprints()
+        check_states = {}
+        for definition in loaded_definitions:
+            definition_key = get_definition_key(definition)
+            try:
+                check_state, constraint_results = _check_definition(definition, document.check_states.get(definition_key), check_plans, fingerprints)
+            except LanguageError as error:
+                diagnostics.append(DocumentDiagnostic(error.message, MessageLevel.ERROR, _get_definition_location(definition)))
+                continue
+            check_states[definition_key] = check_state
+            for results in constraint_results.values():
+                diagnostics.extend(_get_result_diagnostics(path, results, _get_definition_location(definition)))
+        document.check_states = check_states
+        return diagnostics
+
+    def find_definition(self, path: str, line: int, column: int) -> Optional[tuple[str, SourceLocation]]:
+        """
+        Find the definition that the value at a location of an open document refers to.
+
+        Values are looked up by fully qualified name first, and then by name.
+
+        Args:
+            path (str): The path of the document.
+            line (int): The line of the value.
+            column (int): The column of any character of the value.
+
+        Returns:
+            The source of the definition and the location of its name, or None if the value doesn't refer to a definition.
+        """
+        state = self.get_document_state(path)
+        if state is None:
+            return None
+
+        value = _find_value_at(state, line, column)
+        if value is None:
+            return None
+
+        context = LanguageContext()
+        name = value.strip().removesuffix("[]").strip()
+        target = context.context_instance.fully_qualified_name_to_definition.get(name)
+        if target is None:
+            definitions = context.get_definitions_by_name(name)
+            target = definitions[0] if definitions else None
+        if target is None:
+            return None
+        return target.source.uri, _get_definition_location(target)
+
+
+def _get_load_diagnostics(state: DocumentState, load_errors: dict[int, LanguageError]) -> tuple[list[DocumentDiagnostic], list[Definition]]:
+    """Return the diagnostics of the YAML that couldn't be parsed and the definitions that couldn't be loaded, and the loaded definitions."""
+    diagnostics = []
+    loaded_definitions = []
+    for yaml_document in state.yaml_documents:
+        if yaml_document.parser_error:
+            diagnostics.append(_get_parser_error_diagnostic(yaml_document))
+        for definition in yaml_document.definitions:
+            load_error = load_errors.get(id(definition))
+            if load_error:
+                diagnostics.append(DocumentDiagnostic(load_error.message, MessageLevel.ERROR, _get_definition_location(definition)))
+            elif _is_loaded(definition):
+                loaded_definitions.append(definition)
+    return diagnostics, loaded_definitions
+
+
+def _get_context_constraint_diagnostics(
+    path: str, definitions: list[Definition], all_constraints_by_name: dict[str, Callable]
+) -> list[DocumentDiagnostic]:
+    """Return the diagnostics of the context constraints of every plugin, which are evaluated against the whole context on every check."""
+    diagnostics = []
+    for plugin in LanguageContext().get_definitions_by_root("plugin"):
+        for context_constraint in plugin.instance.context_constraints:
+            for results in check_context_constraint(context_constraint, definitions, all_constraints_by_name, {}).values():
+                diagnostics.extend(_get_result_diagnostics(path, results, DOCUMENT_START))
+    return diagnostics
+
+
+def _check_definition(
+    definition: Definition, check_state: Optional[DefinitionCheckState], check_plans: CheckPlans, fingerprints: DependencyFingerprints
+) -> tuple[DefinitionCheckState, dict[str, list[ExecutionResult]]]:
+    """
+    Check a definition with the schema constraints, reusing the results of its last check if nothing they depend on changed.
+
+    Returns:
+        The check state to keep for the definition, and its constraint results located in the document.
+    """
+    if check_state and fingerprints.is_current(check_state.dependencies):
+        # Most definitions pass every constraint, so only the results of the others need their locations moved.
+        constraint_results = check_state.constraint_results
+        if not _is_success(constraint_results):
+            constraint_results = get_absolute_results(definition, constraint_results)
+        return check_state, constraint_results
+
+    constraint_results = check_definitions([definition], check_plans)[0]
+    dependencies = fingerprints.get_fingerprints(collect_definition_dependencies(definition, check_plans))
+    return DefinitionCheckState(dependencies, get_relative_results(definition, constraint_results)), constraint_results
+
+
+def _is_success(constraint_results: dict[str, list[ExecutionResult]]) -> bool:
+    """Return True if every constraint result is a success."""
+    return all(result.is_success() for results in constraint_results.values() for result in results)
+
+
+def _find_value_at(state: DocumentState, line: int, column: int) -> Optional[str]:
+    """Return the value of the lexeme at a location of a document."""
+    for yaml_document in state.yaml_documents:
+        for definition in yaml_document.definitions:
+            for lexeme in definition.lexemes:
+                location = lexeme.location
+                if location.line == line and location.column <= column <= location.column + location.span:
+                    return lexeme.value
+    return None
+
+
+def _load_definitions(definitions: list[Definition]) -> dict[int, LanguageError]:
+    """
+    Load definitions into the LanguageContext, skipping the definitions that can't be loaded.
+
+    Returns:
+        The error raised while loading each definition that was skipped, by the definition's id.
+    """
+    context = LanguageContext()
+    load_errors = {}
+    while definitions:
+        try:
+            DefinitionParser().load_definitions(context, definitions)
+            break
+        except LanguageError as error:
+            # The definitions are loaded in order, so the first one that isn't loaded is the one that failed.
+            failed_index = next((index for index, definition in enumerate(definitions) if not _is_loaded(definition)), 0)
+            load_errors[id(definitions[failed_index])] = error
+            definitions = definitions[failed_index + 1:]
+    return load_errors
+
+
+def _unload_definitions(definitions: list[Definition]) -> None:
+    """Remove the definitions that were loaded into the LanguageContext."""
+    LanguageContext().remove_definitions([definition for definition in definitions if _is_loaded(definition)])
+
+
+def _is_loaded(definition: Definition) -> bool:
+    """Return True if the definition itself, rather than one with the same name, is loaded into the LanguageContext."""
+    context = LanguageContext()
+    return context.context_instance.fully_qualified_name_to_definition.get(context.get_lookup_name(definition)) is definition
+
+
+def _get_definition_location(definition: Definition) -> SourceLocation:
+    """Return the location of a definition's name, or of its first lexeme if the name can't be found."""
+    name_lexeme = find_first_lexeme(definition.lexemes, definition.name) if definition.name else None
+    if name_lexeme:
+        return name_lexeme.location
+    return definition.lexemes[0].location if definition.lexemes else DOCUMENT_START
+
+
+def _get_parser_error_diagnostic(yaml_document: YamlDocument) -> DocumentDiagnostic:
+    """Return the diagnostic of a YAML document that couldn't be parsed."""
+    error = yaml_document.parser_error
+    mark = getattr(error.yaml_error, "problem_mark", None)
+    if mark is not None:
+        location = SourceLocation(yaml_document.start_line + mark.line, mark.column, yaml_document.start_position + mark.index, 1)
+    else:
+        location = SourceLocation(yaml_document.start_line, 0, yaml_document.start_position, 0)
+    # The first error describes the problem, and the others repeat its location and content.
+    message = str(error.errors[0]) if error.errors else f"The YAML in '{error.source}' couldn't be parsed."
+    return DocumentDiagnostic(message, MessageLevel.ERROR, location)
+
+
+def _get_result_diagnostics(path: str, results: list[ExecutionResult], default_location: SourceLocation) -> list[DocumentDiagnostic]:
+    """Return the diagnostics of the failed constraint results, placing the messages without a location in the document at the default location."""
+    diagnostics = []
+    for result in results:
+        if result.is_success():
+            continue
+        for message in result.messages:
+            if message.source not in [None, path]:
+                continue
+            location = message.location if message.location and message.source == path else default_location
+            diagnostics.append(DocumentDiagnostic(message.message, message.level, location))
+    return diagnostics
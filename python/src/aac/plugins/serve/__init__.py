@@ -0,0 +1,59 @@
+"""__init__.py module for the Serve plugin."""
+# WARNING - DO NOT EDIT - YOUR CHANGES WILL NOT BE PROTECTED.
+# This file is auto-generated by the aac gen-plugin and may be overwritten.
+
+from os.path import join, dirname
+from aac.execute.aac_execution_result import (
+    ExecutionResult,
+    ExecutionStatus,
+)
+from aac.execute import hookimpl
+from aac.context.language_context import LanguageContext
+from aac.execute.plugin_runner import PluginRunner
+
+
+from aac.plugins.serve.serve_impl import plugin_name, serve
+
+
+serve_aac_file_name = "serve.aac"
+
+
+def run_serve(host, port) -> ExecutionResult:
+    """Run a server that keeps the AaC language loaded and runs the check, generate and print-defs commands of aac clients."""
+
+    result = ExecutionResult(plugin_name, "serve", ExecutionStatus.SUCCESS, [])
+
+    serve_result = serve(host, port)
+    if not serve_result.is_success():
+        return serve_result
+    else:
+        result.add_messages(serve_result.messages)
+
+    return result
+
+
+@hookimpl
+def register_plugin() -> None:
+    """
+    Returns information about the plugin.
+
+    Returns:
+        A collection of information about the plugin and what it contributes.
+    """
+
+    active_context = LanguageContext()
+    serve_aac_file = join(dirname(__file__), serve_aac_file_name)
+    definitions = active_context.parse_and_load(serve_aac_file)
+
+    serve_plugin_definition = [
+        definition for definition in definitions if definition.name == plugin_name
+    ][0]
+
+    plugin_instance = serve_plugin_definition.instance
+    for file_to_load in plugin_instance.definition_sources:
+        active_context.parse_and_load(file_to_load)
+
+    plugin_runner = PluginRunner(plugin_definition=serve_plugin_definition)
+    plugin_runner.add_command_callback("serve", run_serve)
+
+    active_context.register_plugin_runner(plugin_runner)
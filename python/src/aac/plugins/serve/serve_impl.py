@@ -0,0 +1,177 @@
+"""The AaC Serve plugin implementation module."""
+# NOTE: It is safe to edit this file.
+# This file is only initially generated by aac gen-plugin, and it won't be overwritten if the file already exists.
+
+import os
+import secrets
+import socket
+import threading
+from click import ClickException, secho
+from typing import Optional
+
+from aac import __version__
+from aac.context.definition import Definition
+from aac.context.language_context import LanguageContext
+from aac.execute.aac_execution_result import (
+    ExecutionResult,
+    ExecutionStatus,
+    ExecutionMessage,
+    MessageLevel,
+)
+from aac.execute.server_client import (
+    FORWARDED_COMMANDS,
+    NO_PROMPT_FORWARDED_COMMANDS,
+    ServerInfo,
+    remove_server_info,
+    result_to_dict,
+    write_server_info,
+)
+
+plugin_name = "Serve"
+
+# The language context and the working directory are shared by every request, so commands are run one at a time.
+_command_lock = threading.Lock()
+
+
+def serve(host: str, port: int) -> ExecutionResult:
+    """
+    Business logic for the serve command.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on, or 0 to listen on any free port.
+
+    Returns:
+        ExecutionResult: The result of the serve command once the server stops.
+    """
+    import uvicorn
+
+    token = secrets.token_urlsafe()
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.bind((host, port))
+    bound_host, bound_port = server_socket.getsockname()[:2]
+
+    server_info = ServerInfo(f"http://{bound_host}:{bound_port}", token, os.getpid(), __version__)
+    write_server_info(server_info)
+    try:
+        secho(f"Serving AaC {__version__} at {server_info.url}")
+        server = uvicorn.Server(uvicorn.Config(create_app(token), log_level="warning"))
+        server.run(sockets=[server_socket])
+    finally:
+        remove_server_info(server_info)
+        server_socket.close()
+
+    message = ExecutionMessage(f"Stopped serving at {server_info.url}.", MessageLevel.INFO, None, None)
+    return ExecutionResult(plugin_name, "serve", ExecutionStatus.SUCCESS, [message])
+
+
+def create_app(token: str):
+    """
+    Create the web application that serves AaC commands and definitions.
+
+    Args:
+        token (str): The secret that clients must send as a bearer token.
+
+    Returns:
+        The FastAPI application.
+    """
+    from fastapi import Depends, FastAPI, Header, HTTPException
+    from pydantic import BaseModel
+
+    class CommandRequest(BaseModel):
+        arguments: list[str] = []
+        working_directory: Optional[str] = None
+
+    def authorize(authorization: Optional[str] = Header(None)) -> None:
+        if not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+            raise HTTPException(status_code=401, detail="Invalid token.")
+
+    app = FastAPI(title="AaC", version=__version__, dependencies=[Depends(authorize)])
+
+    @app.get("/health")
+    def get_health() -> dict:
+        return {"version": __version__}
+
+    @app.post("/commands/{command_name}")
+    def post_command(command_name: str, request: CommandRequest) -> dict:
+        if command_name not in FORWARDED_COMMANDS + NO_PROMPT_FORWARDED_COMMANDS:
+            raise HTTPException(status_code=404, detail=f"The command '{command_name}' isn't served.")
+        return result_to_dict(run_command(command_name, request.arguments, request.working_directory))
+
+    @app.get("/definitions")
+    def get_definitions(name: Optional[str] = None, root: Optional[str] = None) -> list[dict]:
+        return find_definitions(name, root)
+
+    return app
+
+
+def run_command(command_name: str, arguments: list[str], working_directory: Optional[str] = None) -> ExecutionResult:
+    """
+    Run an aac command in the warm language context, as if it was run from the command line.
+
+    Definitions that the command loads are removed from the context afterwards, so every command sees the same language.
+
+    Args:
+        command_name (str): The name of the command to run.
+        arguments (list[str]): The command line arguments of the command.
+        working_directory (Optional[str]): The directory to run the command in, which defaults to the server's.
+
+    Returns:
+        ExecutionResult: The result of the command.
+    """
+    from aac.execute.command_line import cli
+
+    command = cli.get_command(None, command_name)
+    if command is None:
+        message = ExecutionMessage(f"No such command '{command_name}'.", MessageLevel.ERROR, None, None)
+        return ExecutionResult(plugin_name, command_name, ExecutionStatus.GENERAL_FAILURE, [message])
+
+    with _command_lock:
+        context = LanguageContext()
+        previous_definitions = {id(definition) for definition in context.get_definitions()}
+        previous_working_directory = os.getcwd()
+        try:
+            os.chdir(working_directory or previous_working_directory)
+            with command.make_context(command_name, list(arguments)) as click_context:
+                return command.invoke(click_context)
+        except ClickException as e:
+            message = ExecutionMessage(e.format_message(), MessageLevel.ERROR, None, None)
+            return ExecutionResult(plugin_name, command_name, ExecutionStatus.GENERAL_FAILURE, [message])
+        except Exception as e:
+            message = ExecutionMessage(f"The command '{command_name}' failed: {e}", MessageLevel.ERROR, None, None)
+            return ExecutionResult(plugin_name, command_name, ExecutionStatus.GENERAL_FAILURE, [message])
+        finally:
+            os.chdir(previous_working_directory)
+            context.remove_definitions([definition for definition in context.get_definitions() if id(definition) not in previous_definitions])
+
+
+def find_definitions(name: Optional[str] = None, root: Optional[str] = None) -> list[dict]:
+    """
+    Return the definitions in the language context, optionally only those with a name or root key.
+
+    Args:
+        name (Optional[str]): The name of the definitions to return.
+        root (Optional[str]): The root key of the definitions to return.
+
+    Returns:
+        A JSON compatible representation of each matching definition.
+    """
+    context = LanguageContext()
+    if name is not None:
+        definitions = context.get_definitions_by_name(name)
+    elif root is not None:
+        definitions = context.get_definitions_by_root(root)
+    else:
+        definitions = context.get_definitions()
+    return [_definition_to_dict(definition) for definition in definitions if root is None or definition.get_root_key() == root]
+
+
+def _definition_to_dict(definition: Definition) -> dict:
+    return {
+        "name": definition.name,
+        "package": definition.package,
+        "root": definition.get_root_key(),
+        "source": definition.source.uri,
+        "content": definition.content,
+    }
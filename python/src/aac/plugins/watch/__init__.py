@@ -0,0 +1,59 @@
+"""__init__.py module for the Watch plugin."""
+# WARNING - DO NOT EDIT - YOUR CHANGES WILL NOT BE PROTECTED.
+# This file is auto-generated by the aac gen-plugin and may be overwritten.
+
+from os.path import join, dirname
+from aac.execute.aac_execution_result import (
+    ExecutionResult,
+    ExecutionStatus,
+)
+from aac.execute import hookimpl
+from aac.context.language_context import LanguageContext
+from aac.execute.plugin_runner import PluginRunner
+
+
+from aac.plugins.watch.watch_impl import plugin_name, watch
+
+
+watch_aac_file_name = "watch.aac"
+
+
+def run_watch(aac_file, generator_file, code_output, test_output, doc_output, fail_on_warn, poll_interval, polling) -> ExecutionResult:
+    """Watch an AaC model and check it, then optionally generate content from it, every time its files change."""
+
+    result = ExecutionResult(plugin_name, "watch", ExecutionStatus.SUCCESS, [])
+
+    watch_result = watch(aac_file, generator_file, code_output, test_output, doc_output, fail_on_warn, poll_interval, polling)
+    if not watch_result.is_success():
+        return watch_result
+    else:
+        result.add_messages(watch_result.messages)
+
+    return result
+
+
+@hookimpl
+def register_plugin() -> None:
+    """
+    Returns information about the plugin.
+
+    Returns:
+        A collection of information about the plugin and what it contributes.
+    """
+
+    active_context = LanguageContext()
+    watch_aac_file = join(dirname(__file__), watch_aac_file_name)
+    definitions = active_context.parse_and_load(watch_aac_file)
+
+    watch_plugin_definition = [
+        definition for definition in definitions if definition.name == plugin_name
+    ][0]
+
+    plugin_instance = watch_plugin_definition.instance
+    for file_to_load in plugin_instance.definition_sources:
+        active_context.parse_and_load(file_to_load)
+
+    plugin_runner = PluginRunner(plugin_definition=watch_plugin_definition)
+    plugin_runner.add_command_callback("watch", run_watch)
+
+    active_context.register_plugin_runner(plugin_runner)
@@ -0,0 +1,232 @@
+"""Provides watchers that wait for files to change, using inotify on Linux and polling everywhere else."""
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+from attr import Factory, attrib, attrs, validators
+from os import path
+from select import select
+from time import monotonic, sleep
+from typing import Optional, Union
+
+# The inotify events that mean a watched file may have new content. Directories are watched rather than files, so
+# files that editors save by replacing them are still watched afterwards.
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+INOTIFY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+# Editors often write a file in several steps, so changes are collected until the files have been quiet for a moment.
+SETTLE_SECONDS = 0.1
+
+
+@attrs(slots=True)
+class PollingFileWatcher:
+    """Waits for files to change by periodically comparing their modification times and sizes.
+
+    Attributes:
+        poll_interval (float): The number of seconds between checks for changes.
+        file_stats (dict[str, Optional[tuple[int, int]]]): The last known modification time and size of each watched file,
+            or None for watched files that don't exist.
+    """
+
+    poll_interval: float = attrib(validator=validators.instance_of((int, float)))
+    file_stats: dict[str, Optional[tuple[int, int]]] = attrib(default=Factory(dict), init=False)
+
+    def watch(self, files: list[str]) -> None:
+        """
+        Watch the files, and stop watching any other files.
+
+        Files that were already watched keep their last known state, so changes made since then are still reported.
+
+        Args:
+            files (list[str]): The paths of the files to watch.
+        """
+        self.file_stats = {file: self.file_stats[file] if file in self.file_stats else _get_file_stat(file) for file in files}
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> list[str]:
+        """
+        Wait until any of the watched files change.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to wait, or None to wait until a file changes.
+
+        Returns:
+            The watched files that changed, which is empty if the timeout expired first.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        changed_files = self._get_changed_files()
+        while not changed_files and (deadline is None or monotonic() < deadline):
+            sleep(self.poll_interval if deadline is None else max(0, min(self.poll_interval, deadline - monotonic())))
+            changed_files = self._get_changed_files()
+
+        while changed_files:
+            sleep(SETTLE_SECONDS)
+            settled_files = self._get_changed_files()
+            if not settled_files:
+                break
+            changed_files.extend(file for file in settled_files if file not in changed_files)
+        return changed_files
+
+    def close(self) -> None:
+        """Stop watching the files."""
+        self.file_stats = {}
+
+    def _get_changed_files(self) -> list[str]:
+        changed_files = []
+        for file, file_stat in self.file_stats.items():
+            current_file_stat = _get_file_stat(file)
+            if current_file_stat != file_stat:
+                self.file_stats[file] = current_file_stat
+                changed_files.append(file)
+        return changed_files
+
+
+@attrs(slots=True)
+class InotifyFileWatcher:
+    """Waits for files to change using Linux inotify events for the directories that contain them.
+
+    Attributes:
+        libc (ctypes.CDLL): The C library that provides the inotify functions.
+        file_descriptor (int): The inotify instance's file descriptor.
+        files (set[str]): The watched files.
+        directory_to_watch_descriptor (dict[str, int]): The inotify watch of each directory that contains a watched file.
+    """
+
+    libc: ctypes.CDLL = attrib()
+    file_descriptor: int = attrib(validator=validators.instance_of(int))
+    files: set[str] = attrib(default=Factory(set), init=False)
+    directory_to_watch_descriptor: dict[str, int] = attrib(default=Factory(dict), init=False)
+
+    @classmethod
+    def create(cls) -> "InotifyFileWatcher":
+        """
+        Create an inotify instance to watch files with.
+
+        Returns:
+            The new file watcher.
+
+        Raises:
+            OSError: If inotify isn't available on this platform.
+        """
+        library_name = ctypes.util.find_library("c")
+        if not library_name or not hasattr(os, "O_NONBLOCK"):
+            raise OSError("inotify requires the C library of a Linux system")
+
+        libc = ctypes.CDLL(library_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(f"'{library_name}' doesn't provide inotify")
+
+        file_descriptor = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if file_descriptor < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"Failed to initialize inotify: {os.strerror(errno)}")
+        return cls(libc, file_descriptor)
+
+    def watch(self, files: list[str]) -> None:
+        """
+        Watch the files, and stop watching any other files.
+
+        Args:
+            files (list[str]): The paths of the files to watch.
+
+        Raises:
+            OSError: If a directory of the files can't be watched.
+        """
+        self.files = set(files)
+        directories = {path.dirname(file) for file in self.files}
+        for directory in set(self.directory_to_watch_descriptor) - directories:
+            self.libc.inotify_rm_watch(self.file_descriptor, self.directory_to_watch_descriptor.pop(directory))
+        for directory in directories - set(self.directory_to_watch_descriptor):
+            watch_descriptor = self.libc.inotify_add_watch(self.file_descriptor, os.fsencode(directory), INOTIFY_MASK)
+            if watch_descriptor < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, f"Failed to watch '{directory}': {os.strerror(errno)}")
+            self.directory_to_watch_descriptor[directory] = watch_descriptor
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> list[str]:
+        """
+        Wait until any of the watched files change.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to wait, or None to wait until a file changes.
+
+        Returns:
+            The watched files that changed, which is empty if the timeout expired first.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        changed_files: list[str] = []
+        while not changed_files:
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            changed_files = self._read_changed_files(remaining)
+
+        while changed_files:
+            settled_files = self._read_changed_files(SETTLE_SECONDS)
+            if not settled_files:
+                break
+            changed_files.extend(file for file in settled_files if file not in changed_files)
+        return changed_files
+
+    def close(self) -> None:
+        """Stop watching the files and release the inotify instance."""
+        os.close(self.file_descriptor)
+        self.files = set()
+        self.directory_to_watch_descriptor = {}
+
+    def _read_changed_files(self, timeout: Optional[float]) -> list[str]:
+        readable, _, _ = select([self.file_descriptor], [], [], timeout)
+        if not readable:
+            return []
+
+        watch_descriptor_to_directory = {descriptor: directory for directory, descriptor in self.directory_to_watch_descriptor.items()}
+        changed_files = []
+        try:
+            buffer = os.read(self.file_descriptor, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, _, _, name_length = INOTIFY_EVENT_HEADER.unpack_from(buffer, offset)
+            offset += INOTIFY_EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset: offset + name_length].rstrip(b"\0"))
+            offset += name_length
+            if watch_descriptor in watch_descriptor_to_directory:
+                file = path.join(watch_descriptor_to_directory[watch_descriptor], name)
+                if file in self.files and file not in changed_files:
+                    changed_files.append(file)
+        return changed_files
+
+
+def create_file_watcher(poll_interval: float, polling: bool = False) -> Union[InotifyFileWatcher, PollingFileWatcher]:
+    """
+    Create the best file watcher available on this platform.
+
+    Args:
+        poll_interval (float): The number of seconds between checks for changes when files are polled.
+        polling (bool): Poll the files even if file system notifications are available.
+
+    Returns:
+        An inotify file watcher on Linux, unless polling is requested, or a polling file watcher otherwise.
+    """
+    if not polling:
+        try:
+            return InotifyFileWatcher.create()
+        except OSError as error:
+            logging.info(f"Polling for changes because file system notifications aren't available: {error}")
+    return PollingFileWatcher(poll_interval)
+
+
+def _get_file_stat(file: str) -> Optional[tuple[int, int]]:
+    try:
+        file_stat = os.stat(file)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
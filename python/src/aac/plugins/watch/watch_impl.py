@@ -0,0 +1,130 @@
+"""The AaC Watch plugin implementation module."""
+# NOTE: It is safe to edit this file.
+# This file is only initially generated by aac gen-plugin, and it won't be overwritten if the file already exists.
+
+from attr import Factory, attrib, attrs, validators
+from click import secho
+from os import path
+from typing import Optional
+
+from aac.context.definition import Definition
+from aac.context.language_context import LanguageContext
+from aac.context.language_error import LanguageError
+from aac.execute.aac_execution_result import (
+    ExecutionResult,
+    ExecutionStatus,
+    ExecutionMessage,
+    MessageLevel,
+)
+from aac.plugins.check.check_aac_impl import check
+from aac.plugins.generate.generate_impl import generate
+from aac.plugins.watch.file_watcher import create_file_watcher
+
+plugin_name = "Watch"
+
+
+@attrs(slots=True)
+class ModelWatch:
+    """Runs check, and optionally generate, against a model whose definitions are reloaded into the warm LanguageContext on each run.
+
+    Attributes:
+        aac_file (str): The AaC file with the model content.
+        generator_file (Optional[str]): The AaC file with the generator definition to run after each successful check.
+        code_output (Optional[str]): The location to output generated code.
+        test_output (Optional[str]): The location to output generated test code.
+        doc_output (Optional[str]): The location to output generated documentation.
+        fail_on_warn (bool): Treat constraint warnings as failures.
+        loaded_definitions (list[Definition]): The definitions that the last run loaded into the LanguageContext.
+    """
+
+    aac_file: str = attrib(validator=validators.instance_of(str))
+    generator_file: Optional[str] = attrib(default=None)
+    code_output: Optional[str] = attrib(default=None)
+    test_output: Optional[str] = attrib(default=None)
+    doc_output: Optional[str] = attrib(default=None)
+    fail_on_warn: bool = attrib(default=False)
+    loaded_definitions: list[Definition] = attrib(default=Factory(list), init=False)
+
+    def run(self) -> ExecutionResult:
+        """
+        Unload the definitions of the previous run, then check the model and generate content from it if the check succeeds.
+
+        The AaC language, plugins and parsed files stay in memory between runs, so only the files that changed are parsed
+        again and only the definitions that changed are checked again.
+
+        Returns:
+            ExecutionResult: The result of the check, or of the generate command if it ran.
+        """
+        context = LanguageContext()
+        context.remove_definitions(self.loaded_definitions)
+        self.loaded_definitions = []
+
+        previous_definitions = {id(definition) for definition in context.get_definitions()}
+        try:
+            result = check(self.aac_file, self.fail_on_warn, False, 1, True)
+            if result.is_success() and self.generator_file:
+                result = generate(self.aac_file, self.generator_file, self.code_output, self.test_output, self.doc_output, True, False, False)
+        except LanguageError as e:
+            # Report the error like the command line would, but keep watching so the model can be fixed.
+            result = ExecutionResult(plugin_name, "watch", ExecutionStatus.GENERAL_FAILURE, [ExecutionMessage(e.message, MessageLevel.ERROR, e.location, None)])
+        finally:
+            self.loaded_definitions = [definition for definition in context.get_definitions() if id(definition) not in previous_definitions]
+        return result
+
+    def get_watched_files(self) -> list[str]:
+        """Return the files that the model and generator were loaded from, including the files they import."""
+        files = {path.realpath(file): None for file in [self.aac_file, self.generator_file] if file}
+        for definition in self.loaded_definitions:
+            if path.isfile(definition.source.uri):
+                files[path.realpath(definition.source.uri)] = None
+        return list(files)
+
+
+def watch(
+    aac_file: str,
+    generator_file: Optional[str],
+    code_output: Optional[str],
+    test_output: Optional[str],
+    doc_output: Optional[str],
+    fail_on_warn: bool,
+    poll_interval: int,
+    polling: bool,
+) -> ExecutionResult:
+    """
+    Business logic for the watch command.
+
+    Args:
+        aac_file (str): The AaC file with the model content.
+        generator_file (Optional[str]): The AaC file with the generator definition to run after each successful check.
+        code_output (Optional[str]): The location to output generated code.
+        test_output (Optional[str]): The location to output generated test code.
+        doc_output (Optional[str]): The location to output generated documentation.
+        fail_on_warn (bool): Treat constraint warnings as failures.
+        poll_interval (int): The number of milliseconds between checks for changes when files are polled.
+        polling (bool): Poll the files for changes even if file system notifications are available.
+
+    Returns:
+        ExecutionResult: The result of the watch command once it's interrupted.
+    """
+    model_watch = ModelWatch(aac_file, generator_file, code_output, test_output, doc_output, fail_on_warn)
+    file_watcher = create_file_watcher(poll_interval / 1000, polling)
+    try:
+        # The files are watched while each run is in progress, so changes made during a run aren't missed.
+        file_watcher.watch(model_watch.get_watched_files())
+        while True:
+            _output_run_result(model_watch.run())
+            file_watcher.watch(model_watch.get_watched_files())
+            changed_files = file_watcher.wait_for_changes()
+            secho(f"Change detected in {', '.join(changed_files)}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        file_watcher.close()
+
+    message = ExecutionMessage(f"Stopped watching {aac_file}.", MessageLevel.INFO, aac_file, None)
+    return ExecutionResult(plugin_name, "watch", ExecutionStatus.SUCCESS, [message])
+
+
+def _output_run_result(result: ExecutionResult) -> None:
+    """Output the result of a run, without exiting like the command line does when a command fails."""
+    secho(result.get_messages_as_string(), err=not result.is_success(), color=True)
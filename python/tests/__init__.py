@@ -1 +1,12 @@
-# This file is intentionally empty.
+"""The AaC tests, which run with their own cache directory so they never read or write the user's AaC cache."""
+import atexit
+from os import environ
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from aac.in_out.constants import AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE
+
+# Set before any test bootstraps the LanguageContext, and inherited by the processes the tests start.
+TEST_CACHE_DIRECTORY = mkdtemp(prefix="aac-test-cache-")
+environ[AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE] = TEST_CACHE_DIRECTORY
+atexit.register(rmtree, TEST_CACHE_DIRECTORY, ignore_errors=True)
@@ -45,6 +45,72 @@ class TestDefinition(TestCase):
         name = definition.get_fully_qualified_name()
         self.assertEqual(name, "aac.lang.Schema")
 
+    def test_identity_is_memoized(self):
+        context = LanguageContext()
+        model_definition = context.parse_and_load(DEFINITION_VALID)[0]
+        definition = Definition(
+            name=model_definition.name,
+            package=model_definition.package,
+            content=model_definition.content,
+            source=model_definition.source,
+            structure=model_definition.structure,
+        )
+        self.assertEqual(definition.get_fully_qualified_name(), "default.ModelName")
+        self.assertEqual(hash(definition), hash("default.ModelName"))
+
+        definition.name = "Other Name"
+        self.assertEqual(definition.get_fully_qualified_name(), "default.OtherName")
+        self.assertEqual(hash(definition), hash("default.OtherName"))
+        definition.package = "my.package"
+        self.assertEqual(definition.get_fully_qualified_name(), "my.package.OtherName")
+
+        self.assertEqual(definition.get_root_key(), "model")
+        definition.structure = {"schema": {"name": "Other Name"}}
+        self.assertEqual(definition.get_root_key(), "schema")
+        self.assertNotIn("_root_key", repr(definition))
+
+    def test_equality(self):
+        context = LanguageContext()
+        schema_definition = context.get_definitions_by_name("Schema")[0]
+        field_definition = context.get_definitions_by_name("Field")[0]
+
+        def copy_definition(**changes) -> Definition:
+            fields = dict(name=schema_definition.name, package=schema_definition.package, content=schema_definition.content, source=schema_definition.source, structure=schema_definition.structure)
+            return Definition(**{**fields, **changes})
+
+        self.assertEqual(schema_definition, schema_definition)
+        self.assertEqual(schema_definition, copy_definition())
+        self.assertEqual(schema_definition, copy_definition(structure=dict(schema_definition.structure)))
+        self.assertNotEqual(schema_definition, field_definition)
+        self.assertNotEqual(schema_definition, copy_definition(package="other.package"))
+        self.assertNotEqual(schema_definition, copy_definition(structure={"schema": {"name": "Schema"}}))
+        self.assertNotEqual(schema_definition, copy_definition(structure={"enum": schema_definition.structure["schema"]}))
+        self.assertNotEqual(schema_definition, schema_definition.structure)
+
+        other_definition = copy_definition(structure=dict(schema_definition.structure))
+        self.assertEqual(schema_definition.get_fingerprint(), other_definition.get_fingerprint())
+        self.assertEqual(schema_definition, other_definition)
+        self.assertNotEqual(schema_definition.get_fingerprint(), field_definition.get_fingerprint())
+
+    def test_get_fingerprint(self):
+        context = LanguageContext()
+        model_definition = context.parse_and_load(DEFINITION_VALID)[0]
+        definition = Definition(
+            name=model_definition.name,
+            package=model_definition.package,
+            content=model_definition.content,
+            source=model_definition.source,
+            structure=model_definition.structure,
+        )
+        fingerprint = definition.get_fingerprint()
+        self.assertEqual(fingerprint, model_definition.get_fingerprint())
+
+        definition.name = "Other Name"
+        self.assertEqual(definition.get_fingerprint(), fingerprint)
+        definition.structure = {"model": {"name": "Other Name"}}
+        self.assertNotEqual(definition.get_fingerprint(), fingerprint)
+        self.assertNotEqual(definition, model_definition)
+
     def test_to_yaml(self):
         context = LanguageContext()
         definition = context.get_definitions_by_name("Schema")
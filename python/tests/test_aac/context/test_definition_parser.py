@@ -18,6 +18,20 @@ class TestDefinitionParser(TestCase):
         definitions = context.get_definitions_by_name("Test Schema2")
         self.assertEqual(definitions[0].name, "Test Schema2")
 
+    def test_get_location_str(self):
+        parser = DefinitionParser()
+        definition, = parse(BOOLEAN_AAC_YAML_CONTENT)
+
+        for lexemes in [definition.lexemes, list(definition.lexemes)]:
+            self.assertEqual(parser.get_location_str("TestSchema", lexemes), "File: No file to reference  Line: 2")
+            self.assertEqual(parser.get_location_str(True, lexemes), "File: No file to reference  Possible Lines: 6, 9")
+            self.assertEqual(parser.get_location_str(False, lexemes), "Unable to identify source and location")
+
+        # Lookups in the lexemes that follow a field only find the lexemes after it.
+        second_field_lexemes = definition.lexemes[len(definition.lexemes) - 6:]
+        self.assertEqual(parser.get_location_str(True, second_field_lexemes), "File: No file to reference  Line: 9")
+        self.assertEqual(parser.get_location_str("first", second_field_lexemes), "Unable to identify source and location")
+
     def test_load_definitions_pass(self):
         parser = DefinitionParser()
         context = LanguageContext()
@@ -107,6 +121,18 @@ schema:
         This is a test field.
 """.strip()
 
+BOOLEAN_AAC_YAML_CONTENT = """
+schema:
+  name: TestSchema
+  fields:
+    - name: first
+      type: string
+      is_required: yes
+    - name: second
+      type: string
+      is_required: true
+""".strip()
+
 VALID_AAC_YAML_CONTENT_SPACE_IN_NAME = """
 schema:
   name: Test Schema2
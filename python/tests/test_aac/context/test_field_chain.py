@@ -0,0 +1,61 @@
+from types import GeneratorType
+from unittest import TestCase
+
+from aac.context.field_chain import FieldChainQuery, get_field_chain_query
+from aac.context.language_error import LanguageError
+
+
+class TestFieldChain(TestCase):
+    STRUCTURES = [
+        {"schema": {"name": "First", "fields": [{"name": "a", "type": "string"}, {"name": "b", "type": "int"}]}},
+        {"schema": {"name": "Second", "fields": [{"type": "bool"}, "not a field", {"name": ["c", "d"]}]}},
+        {"schema": {"name": "Third"}},
+        {"schema": "not a schema"},
+        {"enum": {"name": "NotASchema"}},
+    ]
+
+    def test_field_chain_query(self):
+        query = FieldChainQuery("schema.fields.name")
+        self.assertEqual(query.fields, ("schema", "fields", "name"))
+        self.assertEqual(query.root_key, "schema")
+        self.assertEqual(query, FieldChainQuery("schema.fields.name"))
+
+    def test_iter_values(self):
+        query = FieldChainQuery("schema.fields.name")
+        values = query.iter_values(iter(self.STRUCTURES))
+        self.assertIsInstance(values, GeneratorType)
+        self.assertEqual(list(values), ["a", "b", "c", "d"])
+
+        self.assertEqual(list(FieldChainQuery("schema.name").iter_values(self.STRUCTURES)), ["First", "Second", "Third"])
+        self.assertEqual(list(FieldChainQuery("schema").iter_values(self.STRUCTURES[2:4])), [{"name": "Third"}, "not a schema"])
+        self.assertEqual(list(FieldChainQuery("schema.fields.name.missing").iter_values(self.STRUCTURES)), [])
+        self.assertEqual(list(FieldChainQuery("schema.fields.name").iter_values([])), [])
+
+    def test_iter_values_is_lazy(self):
+        visited = []
+
+        def visit_structures():
+            for structure in self.STRUCTURES:
+                visited.append(structure)
+                yield structure
+
+        values = FieldChainQuery("schema.name").iter_values(visit_structures())
+        self.assertEqual(visited, [])
+        self.assertEqual(next(values), "First")
+        self.assertEqual(visited, self.STRUCTURES[:1])
+
+    def test_iter_structures(self):
+        query = FieldChainQuery("schema.fields")
+        self.assertEqual(list(query.iter_structures(self.STRUCTURES[:1])), self.STRUCTURES[0]["schema"]["fields"])
+        self.assertEqual(list(query.iter_structures(self.STRUCTURES[2:3])), [])
+
+        with self.assertRaises(LanguageError) as error:
+            list(FieldChainQuery("schema.name").iter_structures(self.STRUCTURES[:1]))
+        self.assertIn("'schema.name'", error.exception.message)
+        self.assertIn("'name' is a primitive", error.exception.message)
+
+    def test_get_field_chain_query(self):
+        query = get_field_chain_query("schema.fields.type")
+        self.assertIs(query, get_field_chain_query("schema.fields.type"))
+        self.assertIsNot(query, get_field_chain_query("schema.fields.name"))
+        self.assertEqual(list(query.iter_values(self.STRUCTURES)), ["string", "int", "bool"])
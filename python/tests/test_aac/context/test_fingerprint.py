@@ -0,0 +1,59 @@
+from datetime import date
+from unittest import TestCase
+
+from aac.context.fingerprint import get_fingerprint
+from aac.in_out.parser._frozen import freeze, thaw
+
+
+class TestFingerprint(TestCase):
+    STRUCTURE = {
+        "schema": {
+            "name": "MySchema",
+            "package": "my.package",
+            "fields": [{"name": "count", "type": "int", "default": 1}, {"name": "when", "type": "date", "default": date(2024, 1, 31)}],
+            "modifiers": None,
+        }
+    }
+
+    def test_get_fingerprint(self):
+        fingerprint = get_fingerprint(self.STRUCTURE)
+        self.assertEqual(len(fingerprint), 32)
+        self.assertEqual(fingerprint, get_fingerprint(thaw(self.STRUCTURE)))
+        self.assertEqual(fingerprint, get_fingerprint(freeze(self.STRUCTURE)))
+
+        # equal structures have equal fingerprints, however they're ordered or typed
+        reordered = {"schema": dict(reversed(list(self.STRUCTURE["schema"].items())))}
+        self.assertEqual(get_fingerprint(reordered), fingerprint)
+        self.assertEqual(get_fingerprint([1, 2.0, True]), get_fingerprint([1.0, 2, 1]))
+
+    def test_get_fingerprint_of_changed_structures(self):
+        fingerprint = get_fingerprint(self.STRUCTURE)
+
+        changed = thaw(self.STRUCTURE)
+        changed["schema"]["fields"][1]["default"] = date(2024, 2, 1)
+        self.assertNotEqual(get_fingerprint(changed), fingerprint)
+
+        changed = thaw(self.STRUCTURE)
+        changed["schema"]["fields"].reverse()
+        self.assertNotEqual(get_fingerprint(changed), fingerprint)
+
+        self.assertNotEqual(get_fingerprint({"a": "1"}), get_fingerprint({"a": 1}))
+        self.assertNotEqual(get_fingerprint({"a": None}), get_fingerprint({"a": "None"}))
+        self.assertNotEqual(get_fingerprint({"a": []}), get_fingerprint({"a": {}}))
+        self.assertNotEqual(get_fingerprint(["ab", "c"]), get_fingerprint(["a", "bc"]))
+        self.assertNotEqual(get_fingerprint([1.5]), get_fingerprint([1]))
+
+    def test_get_fingerprint_of_values(self):
+        self.assertEqual(get_fingerprint("MySchema"), get_fingerprint("MySchema"))
+        self.assertNotEqual(get_fingerprint("MySchema"), get_fingerprint("OtherSchema"))
+        self.assertEqual(get_fingerprint(1), get_fingerprint(1.0))
+
+    def test_get_fingerprint_is_memoized_on_frozen_structures(self):
+        frozen = freeze(self.STRUCTURE)
+        fields = frozen["schema"]["fields"]
+        fingerprint = get_fingerprint(frozen)
+
+        self.assertEqual(fingerprint, frozen.digest.hex())
+        self.assertEqual(get_fingerprint(fields), fields.digest.hex())
+        self.assertEqual(get_fingerprint(fields[0]), get_fingerprint(self.STRUCTURE["schema"]["fields"][0]))
+        self.assertFalse(hasattr(self.STRUCTURE, "digest"))
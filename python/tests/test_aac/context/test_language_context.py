@@ -1,9 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
+from aac.context.definition import Definition
 from aac.context.language_context import LanguageContext
 from aac.context.language_error import LanguageError
+from aac.in_out.constants import AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE, AAC_LANGUAGE_SNAPSHOT_ENVIRONMENT_VARIABLE
 from aac.in_out.parser._parser_error import ParserError
 
+LAZY_PLUGIN_SCRIPT = """
+import json, sys
+from click.testing import CliRunner
+from aac.context.language_context import LanguageContext
+from aac.execute.command_line import cli
+from aac.execute.plugin_runner import LazyPluginCallback, PrimitiveConstraintValue
+
+output = CliRunner().invoke(cli, ["version"]).output
+modules_after_version = [module for module in ["jinja2", "black", "aac.plugins.generate"] if module in sys.modules]
+
+context = LanguageContext()
+plugin_names = [runner.get_plugin_name() for runner in context.get_plugin_runners()]
+generate_runner = [runner for runner in context.get_plugin_runners() if runner.get_plugin_name() == "Generate"][0]
+lazy_before_load = isinstance(generate_runner.get_command_callback("generate"), LazyPluginCallback)
+context.load_plugin_module("aac.plugins.generate")
+generate_runner = [runner for runner in context.get_plugin_runners() if runner.get_plugin_name() == "Generate"][0]
+primitives_runner = [runner for runner in context.get_plugin_runners() if runner.get_plugin_name() == "AaC Primitive Constraints"][0]
+check_int_batch = primitives_runner.get_batch_constraint_callback("Check int")
+int_failures = check_int_batch([PrimitiveConstraintValue(value, "int", [], None, None) for value in [1, "x", 2]])
+
+print(json.dumps({
+    "output": output,
+    "modules_after_version": modules_after_version,
+    "lazy_before_load": lazy_before_load,
+    "lazy_after_load": isinstance(generate_runner.get_command_callback("generate"), LazyPluginCallback),
+    "generate_loaded": "aac.plugins.generate" in sys.modules,
+    "same_order": plugin_names == [runner.get_plugin_name() for runner in context.get_plugin_runners()],
+    "batch_lazy": isinstance(check_int_batch, LazyPluginCallback),
+    "batch_failures": [index for index, result in int_failures],
+}))
+"""
+
 
 class TestLanguageContext(TestCase):
     def test_LanguageContext(self):
@@ -63,6 +103,16 @@ class TestLanguageContext(TestCase):
         definition = context.get_definitions_by_name(name)
         self.assertEqual(len(definition), 0)
 
+    def test_remove_requirement_definitions(self):
+        context = LanguageContext()
+        requirements = context.parse_and_load(REQUIREMENTS_AAC_YAML_CONTENT)
+        lookup_names = [context.get_lookup_name(requirement) for requirement in requirements]
+        self.assertEqual([f"{requirements[0].package}.RemovableRequirement_REQ-1", f"{requirements[1].package}.RemovableRequirement_REQ-2"], lookup_names)
+        self.assertTrue(all(context.fully_qualified_name_to_definition[name] in requirements for name in lookup_names))
+
+        context.remove_definitions(requirements)
+        self.assertTrue(all(name not in context.fully_qualified_name_to_definition for name in lookup_names))
+
     def test_get_definitions(self):
         context = LanguageContext()
         definitions = context.get_definitions()
@@ -84,6 +134,23 @@ class TestLanguageContext(TestCase):
         definitions = context.get_definitions_by_name("Test Schema2")
         self.assertEqual(definitions[0].name, "Test Schema2")
 
+    def test_get_definitions_by_name_with_package(self):
+        context = LanguageContext()
+        first_definitions = context.parse_and_load(PACKAGED_AAC_YAML_CONTENT.format(package="first.pkg"))
+        second_definitions = context.parse_and_load(PACKAGED_AAC_YAML_CONTENT.format(package="second.pkg"))
+
+        definitions = context.get_definitions_by_name("PackagedSchema")
+        self.assertEqual(len(definitions), 2)
+        self.assertEqual([definition.package for definition in definitions], ["first.pkg", "second.pkg"])
+        self.assertEqual(context.get_definitions_by_name("second.pkg.PackagedSchema"), second_definitions)
+        self.assertEqual(context.get_definitions_by_name("pkg.PackagedSchema"), definitions)
+        self.assertEqual(context.get_definitions_by_name("Schema"), context.get_definitions_by_name("aac.lang.Schema"))
+
+        context.remove_definitions(first_definitions)
+        self.assertEqual(context.get_definitions_by_name("PackagedSchema"), second_definitions)
+        context.remove_definitions(second_definitions)
+        self.assertEqual(context.get_definitions_by_name("PackagedSchema"), [])
+
     def test_get_definitions_by_root(self):
         context = LanguageContext()
         definitions = context.get_definitions_by_root("schema")
@@ -96,6 +163,19 @@ class TestLanguageContext(TestCase):
         definition = context.get_defining_schema_for_root("schema")
         self.assertEqual(definition.name, "Schema")
 
+    def test_get_defining_schema_for_root_loaded_root(self):
+        context = LanguageContext()
+        schema_definition, rooted_definition = context.parse_and_load(ROOTED_AAC_YAML_CONTENT)
+        self.assertEqual(context.get_defining_schema_for_root("test_root"), schema_definition)
+        self.assertEqual(context.get_defining_schemas_for_root("test_root"), [schema_definition])
+        self.assertEqual(context.get_definitions_by_root("test_root"), [rooted_definition])
+        self.assertEqual(rooted_definition.instance.value, "rooted value")
+
+        context.remove_definitions([rooted_definition, schema_definition])
+        self.assertEqual(context.get_definitions_by_root("test_root"), [])
+        with self.assertRaises(LanguageError):
+            context.get_defining_schema_for_root("test_root")
+
     def test_get_plugin_runners(self):
         context = LanguageContext()
         plugin_runners = context.get_plugin_runners()
@@ -103,6 +183,25 @@ class TestLanguageContext(TestCase):
         plugin_names = [runner.plugin_definition.name for runner in plugin_runners]
         self.assertIn("Version", plugin_names)
 
+    def test_lazy_plugin_registration(self):
+        with TemporaryDirectory() as temp_dir:
+            environment = {**os.environ, AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: temp_dir, AAC_LANGUAGE_SNAPSHOT_ENVIRONMENT_VARIABLE: "1"}
+
+            # The first run bootstraps the context and saves the snapshot and its plugin manifest, and later runs register the plugins lazily.
+            for _ in range(2):
+                process = subprocess.run([sys.executable, "-c", LAZY_PLUGIN_SCRIPT], env=environment, capture_output=True, text=True)
+                self.assertEqual(process.returncode, 0, process.stderr)
+            result = json.loads(process.stdout.splitlines()[-1])
+
+        self.assertTrue(result["output"].strip())
+        self.assertEqual(result["modules_after_version"], [])
+        self.assertTrue(result["lazy_before_load"])
+        self.assertFalse(result["lazy_after_load"])
+        self.assertTrue(result["generate_loaded"])
+        self.assertTrue(result["same_order"])
+        self.assertTrue(result["batch_lazy"])
+        self.assertEqual(result["batch_failures"], [1])
+
     def test_get_primitives(self):
         context = LanguageContext()
         primitives = context.get_primitives()
@@ -136,6 +235,28 @@ class TestLanguageContext(TestCase):
         definitions = context.get_definitions_of_type("aac.lang", "AacType")
         self.assertGreater(len(definitions), 1)
 
+    def test_get_definitions_of_type_inheritance_chain(self):
+        context = LanguageContext()
+        parent_definitions = context.parse_and_load(INHERITANCE_AAC_YAML_CONTENT)
+        child_definition, grandchild_definition = parent_definitions
+
+        definitions = context.get_definitions_of_type("test.inheritance", "ChildSchema")
+        self.assertEqual(definitions, [child_definition, grandchild_definition])
+        self.assertTrue(context.is_extension_of(grandchild_definition, "aac.lang", "AacType"))
+        self.assertTrue(context.is_extension_of(grandchild_definition, "aac.lang", "Schema"))
+        self.assertFalse(context.is_extension_of(child_definition, "test.inheritance", "GrandchildSchema"))
+        self.assertTrue(context.is_extension_of(child_definition, "test.inheritance", "ChildSchema"))
+        with patch.object(Definition, "__eq__", autospec=True, side_effect=lambda definition, other: definition is other) as definition_eq:
+            self.assertTrue(context.is_extension_of(grandchild_definition, "aac.lang", "AacType"))
+        self.assertLessEqual(definition_eq.call_count, 1)
+        with self.assertRaises(LanguageError):
+            context.is_extension_of(child_definition, "test.inheritance", "NotASchema")
+
+        context.remove_definitions([grandchild_definition])
+        self.assertEqual(context.get_definitions_of_type("test.inheritance", "ChildSchema"), [child_definition])
+        self.assertNotIn(grandchild_definition, context.get_definitions_of_type("aac.lang", "AacType"))
+        context.remove_definitions([child_definition])
+
     def test_get_values_by_field_chain(self):
         context = LanguageContext()
         test_values = ["schema.fields.name", "enum.values", "primitive.python_type"]
@@ -143,6 +264,22 @@ class TestLanguageContext(TestCase):
             values = context.get_values_by_field_chain(val)
             self.assertGreater(len(values), 1)
 
+    def test_get_value_set_by_field_chain(self):
+        context = LanguageContext()
+        field_names = context.get_value_set_by_field_chain("schema.fields.name")
+        self.assertEqual(field_names, frozenset(context.get_values_by_field_chain("schema.fields.name")))
+        self.assertIs(field_names, context.get_value_set_by_field_chain("schema.fields.name"))
+        self.assertNotIn("value_set_field", field_names)
+
+        # loading or removing a definition with the same root key invalidates the set, but other roots keep theirs
+        enum_values = context.get_value_set_by_field_chain("enum.values")
+        definitions = context.parse_and_load(VALID_AAC_YAML_CONTENT.replace("TestSchema", "ValueSetSchema").replace("integer_field", "value_set_field"))
+        self.assertIn("value_set_field", context.get_value_set_by_field_chain("schema.fields.name"))
+        self.assertIs(enum_values, context.get_value_set_by_field_chain("enum.values"))
+
+        context.remove_definitions(definitions)
+        self.assertEqual(field_names, context.get_value_set_by_field_chain("schema.fields.name"))
+
     def test_is_aac_instance_fail(self):
         with self.assertRaises(KeyError):
             context = LanguageContext()
@@ -274,3 +411,70 @@ schema:
       description: |
         This is a test field.
 """.strip()
+
+PACKAGED_AAC_YAML_CONTENT = """
+schema:
+  name: PackagedSchema
+  package: {package}
+  description: |
+    This is a test schema.
+  fields:
+    - name: string_field
+      type: string
+""".strip()
+
+INHERITANCE_AAC_YAML_CONTENT = """
+schema:
+  name: ChildSchema
+  package: test.inheritance
+  extends:
+    - package: aac.lang
+      name: Schema
+  description: |
+    This is a test schema.
+  fields:
+    - name: child_field
+      type: string
+---
+schema:
+  name: GrandchildSchema
+  package: test.inheritance
+  extends:
+    - package: test.inheritance
+      name: ChildSchema
+  description: |
+    This is a test schema.
+  fields:
+    - name: grandchild_field
+      type: string
+""".strip()
+
+ROOTED_AAC_YAML_CONTENT = """
+schema:
+  name: RootedSchema
+  package: test.root
+  root: test_root
+  description: |
+    This is a test schema.
+  fields:
+    - name: name
+      type: string
+    - name: value
+      type: string
+---
+test_root:
+  name: RootedDefinition
+  value: rooted value
+""".strip()
+
+REQUIREMENTS_AAC_YAML_CONTENT = """
+req:
+  name: RemovableRequirement
+  id: REQ-1
+  shall: The first requirement shall be removable.
+---
+req:
+  name: RemovableRequirement
+  id: REQ-2
+  shall: The second requirement shall be removable.
+"""
@@ -0,0 +1,83 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from aac.context import definition
+from aac.context.language_context import LanguageContext
+from aac.context.language_snapshot import (
+    LanguageSnapshot,
+    get_file_hash,
+    get_snapshot_source_module_files,
+    load_language_snapshot,
+    save_language_snapshot,
+)
+
+
+class TestLanguageSnapshot(TestCase):
+    def get_context_snapshot(self, source_hashes: dict[str, str]) -> LanguageSnapshot:
+        context = LanguageContext()
+        return LanguageSnapshot(
+            source_hashes=source_hashes,
+            loads={context.get_aac_core_file_path(): context.get_aac_core_definitions()},
+            definitions=context.get_definitions(),
+            fully_qualified_name_to_definition=context.fully_qualified_name_to_definition,
+            fully_qualified_name_to_class=context.fully_qualified_name_to_class,
+        )
+
+    def test_save_and_load_language_snapshot(self):
+        context = LanguageContext()
+        core_file_path = context.get_aac_core_file_path()
+        snapshot = self.get_context_snapshot({core_file_path: get_file_hash(core_file_path)})
+
+        with TemporaryDirectory() as temp_dir:
+            snapshot_file_path = os.path.join(temp_dir, "snapshot.pickle")
+            save_language_snapshot(snapshot, snapshot_file_path)
+            loaded_snapshot = load_language_snapshot(snapshot_file_path)
+
+        self.assertIsNotNone(loaded_snapshot)
+        self.assertEqual(len(loaded_snapshot.definitions), len(snapshot.definitions))
+        self.assertEqual(list(loaded_snapshot.fully_qualified_name_to_class), list(snapshot.fully_qualified_name_to_class))
+        self.assertEqual(
+            [definition.name for definition in loaded_snapshot.loads[core_file_path]],
+            [definition.name for definition in snapshot.loads[core_file_path]],
+        )
+
+        # The generated classes are rebuilt, and the restored instances belong to the rebuilt classes.
+        schema_class = loaded_snapshot.fully_qualified_name_to_class["aac.lang.Schema"]
+        self.assertIsNot(schema_class, context.fully_qualified_name_to_class["aac.lang.Schema"])
+        schema_definition = loaded_snapshot.fully_qualified_name_to_definition["aac.lang.Schema"]
+        self.assertIsInstance(schema_definition.instance, schema_class)
+        self.assertEqual(len(schema_definition.instance.fields), len(context.get_definitions_by_name("Schema")[0].instance.fields))
+        self.assertEqual(str(type(schema_definition.instance)), "<class 'aac.lang.Schema'>")
+
+    def test_load_language_snapshot_with_changed_source(self):
+        with TemporaryDirectory() as temp_dir:
+            source_file_path = os.path.join(temp_dir, "source.aac")
+            with open(source_file_path, "w") as source_file:
+                source_file.write("schema:\n  name: Original\n")
+
+            snapshot_file_path = os.path.join(temp_dir, "snapshot.pickle")
+            save_language_snapshot(self.get_context_snapshot({source_file_path: get_file_hash(source_file_path)}), snapshot_file_path)
+            self.assertIsNotNone(load_language_snapshot(snapshot_file_path))
+
+            with open(source_file_path, "w") as source_file:
+                source_file.write("schema:\n  name: Changed\n")
+            self.assertIsNone(load_language_snapshot(snapshot_file_path))
+
+    def test_load_language_snapshot_with_changed_module(self):
+        module_files = get_snapshot_source_module_files()
+        self.assertIn(definition.__file__, module_files)
+        self.assertLessEqual(set(module_files), set(LanguageContext()._get_bootstrap_snapshot().source_hashes))
+
+        with TemporaryDirectory() as temp_dir:
+            snapshot_file_path = os.path.join(temp_dir, "snapshot.pickle")
+            save_language_snapshot(self.get_context_snapshot({definition.__file__: get_file_hash(definition.__file__)}), snapshot_file_path)
+            self.assertIsNotNone(load_language_snapshot(snapshot_file_path))
+
+            # a snapshot taken before a change to the Definition module is discarded
+            save_language_snapshot(self.get_context_snapshot({definition.__file__: "hash before the change"}), snapshot_file_path)
+            self.assertIsNone(load_language_snapshot(snapshot_file_path))
+
+    def test_load_language_snapshot_without_snapshot(self):
+        with TemporaryDirectory() as temp_dir:
+            self.assertIsNone(load_language_snapshot(os.path.join(temp_dir, "snapshot.pickle")))
@@ -0,0 +1,82 @@
+from array import array
+from unittest import TestCase
+
+from aac.context.lexeme import Lexeme
+from aac.context.lexeme_table import LexemeTable, find_first_lexeme, find_lexemes, get_lexemes_from_value
+from aac.context.source_location import SourceLocation
+from aac.in_out.parser import parse
+
+
+class TestLexemeTable(TestCase):
+    def test_lexeme_table(self):
+        table = LexemeTable("my_source.aac")
+        table.add(0, 0, 0, 6, "schema")
+        table.add(1, 2, 9, 4, "name")
+        table.add(1, 8, 15, 10, "TestSchema")
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.get_location(1), SourceLocation(1, 2, 9, 4))
+        self.assertEqual(table.get_lexeme(2), Lexeme(SourceLocation(1, 8, 15, 10), "my_source.aac", "TestSchema"))
+
+        lexemes = table.get_lexemes(range(1, 3))
+        self.assertEqual(len(lexemes), 2)
+        self.assertEqual([lexeme.value for lexeme in lexemes], ["name", "TestSchema"])
+        self.assertEqual(lexemes[-1].location, SourceLocation(1, 8, 15, 10))
+        self.assertEqual(lexemes, [table.get_lexeme(1), table.get_lexeme(2)])
+
+        sparse_lexemes = table.get_lexemes(array("i", [0, 2]))
+        self.assertEqual([lexeme.value for lexeme in sparse_lexemes], ["schema", "TestSchema"])
+        self.assertEqual([lexeme.value for lexeme in sparse_lexemes[1:]], ["TestSchema"])
+        self.assertNotEqual(lexemes, sparse_lexemes)
+
+    def test_lexeme_table_value_index(self):
+        table = LexemeTable("my_source.aac")
+        for position, value in enumerate(["schema", "name", "yes", "name", "true", "3"]):
+            table.add(position, 0, position, len(value), value)
+
+        self.assertEqual(table.get_indices_of_value("name"), [1, 3])
+        self.assertEqual(table.get_indices_of_value(True), [2, 4])
+        self.assertEqual(table.get_indices_of_value(3), [5])
+        self.assertEqual(table.get_indices_of_value("missing"), [])
+
+        lexemes = table.get_lexemes(range(2, 6))
+        self.assertEqual(lexemes.get_positions_of_value("name"), [1])
+        self.assertEqual([lexeme.location.line for lexeme in find_lexemes(lexemes, True)], [2, 4])
+        self.assertEqual([lexeme.value for lexeme in get_lexemes_from_value(lexemes, "true")], ["true", "3"])
+        self.assertEqual(len(get_lexemes_from_value(lexemes, "schema")), 0)
+
+        sparse_lexemes = table.get_lexemes(array("i", [0, 3, 4]))
+        self.assertEqual(sparse_lexemes.get_positions_of_value("name"), [1])
+        self.assertEqual([lexeme.value for lexeme in find_lexemes(sparse_lexemes, True)], ["true"])
+        self.assertEqual(find_lexemes(list(sparse_lexemes), True), find_lexemes(sparse_lexemes, True))
+
+        self.assertEqual(find_first_lexeme(lexemes, True), find_lexemes(lexemes, True)[0])
+        self.assertEqual(find_first_lexeme(list(lexemes), True), find_lexemes(lexemes, True)[0])
+        self.assertIsNone(find_first_lexeme(lexemes, "schema"))
+        self.assertIsNone(find_first_lexeme(list(lexemes), "schema"))
+
+    def test_moved_lexeme_table(self):
+        table = LexemeTable("my_source.aac")
+        table.add(0, 0, 0, 6, "schema")
+        table.add(1, 2, 9, 4, "name")
+
+        moved_table = table.moved(3, 40)
+        self.assertEqual(moved_table.get_location(1), SourceLocation(4, 2, 49, 4))
+        self.assertEqual(moved_table.get_indices_of_value("name"), [1])
+        self.assertEqual(table.get_location(1), SourceLocation(1, 2, 9, 4))
+
+    def test_parsed_definitions_share_lexeme_table(self):
+        first_definition, second_definition = parse(MULTIPLE_DEFINITION_CONTENT)
+
+        self.assertIs(first_definition.lexemes.table, second_definition.lexemes.table)
+        self.assertEqual([lexeme.value for lexeme in first_definition.lexemes], ["schema", "name", "FirstSchema"])
+        self.assertEqual([lexeme.value for lexeme in second_definition.lexemes], ["schema", "name", "SecondSchema"])
+        self.assertEqual(second_definition.lexemes[2].location, SourceLocation(4, 8, 48, 12))
+
+
+MULTIPLE_DEFINITION_CONTENT = """schema:
+  name: FirstSchema
+---
+schema:
+  name: SecondSchema
+"""
@@ -2,7 +2,7 @@ from os.path import join, dirname
 from unittest import TestCase
 
 from aac.context.language_context import LanguageContext
-from aac.execute.plugin_runner import AacCommandArgument, AacCommand, PluginRunner
+from aac.execute.plugin_runner import AacCommandArgument, AacCommand, LazyPluginCallback, PluginRunner
 
 
 class TestAacCommandArgument(TestCase):
@@ -71,6 +71,11 @@ class TestPluginRunner(TestCase):
         self.assertEqual("Constraint Callback", constraint())
         self.assertEqual("My plugin", plugin_runner.get_plugin_name())
 
+        plugin_runner.add_batch_constraint_callback("constraint", constraint_callback)
+        self.assertIs(constraint_callback, plugin_runner.get_batch_constraint_callback("constraint"))
+        with self.assertRaises(TypeError):
+            plugin_runner.add_batch_constraint_callback("constraint", "Constraint Callback")
+
     def test_plugin_runner_list_instead_of_dict(self):
         with self.assertRaises(TypeError):
             aac_file_path = join(dirname(__file__), "my_plugin.aac")
@@ -97,6 +102,23 @@ class TestPluginRunner(TestCase):
             plugin_runner.add_constraint_callback("constraint", "Constraint Callback")
 
 
+class TestLazyPluginCallback(TestCase):
+    def test_lazy_plugin_callback(self):
+        loads = []
+
+        def load_callback():
+            loads.append("loaded")
+            return command_callback
+
+        lazy_callback = LazyPluginCallback("command", load_callback)
+        self.assertEqual(loads, [])
+
+        self.assertEqual("Command Callback", lazy_callback())
+        self.assertEqual("Command Callback", lazy_callback())
+        self.assertEqual(loads, ["loaded"])
+        self.assertIs(lazy_callback.callback, command_callback)
+
+
 def command_callback():
     return "Command Callback"
 
@@ -0,0 +1,73 @@
+import os
+import socket
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from aac import __version__
+from aac.context.source_location import SourceLocation
+from aac.execute.aac_execution_result import ExecutionMessage, ExecutionResult, ExecutionStatus, MessageLevel
+from aac.execute.server_client import (
+    ServerInfo,
+    find_server,
+    is_forwarded,
+    read_server_info,
+    remove_server_info,
+    result_from_dict,
+    result_to_dict,
+    write_server_info,
+)
+from aac.in_out.constants import AAC_SERVER_ENVIRONMENT_VARIABLE
+
+
+class TestServerClient(TestCase):
+    def test_result_round_trip(self):
+        messages = [
+            ExecutionMessage("Located", MessageLevel.ERROR, "my_file.aac", SourceLocation(1, 2, 3, 4)),
+            ExecutionMessage("Unlocated", MessageLevel.INFO, None, None),
+        ]
+        result = ExecutionResult("My Plugin", "my-command", ExecutionStatus.CONSTRAINT_FAILURE, messages)
+        self.assertEqual(result, result_from_dict(result_to_dict(result)))
+
+    def test_server_info(self):
+        with TemporaryDirectory() as temp_dir:
+            server_file_path = os.path.join(temp_dir, "server", "server.json")
+            self.assertIsNone(read_server_info(server_file_path))
+
+            server_info = ServerInfo("http://127.0.0.1:1234", "token", os.getpid(), __version__)
+            write_server_info(server_info, server_file_path)
+            self.assertEqual(server_info, read_server_info(server_file_path))
+            self.assertEqual(0o600, os.stat(server_file_path).st_mode & 0o777)
+
+            # A stopping server doesn't remove the file of a server that replaced it
+            remove_server_info(ServerInfo("http://127.0.0.1:5678", "other", 1, __version__), server_file_path)
+            self.assertEqual(server_info, read_server_info(server_file_path))
+            remove_server_info(server_info, server_file_path)
+            self.assertFalse(os.path.exists(server_file_path))
+
+    def test_find_server_without_server(self):
+        with TemporaryDirectory() as temp_dir:
+            server_file_path = os.path.join(temp_dir, "server.json")
+            self.assertIsNone(find_server(server_file_path))
+
+            with socket.socket() as unused_socket:
+                unused_socket.bind(("127.0.0.1", 0))
+                unused_port = unused_socket.getsockname()[1]
+            write_server_info(ServerInfo(f"http://127.0.0.1:{unused_port}", "token", 1, __version__), server_file_path)
+            self.assertIsNone(find_server(server_file_path))
+
+            write_server_info(ServerInfo(f"http://127.0.0.1:{unused_port}", "token", 1, "0.0.0"), server_file_path)
+            self.assertIsNone(find_server(server_file_path))
+
+    def test_is_forwarded(self):
+        with patch.dict(os.environ, {AAC_SERVER_ENVIRONMENT_VARIABLE: "1"}):
+            self.assertTrue(is_forwarded(["check", "my_file.aac"]))
+            self.assertTrue(is_forwarded(["print-defs"]))
+            self.assertTrue(is_forwarded(["generate", "my_file.aac", "my_generator.aac", "--no-prompt"]))
+            self.assertFalse(is_forwarded(["generate", "my_file.aac", "my_generator.aac"]))
+            self.assertFalse(is_forwarded(["check", "--help"]))
+            self.assertFalse(is_forwarded(["version"]))
+            self.assertFalse(is_forwarded([]))
+
+        with patch.dict(os.environ, {AAC_SERVER_ENVIRONMENT_VARIABLE: "0"}):
+            self.assertFalse(is_forwarded(["check", "my_file.aac"]))
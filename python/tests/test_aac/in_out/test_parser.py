@@ -1,12 +1,16 @@
 from os.path import basename, sep, isfile
-from os import linesep
+from os import environ, linesep
 from tempfile import TemporaryDirectory
 from typing import Optional
 from unittest import TestCase
+from unittest.mock import patch
 import tempfile
+import yaml
 
-from aac.in_out.constants import AAC_DOCUMENT_EXTENSION, YAML_DOCUMENT_SEPARATOR
-from aac.in_out.parser import parse, ParserError
+from aac.in_out.constants import AAC_DOCUMENT_EXTENSION, AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE, YAML_DOCUMENT_SEPARATOR
+from aac.in_out.parser._cache import PARALLEL_PARSE_MINIMUM_STRINGS
+from aac.in_out.parser._cache_manager import get_parse_jobs
+from aac.in_out.parser import parse, parse_and_scan_yaml, parse_yaml, scan_yaml, thaw, ParserError
 from aac.context.language_context import LanguageContext
 from aac.context.definition import Definition
 from aac.context.source_location import SourceLocation
@@ -85,6 +89,50 @@ class TestParser(TestCase):
         self.assertIn(TEST_MESSAGE_CONTENTS, contents)
         self.assertIn(f"{YAML_DOCUMENT_SEPARATOR}{TEST_STATUS_CONTENTS}", contents)
 
+    def test_parsed_structures_are_shared_and_immutable(self):
+        first_definition, *_ = parse(TEST_MESSAGE_CONTENTS, source_uri=PARSER_TEST_SOURCE)
+        second_definition, *_ = parse(TEST_MESSAGE_CONTENTS, source_uri=PARSER_TEST_SOURCE)
+
+        self.assertIs(first_definition.structure, second_definition.structure)
+        with self.assertRaises(TypeError):
+            first_definition.structure["schema"]["name"] = "Changed"
+        with self.assertRaises(TypeError):
+            first_definition.structure["schema"]["fields"].append({"name": "new_field", "type": "string"})
+
+        mutable_structure = thaw(first_definition.structure)
+        mutable_structure["schema"]["fields"].append({"name": "new_field", "type": "string"})
+        self.assertEqual(len(mutable_structure["schema"]["fields"]), len(first_definition.structure["schema"]["fields"]) + 1)
+        self.assertEqual(yaml.dump(first_definition.structure), yaml.dump(thaw(first_definition.structure)))
+        self.assertEqual(yaml.safe_dump(first_definition.structure), yaml.safe_dump(thaw(first_definition.structure)))
+
+    def test_parse_and_scan_yaml_matches_separate_passes(self):
+        content = f"{TEST_MESSAGE_CONTENTS}{YAML_DOCUMENT_SEPARATOR}{TEST_STATUS_CONTENTS}"
+
+        def get_token_values(tokens: list) -> list[tuple]:
+            return [(type(token).__name__, getattr(token, "value", None), token.start_mark.line, token.start_mark.column) for token in tokens]
+
+        expected_tokens = [
+            token for token in scan_yaml(PARSER_TEST_SOURCE, content) if hasattr(token, "value") or type(token).__name__ in ["StreamStartToken", "DocumentStartToken", "StreamEndToken"]
+        ]
+        structures, tokens = parse_and_scan_yaml(PARSER_TEST_SOURCE, content)
+        self.assertListEqual(structures, parse_yaml(PARSER_TEST_SOURCE, content))
+        self.assertListEqual(get_token_values(tokens)[:-1], get_token_values(expected_tokens)[:-1])
+        self.assertEqual(tokens[-1].start_mark.index, expected_tokens[-1].start_mark.index)
+
+        with self.assertRaises(ParserError):
+            parse_and_scan_yaml(PARSER_TEST_SOURCE, "schema:\n  name: [unclosed")
+
+    def test_parse_and_scan_yaml_locates_anchored_and_tagged_values(self):
+        content = "schema:\n  name: &name TestSchema\n  description: !!str   tagged ü\n  title: &title !!str # comment\n    next line\n  alias: *name\n"
+
+        def get_value_locations(tokens: list) -> list[tuple]:
+            return [(token.value, token.start_mark.line, token.start_mark.column, token.start_mark.index) for token in tokens if hasattr(token, "value")]
+
+        expected_tokens = [token for token in scan_yaml(PARSER_TEST_SOURCE, content) if type(token).__name__ in ["ScalarToken", "AliasToken"]]
+        _, tokens = parse_and_scan_yaml(PARSER_TEST_SOURCE, content)
+        self.assertListEqual(get_value_locations(tokens), get_value_locations(expected_tokens))
+        self.assertIn(("next line", 4, 4, content.index("next line")), get_value_locations(tokens))
+
     def test_file_content_is_split_by_yaml_documents(self):
         content = f"{TEST_MESSAGE_CONTENTS}{YAML_DOCUMENT_SEPARATOR}{TEST_STATUS_CONTENTS}"
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -97,6 +145,18 @@ class TestParser(TestCase):
             self.assertIn(TEST_MESSAGE_CONTENTS, contents)
             self.assertIn(f"{YAML_DOCUMENT_SEPARATOR}{TEST_STATUS_CONTENTS}", contents)
 
+    def test_lexemes_are_split_by_many_yaml_documents(self):
+        documents = [f"req:\n  name: Requirement {index}\n  id: REQ-{index}\n  shall: Do thing {index}.\n" for index in range(50)]
+        parsed_definitions = parse(f"{YAML_DOCUMENT_SEPARATOR}{linesep}".join(documents), source_uri=PARSER_TEST_SOURCE)
+
+        self.assertEqual(len(parsed_definitions), len(documents))
+        for index, definition in enumerate(parsed_definitions):
+            self.assertEqual(
+                [lexeme.value for lexeme in definition.lexemes],
+                ["req", "name", f"Requirement {index}", "id", f"REQ-{index}", "shall", f"Do thing {index}."],
+            )
+            self.assertIn(documents[index], definition.content)
+
     def test_lexemes_are_split_by_yaml_documents(self):
         content = f"{TEST_MESSAGE_CONTENTS}{YAML_DOCUMENT_SEPARATOR}{TEST_STATUS_CONTENTS}"
         parsed_definitions = parse(content, source_uri=PARSER_TEST_SOURCE)
@@ -205,6 +265,43 @@ class TestParserImports(TestCase):
             self.assertEqual(third.value, f"./{TEST_MESSAGE_FILE_NAME}")
             self.assertEqual(third.location, SourceLocation(3, 6, 24, 2 + len(TEST_MESSAGE_FILE_NAME)))
 
+    def test_parses_import_graph_in_parallel(self):
+        with TemporaryDirectory() as temp_dir:
+            # The names are unique to the test run so the files aren't already in the parser cache.
+            name_prefix = basename(temp_dir)
+            imported_files = [f"imported_{index}{AAC_DOCUMENT_EXTENSION}" for index in range(PARALLEL_PARSE_MINIMUM_STRINGS)]
+            for index, imported_file in enumerate(imported_files):
+                nested_import = f"import:{linesep}  files:{linesep}    - ./nested_{index}.aac{linesep}---{linesep}"
+                self.create_test_file(f"{temp_dir}/{imported_file}", nested_import + TEST_STATUS_CONTENTS.replace(TEST_STATUS_NAME, f"{name_prefix}Status{index}"))
+                self.create_test_file(f"{temp_dir}/nested_{index}.aac", TEST_MESSAGE_CONTENTS.replace(TEST_MESSAGE_NAME, f"{name_prefix}Message{index}"))
+            import_list = "".join(f"    - ./{imported_file}{linesep}" for imported_file in imported_files)
+            test_yaml = self.create_test_file(f"{temp_dir}/test_model.aac", f"import:{linesep}  files:{linesep}{import_list}")
+
+            with patch.dict(environ, {AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE: "2"}):
+                definitions = parse(test_yaml)
+
+            # Definitions are returned in depth-first import order no matter how the files were parsed.
+            expected_names = []
+            for index in range(len(imported_files)):
+                expected_names.extend([f"{name_prefix}Status{index}", f"{name_prefix}Message{index}"])
+            self.assertListEqual(expected_names, [definition.name for definition in definitions if definition.get_root_key() != "import"])
+            self.assertEqual(definitions[-1].source.uri, f"{temp_dir}/nested_{len(imported_files) - 1}.aac")
+            self.assertEqual(definitions[-1].lexemes[2].value, f"{name_prefix}Message{len(imported_files) - 1}")
+
+    def test_get_parse_jobs(self):
+        with patch.dict(environ):
+            environ.pop(AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE, None)
+            self.assertEqual(get_parse_jobs(), 1)
+            environ[AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE] = "4"
+            self.assertEqual(get_parse_jobs(), 4)
+            environ[AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE] = "many"
+            self.assertEqual(get_parse_jobs(), 1)
+
+            # pools aren't nested in the workers of another pool
+            environ[AAC_PARSE_JOBS_ENVIRONMENT_VARIABLE] = "4"
+            with patch("aac.in_out.parser._cache_manager.parent_process", return_value=object()):
+                self.assertEqual(get_parse_jobs(), 1)
+
     def test_handles_multiple_import_sections_per_file(self):
         another_definition = """
 enum:
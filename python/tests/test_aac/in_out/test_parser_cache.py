@@ -1,6 +1,10 @@
+from os import listdir, path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
-from aac.in_out.parser import get_cache
-from aac.in_out.parser._cache import YamlLFUCache
+from unittest.mock import patch
+from aac.in_out.parser import ParserError, get_cache
+from aac.in_out.parser._cache import PARALLEL_PARSE_MINIMUM_STRINGS, YamlLFUCache
+from aac.in_out.parser._persistent_cache import PersistentYamlCache
 from aac.context.language_context import LanguageContext
 
 MODEL_TEMPLATE = """
@@ -89,3 +93,85 @@ class TestParserCache(TestCase):
 
         # Assert the cache is full at the end
         self.assertEqual(parser_capacity, len(parser_cache.cache))
+
+    def test_parse_strings_in_parallel(self):
+        sources_to_strings = {f"source_{index}": MODEL_TEMPLATE.replace("__name__", f"parallel_definition_{index}") for index in range(PARALLEL_PARSE_MINIMUM_STRINGS)}
+
+        parallel_entries = YamlLFUCache().parse_strings(sources_to_strings, max_workers=2)
+        sequential_entries = YamlLFUCache().parse_strings(sources_to_strings)
+
+        self.assertListEqual(list(sources_to_strings), list(parallel_entries))
+        for source, parallel_entry in parallel_entries.items():
+            self.assertListEqual(sequential_entries[source].yaml_structures, parallel_entry.yaml_structures)
+            self.assertListEqual(
+                [(token.value, token.start_mark.line, token.start_mark.index) for token in sequential_entries[source].yaml_tokens if hasattr(token, "value")],
+                [(token.value, token.start_mark.line, token.start_mark.index) for token in parallel_entry.yaml_tokens if hasattr(token, "value")],
+            )
+
+    def test_parse_strings_in_parallel_raises_first_error(self):
+        sources_to_strings = {f"source_{index}": MODEL_TEMPLATE.replace("__name__", f"parallel_definition_{index}") for index in range(PARALLEL_PARSE_MINIMUM_STRINGS)}
+        sources_to_strings["source_3"] = "model: ["
+        sources_to_strings["source_5"] = "model: {"
+
+        with self.assertRaises(ParserError) as error:
+            YamlLFUCache().parse_strings(sources_to_strings, max_workers=2)
+        self.assertEqual("source_3", error.exception.source)
+
+    def test_persistent_cache_is_shared_between_cache_instances(self):
+        model_content = MODEL_TEMPLATE.replace("__name__", "persistent_definition")
+
+        with TemporaryDirectory() as temp_dir:
+            first_cache = YamlLFUCache(persistent_cache=PersistentYamlCache(temp_dir))
+            expected_structures = first_cache.parse_string(model_content)
+            expected_tokens = first_cache.scan_string(model_content)
+
+            # A new in-memory cache, like a new AaC invocation, should be served by the persistent tier without parsing.
+            second_cache = YamlLFUCache(persistent_cache=PersistentYamlCache(temp_dir))
+            with patch("aac.in_out.parser._cache.parse_and_scan_yaml") as parse_and_scan_yaml:
+                actual_structures = second_cache.parse_string(model_content)
+                actual_tokens = second_cache.scan_string(model_content)
+                parse_and_scan_yaml.assert_not_called()
+
+            self.assertListEqual(expected_structures, actual_structures)
+            expected_value_tokens = [(token.value, token.start_mark.line, token.start_mark.column, token.start_mark.index) for token in expected_tokens if hasattr(token, "value")]
+            actual_value_tokens = [(token.value, token.start_mark.line, token.start_mark.column, token.start_mark.index) for token in actual_tokens if hasattr(token, "value")]
+            self.assertListEqual(expected_value_tokens, actual_value_tokens)
+
+    def test_persistent_cache_evicts_entries_over_size_limit(self):
+        with TemporaryDirectory() as temp_dir:
+            persistent_cache = PersistentYamlCache(temp_dir, max_size=1)
+            parser_cache = YamlLFUCache(persistent_cache=persistent_cache)
+
+            parser_cache.parse_string(MODEL_TEMPLATE.replace("__name__", "first_definition"))
+            parser_cache.parse_string(MODEL_TEMPLATE.replace("__name__", "second_definition"))
+
+            self.assertEqual(0, len(listdir(temp_dir)))
+
+    def test_persistent_cache_only_lists_entries_when_over_size_limit(self):
+        with TemporaryDirectory() as temp_dir:
+            persistent_cache = PersistentYamlCache(temp_dir)
+            parser_cache = YamlLFUCache(persistent_cache=persistent_cache)
+
+            with patch.object(PersistentYamlCache, "_get_entries", autospec=True, side_effect=PersistentYamlCache._get_entries) as get_entries:
+                for index in range(5):
+                    parser_cache.parse_string(MODEL_TEMPLATE.replace("__name__", f"listed_definition_{index}"))
+                self.assertEqual(get_entries.call_count, 1)
+                self.assertEqual(len(listdir(temp_dir)), 5)
+
+                # once the tracked size is over the limit, the entries are listed again and the oldest are evicted
+                persistent_cache.max_size = sum(path.getsize(path.join(temp_dir, file_name)) for file_name in listdir(temp_dir))
+                parser_cache.parse_string(MODEL_TEMPLATE.replace("__name__", "listed_definition_5"))
+                self.assertEqual(get_entries.call_count, 2)
+                self.assertEqual(len(listdir(temp_dir)), 5)
+
+    def test_persistent_cache_discards_corrupt_entries(self):
+        model_content = MODEL_TEMPLATE.replace("__name__", "corrupt_definition")
+
+        with TemporaryDirectory() as temp_dir:
+            YamlLFUCache(persistent_cache=PersistentYamlCache(temp_dir)).parse_string(model_content)
+            entry_file_name, *_ = listdir(temp_dir)
+            with open(f"{temp_dir}/{entry_file_name}", "w") as entry_file:
+                entry_file.write("not a cache entry")
+
+            parsed_definition, *_ = YamlLFUCache(persistent_cache=PersistentYamlCache(temp_dir)).parse_string(model_content)
+            self.assertEqual("corrupt_definition", parsed_definition["model"]["name"])
@@ -4,6 +4,7 @@ from click.testing import CliRunner
 from aac.execute.command_line import cli, initialize_cli
 from aac.execute.aac_execution_result import ExecutionResult, ExecutionStatus
 from aac.context.language_error import LanguageError
+from aac.execute.plugin_runner import PrimitiveConstraintValue
 
 
 from aac.plugins.aac_primitives.aac_primitive_constraints_impl import plugin_name
@@ -18,6 +19,15 @@ from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_int
 from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_number
 from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_dataref
 from aac.plugins.aac_primitives.aac_primitive_constraints_impl import check_typeref
+from aac.plugins.aac_primitives.aac_primitive_constraints_impl import (
+    check_bool_batch,
+    check_date_batch,
+    check_directory_batch,
+    check_file_batch,
+    check_int_batch,
+    check_number_batch,
+    check_string_batch,
+)
 
 
 class TestAaCPrimitiveConstraints(TestCase):
@@ -192,3 +202,21 @@ class TestAaCPrimitiveConstraints(TestCase):
             result = check_typeref("Schema", "typeref(not.a.valid.type)", None, None)
         self.assertEqual(e.exception.message,"Could not find definition for not.a.valid.type")
         self.assertEqual(e.exception.location, "No file to reference")
+
+    def test_check_batches(self):
+        checks = [
+            (check_bool, check_bool_batch, [True, False, "Not_A_Bool", None]),
+            (check_date, check_date_batch, ["2022-01-01", "01-01-2022", "2022-02-31", 123]),
+            (check_directory, check_directory_batch, ["/path/to/directory", "/path/with+/bad\\characters|in/directory", 123]),
+            (check_file, check_file_batch, ["my_file.txt", "c:\\path\\my_file.txt", "1:\\my_file.txt", "ab:/my_file.txt", "m+y|f*ile.txt", 123]),
+            (check_string, check_string_batch, ["This is a valid string", "", 123]),
+            (check_int, check_int_batch, [123, "123", True, "abc", "1.5", 1.5]),
+            (check_number, check_number_batch, [123, 3.14, "123", "3.14", "abc", [1, 2, 3]]),
+        ]
+        for check, check_batch, values in checks:
+            batch_values = [PrimitiveConstraintValue(value, "", [], None, None) for value in values]
+            expected_failures = [(index, check(value, "", None, None)) for index, value in enumerate(values)]
+            expected_failures = [(index, result) for index, result in expected_failures if not result.is_success()]
+            self.assertGreater(len(expected_failures), 0)
+            self.assertLess(len(expected_failures), len(values))
+            self.assertEqual(expected_failures, check_batch(batch_values), f"{plugin_name}: {check.__name__} batch should only return the failures of the per-value check")
@@ -1,8 +1,14 @@
 """The AaC Check AaC plugin test module."""
 from unittest import TestCase
 from typing import Tuple
+from unittest.mock import patch
 from click.testing import CliRunner
+from aac.context.language_context import LanguageContext
 from aac.execute.command_line import cli, initialize_cli
+from aac.execute.aac_execution_result import ExecutionResult, ExecutionStatus
+from aac.in_out.constants import AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE
+from aac.plugins.check import check_aac_impl
+from aac.plugins.check.check_aac_impl import CheckPlans, collect_all_constraints_by_name, check_definitions, check_schema_constraint
 import os
 import shutil
 import tempfile
@@ -17,6 +23,55 @@ class TestCheckAaC(TestCase):
         # Let's just test via CLI for now
         pass
 
+    def test_check_plans_are_compiled_once_per_schema(self):
+        """Test that the check plan of a schema is compiled once and reused."""
+        context = LanguageContext()
+        check_plans = CheckPlans(collect_all_constraints_by_name())
+        schema = context.get_definitions_by_name("aac.lang.Schema")[0]
+        field_schema = context.get_definitions_by_name("aac.lang.Field")[0]
+
+        schema_plan = check_plans.get_schema_plan(schema.instance)
+        self.assertIs(schema_plan, check_plans.get_schema_plan(schema.instance))
+        self.assertIsNone(check_plans.get_schema_plan(context.get_definitions_by_name("aac.lang.Primitive")[0].instance.fields[0]))
+
+        fields_plan, *_ = [field_plan for field_plan in schema_plan.fields if field_plan.field.name == "fields"]
+        self.assertTrue(fields_plan.is_list)
+        self.assertFalse(fields_plan.is_primitive)
+        self.assertEqual([field_schema], fields_plan.defining_definitions)
+
+        root_plan, *_ = [field_plan for field_plan in schema_plan.fields if field_plan.field.name == "root"]
+        self.assertTrue(root_plan.is_primitive)
+        self.assertEqual("string", root_plan.primitive_declaration)
+        self.assertIs(check_plans.get_primitive_constraints(root_plan), check_plans.get_primitive_constraints(root_plan))
+
+    def test_check_definitions_batches_primitive_constraints(self):
+        """Test that batched primitive constraints are called once per check, and only report the failures of the per-value constraints."""
+        context = LanguageContext()
+        definitions = context.get_definitions_by_root("schema")
+        batch_calls = []
+
+        def check_string_batch(values):
+            # fail the last value, so the failure is added to the results of the last definition
+            batch_calls.append(len(values))
+            return [(len(values) - 1, ExecutionResult("Test", "Check string", ExecutionStatus.CONSTRAINT_FAILURE, []))]
+
+        check_plans = CheckPlans(collect_all_constraints_by_name(), {"Check string": check_string_batch})
+        definition_results = check_definitions(definitions, check_plans)
+        self.assertEqual(1, len(batch_calls))
+        self.assertGreater(batch_calls[0], len(definitions))
+        self.assertIsNone(check_plans.pending_batches)
+
+        # each definition reports the same constraints, in the same order, as when its values are checked one at a time
+        failures = []
+        for definition, results in zip(definitions, definition_results):
+            defining_schema = context.get_defining_schema_for_root(definition.get_root_key())
+            unbatched_results = check_schema_constraint(definition, definition.instance, defining_schema.instance, check_plans, {})
+            self.assertEqual(list(unbatched_results), list(results))
+            failures.extend(results["Check string"])
+            self.assertTrue(all(result.is_success() for result in unbatched_results["Check string"]))
+        self.assertEqual(1, len(failures))
+        self.assertIs(failures[0], definition_results[-1]["Check string"][0])
+
     # The test helper method in this class which invokes the CliRunner for all of the other tests
     def run_check_cli_command_with_args(self, args: list[str]) -> Tuple[int, str]:
         """Utility function to invoke the CLI command with the given arguments."""
@@ -60,6 +115,54 @@ class TestCheckAaC(TestCase):
             self.assertIn("My plugin was successful.", output_message)  # only appears when --verbose is passed in.
             self.assertIn("my_plugin.aac", output_message)
 
+    # Checking in parallel produces the same output as checking in a single process
+    def test_cli_check_jobs(self):
+        """Test the CLI command for the check plugin with multiple jobs."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for aac_file_name, expected_message in [("good.aac", "JobsSchema5"), ("bad.aac", "was expected to be list, but was")]:
+                with open(os.path.join(os.path.dirname(__file__), aac_file_name)) as aac_file:
+                    aac_file_content = aac_file.read()
+                temp_aac_file_path = os.path.join(temp_dir, aac_file_name)
+                with open(temp_aac_file_path, "w") as temp_aac_file:
+                    temp_aac_file.write("---\n".join([aac_file_content, *[JOBS_SCHEMA_TEMPLATE.replace("__name__", f"JobsSchema{index}") for index in range(6)]]))
+
+                expected_exit_code, expected_output_message = self.run_check_cli_command_with_args([temp_aac_file_path, "--verbose"])
+                exit_code, output_message = self.run_check_cli_command_with_args([temp_aac_file_path, "--verbose", "--jobs", "2"])
+                self.assertEqual(expected_exit_code, exit_code)
+                self.assertEqual(expected_output_message, output_message)
+                self.assertIn(expected_message, output_message)
+
+    def test_cli_check_incremental(self):
+        """Test the CLI command for the check plugin only re-checks changed definitions and their dependents."""
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(os.environ, {AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: temp_dir}):
+            temp_aac_file_path = os.path.join(temp_dir, "incremental.aac")
+            with open(temp_aac_file_path, "w") as temp_aac_file:
+                temp_aac_file.write(INCREMENTAL_CONTENT)
+
+            def get_checked_names(args: list[str]) -> list[str]:
+                with patch.object(check_aac_impl, "check_definitions", wraps=check_aac_impl.check_definitions) as check_definitions:
+                    exit_code, output_message = self.run_check_cli_command_with_args(args)
+                self.assertEqual(self.run_check_cli_command_with_args([temp_aac_file_path, "--verbose"]), (exit_code, output_message))
+                return [definition.name for call in check_definitions.call_args_list for definition in call.args[0]]
+
+            incremental_args = [temp_aac_file_path, "--verbose", "--incremental"]
+            self.assertEqual(["IncrementalTarget", "IncrementalUser", "IncrementalUnrelated"], get_checked_names(incremental_args))
+            self.assertEqual([], get_checked_names(incremental_args))
+
+            # Changing a schema re-checks the schemas whose fields are of its type, but not the others
+            with open(temp_aac_file_path, "w") as temp_aac_file:
+                temp_aac_file.write(INCREMENTAL_CONTENT.replace("The schema that is referenced.", "The schema that is referenced by another schema."))
+            self.assertEqual(["IncrementalTarget", "IncrementalUser"], get_checked_names(incremental_args))
+            self.assertEqual([], get_checked_names(incremental_args))
+
+            # Reformatting a schema re-checks it, but not the schemas that depend on it, since its structure is the same
+            with open(temp_aac_file_path, "w") as temp_aac_file:
+                temp_aac_file.write(
+                    INCREMENTAL_CONTENT.replace("The schema that is referenced.", "'The schema that is referenced by another schema.'  # reformatted")
+                )
+            self.assertEqual(["IncrementalTarget"], get_checked_names(incremental_args))
+            self.assertEqual([], get_checked_names(incremental_args))
+
     # Test input triggers a LanguageError in check_aac_impl.py ~line 171
     # Value of 'parent_specs' was expected to be list, but was '<class 'str'>'
     def test_cli_check_bad_data(self):
@@ -160,3 +263,39 @@ class TestCheckAaC(TestCase):
             self.assertEqual(1, exit_code, f"Expected to fail but ran successfully with message: {output_message}")
             self.assertNotIn("My plugin was successful.", output_message)  # only appears when --verbose is passed in.
             self.assertIn("LanguageError from parse_and_load: Found undefined field name 'whatzit'", output_message)
+
+
+JOBS_SCHEMA_TEMPLATE = """
+schema:
+  name: __name__
+  package: test_aac.plugins.check
+  fields:
+    - name: first
+      type: string
+    - name: second
+      type: int
+"""
+
+INCREMENTAL_CONTENT = """
+schema:
+  name: IncrementalTarget
+  package: test_aac.plugins.check
+  description: The schema that is referenced.
+  fields:
+    - name: first
+      type: string
+---
+schema:
+  name: IncrementalUser
+  package: test_aac.plugins.check
+  fields:
+    - name: target
+      type: IncrementalTarget
+---
+schema:
+  name: IncrementalUnrelated
+  package: test_aac.plugins.check
+  fields:
+    - name: first
+      type: int
+"""
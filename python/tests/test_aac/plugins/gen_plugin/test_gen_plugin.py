@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from io import StringIO
 from unittest import TestCase
 from unittest.mock import patch
@@ -17,6 +19,27 @@ class TestGenPlugin(TestCase):
         # I'm going to rely on the CLI testing for this one, but will leave there here in case we need it later
         pass
 
+    def test_import_defers_generation_dependencies(self):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import aac.plugins.generate, aac.plugins.gen_plugin"],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(process.returncode, 0, process.stderr)
+
+        # Each line of the report is "import time: <self us> | <cumulative us> | <indented module name>"
+        imported_modules = set()
+        for line in process.stderr.splitlines():
+            fields = line.removeprefix("import time:").split("|")
+            if len(fields) == 3 and fields[1].strip().isdigit():
+                imported_modules.add(fields[2].strip())
+
+        # black and jinja2 are only imported once something is generated
+        self.assertIn("aac.plugins.generate", imported_modules)
+        self.assertIn("aac.plugins.gen_plugin", imported_modules)
+        self.assertNotIn("black", imported_modules)
+        self.assertNotIn("jinja2", imported_modules)
+
     def run_gen_plugin_cli_command_with_args(self, args: list[str]) -> Tuple[int, str]:
         """Utility function to invoke the CLI command with the given arguments."""
         initialize_cli()
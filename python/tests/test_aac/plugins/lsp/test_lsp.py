@@ -0,0 +1,172 @@
+import asyncio
+import json
+import subprocess
+import sys
+from importlib.util import find_spec
+from unittest import TestCase
+from unittest.mock import patch
+
+from aac.context.language_context import LanguageContext
+from aac.context.source_location import SourceLocation
+from aac.execute.aac_execution_result import MessageLevel
+from aac.in_out.parser import parse
+from aac.plugins.lsp import document_state
+from aac.plugins.lsp.aac_language_server import Debouncer
+from aac.plugins.lsp.document_state import DocumentState, split_yaml_documents
+from aac.plugins.lsp.workspace import Workspace
+
+DOCUMENT_PATH = "/tmp/test_aac_lsp_document.aac"
+
+
+class TestLsp(TestCase):
+    def test_split_yaml_documents(self):
+        yaml_documents = split_yaml_documents(LSP_CONTENT)
+
+        self.assertEqual([(0, 0), (6, 105)], [(start_line, start_position) for _, start_line, start_position in yaml_documents])
+        self.assertEqual(LSP_CONTENT, "".join(text for text, _, _ in yaml_documents))
+        self.assertTrue(yaml_documents[1][0].startswith("---\nschema:"))
+        self.assertEqual([], split_yaml_documents(""))
+
+    def test_document_state_parses_changed_yaml_documents(self):
+        state = DocumentState(DOCUMENT_PATH)
+        parsed_documents, discarded_documents = state.update(LSP_CONTENT)
+        self.assertEqual(2, len(parsed_documents))
+        self.assertEqual([], discarded_documents)
+        self.assert_same_definitions(parse(LSP_CONTENT, DOCUMENT_PATH), state.get_definitions())
+
+        # Only the edited YAML document is parsed again, and the one below it is moved to its new location
+        edited_content = LSP_CONTENT.replace("    - name: first\n", "    - name: first\n      description: The first field.\n")
+        with patch.object(document_state, "parse", wraps=document_state.parse) as parse_yaml:
+            parsed_documents, discarded_documents = state.update(edited_content)
+        self.assertEqual(1, parse_yaml.call_count)
+        self.assertEqual(1, len(parsed_documents))
+        self.assertEqual(1, len(discarded_documents))
+        self.assert_same_definitions(parse(edited_content, DOCUMENT_PATH), state.get_definitions())
+
+    def test_workspace_validate(self):
+        workspace = Workspace()
+        context = LanguageContext()
+        workspace.open_document(DOCUMENT_PATH, LSP_CONTENT)
+        try:
+            self.assertEqual([], workspace.validate(DOCUMENT_PATH))
+            self.assertEqual(1, len(context.get_definitions_by_name("LspUser")))
+
+            workspace.change_document(DOCUMENT_PATH, LSP_CONTENT.replace("type: LspTarget", "type: LspMissing"))
+            diagnostics = workspace.validate(DOCUMENT_PATH)
+            self.assertEqual(1, len(diagnostics))
+            self.assertIn("LspMissing", diagnostics[0].message)
+            self.assertEqual(MessageLevel.ERROR, diagnostics[0].level)
+            self.assertEqual(12, diagnostics[0].location.line)
+
+            workspace.change_document(DOCUMENT_PATH, LSP_CONTENT.replace("    - name: target", "    - name: [target"))
+            diagnostics = workspace.validate(DOCUMENT_PATH)
+            self.assertEqual(1, len(diagnostics))
+            self.assertIn("invalid YAML", diagnostics[0].message)
+            self.assertEqual((12, 10), (diagnostics[0].location.line, diagnostics[0].location.column))
+            self.assertEqual([], context.get_definitions_by_name("LspUser"))
+
+            workspace.change_document(DOCUMENT_PATH, LSP_CONTENT)
+            self.assertEqual([], workspace.validate(DOCUMENT_PATH))
+            self.assertEqual(1, len(context.get_definitions_by_name("LspUser")))
+        finally:
+            workspace.close_document(DOCUMENT_PATH)
+        self.assertEqual([], context.get_definitions_by_name("LspTarget"))
+        self.assertEqual([], context.get_definitions_by_name("LspUser"))
+
+    def test_workspace_find_definition(self):
+        workspace = Workspace()
+        workspace.open_document(DOCUMENT_PATH, LSP_CONTENT)
+        try:
+            self.assertEqual((DOCUMENT_PATH, SourceLocation(1, 8, 16, 9)), workspace.find_definition(DOCUMENT_PATH, 12, 14))
+
+            source, location = workspace.find_definition(DOCUMENT_PATH, 5, 12)
+            self.assertTrue(source.endswith("aac.aac"))
+            self.assertIsNotNone(location)
+
+            self.assertIsNone(workspace.find_definition(DOCUMENT_PATH, 12, 2))
+            self.assertIsNone(workspace.find_definition("/tmp/not_open.aac", 0, 0))
+        finally:
+            workspace.close_document(DOCUMENT_PATH)
+
+    def test_debouncer(self):
+        calls = []
+
+        async def edit_quickly():
+            debouncer = Debouncer(0.01)
+            for edit in range(3):
+                debouncer.schedule("document", lambda edit=edit: calls.append(edit))
+            await asyncio.sleep(0.05)
+
+        asyncio.run(edit_quickly())
+        self.assertEqual([2], calls)
+
+    def test_lsp_over_standard_input_and_output(self):
+        if find_spec("pygls") is None:
+            self.skipTest("The language server requires pygls.")
+
+        uri = f"file://{DOCUMENT_PATH}"
+        requests = [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"processId": None, "rootUri": None, "capabilities": {}}},
+            {"jsonrpc": "2.0", "method": "initialized", "params": {}},
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": uri, "languageId": "yaml", "version": 1, "text": LSP_CONTENT.replace("type: LspTarget", "type: LspMissing")}},
+            },
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown", "params": None},
+            {"jsonrpc": "2.0", "method": "exit", "params": None},
+        ]
+        process = subprocess.run(
+            [sys.executable, "-m", "aac", "lsp"], input=b"".join(map(to_lsp_message, requests)), capture_output=True, timeout=120
+        )
+        self.assertEqual(0, process.returncode, process.stderr.decode())
+        self.assertNotIn(b"Traceback", process.stderr)
+
+        # Standard output only carries the protocol, so every byte of it belongs to a response or notification
+        responses = from_lsp_messages(process.stdout)
+        self.assertEqual([1, 2], [response["id"] for response in responses if "id" in response])
+        self.assertIsNone(responses[-1]["result"])
+        diagnostics = [response["params"] for response in responses if response.get("method") == "textDocument/publishDiagnostics"]
+        self.assertEqual([uri], [published["uri"] for published in diagnostics])
+        self.assertEqual(1, len(diagnostics[0]["diagnostics"]))
+        self.assertIn("LspMissing", diagnostics[0]["diagnostics"][0]["message"])
+        self.assertEqual(12, diagnostics[0]["diagnostics"][0]["range"]["start"]["line"])
+
+    def assert_same_definitions(self, expected_definitions, actual_definitions):
+        self.assertEqual(len(expected_definitions), len(actual_definitions))
+        for expected_definition, actual_definition in zip(expected_definitions, actual_definitions):
+            self.assertEqual(expected_definition.content, actual_definition.content)
+            self.assertEqual(expected_definition.structure, actual_definition.structure)
+            self.assertEqual(list(expected_definition.lexemes), list(actual_definition.lexemes))
+
+
+def to_lsp_message(body: dict) -> bytes:
+    content = json.dumps(body).encode()
+    return f"Content-Length: {len(content)}\r\n\r\n".encode() + content
+
+
+def from_lsp_messages(output: bytes) -> list[dict]:
+    messages = []
+    while output:
+        header, _, output = output.partition(b"\r\n\r\n")
+        headers = dict(line.split(": ", 1) for line in header.decode().split("\r\n"))
+        content_length = int(headers["Content-Length"])
+        messages.append(json.loads(output[:content_length]))
+        output = output[content_length:]
+    return messages
+
+
+LSP_CONTENT = """schema:
+  name: LspTarget
+  package: test_aac.plugins.lsp
+  fields:
+    - name: first
+      type: string
+---
+schema:
+  name: LspUser
+  package: test_aac.plugins.lsp
+  fields:
+    - name: target
+      type: LspTarget
+"""
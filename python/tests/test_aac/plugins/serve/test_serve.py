@@ -0,0 +1,76 @@
+import os
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from aac import __version__
+from aac.context.language_context import LanguageContext
+from aac.execute.aac_execution_result import ExecutionStatus
+from aac.plugins.serve.serve_impl import create_app, find_definitions, run_command
+
+
+class TestServe(TestCase):
+    def test_run_command(self):
+        context = LanguageContext()
+        with TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "served.aac"), "w") as aac_file:
+                aac_file.write(SERVED_CONTENT)
+
+            working_directory = os.getcwd()
+            result = run_command("check", ["served.aac", "--verbose"], temp_dir)
+            self.assertEqual(ExecutionStatus.SUCCESS, result.status_code, result.get_messages_as_string())
+            self.assertIn("All AaC constraint checks were successful.", result.get_messages_as_string())
+            self.assertEqual(working_directory, os.getcwd())
+
+            # Definitions loaded by a command don't stay loaded for the next command
+            self.assertEqual([], context.get_definitions_by_name("ServedSchema"))
+
+            result = run_command("check", ["missing.aac"], temp_dir)
+            self.assertFalse(result.is_success())
+
+    def test_run_command_failures(self):
+        result = run_command("check", ["--unknown-option"])
+        self.assertEqual(ExecutionStatus.GENERAL_FAILURE, result.status_code)
+        self.assertIn("--unknown-option", result.get_messages_as_string())
+
+        result = run_command("unknown-command", [])
+        self.assertEqual(ExecutionStatus.GENERAL_FAILURE, result.status_code)
+        self.assertIn("No such command 'unknown-command'.", result.get_messages_as_string())
+
+    def test_find_definitions(self):
+        schema_definitions = find_definitions(name="Schema")
+        self.assertEqual(1, len(schema_definitions))
+        self.assertEqual("aac.lang", schema_definitions[0]["package"])
+        self.assertEqual("schema", schema_definitions[0]["root"])
+        self.assertIn("name: Schema", schema_definitions[0]["content"])
+
+        plugin_names = [definition["name"] for definition in find_definitions(root="plugin")]
+        self.assertIn("Serve", plugin_names)
+        self.assertEqual([], find_definitions(name="Schema", root="plugin"))
+
+    def test_app(self):
+        if find_spec("fastapi") is None or find_spec("httpx") is None:
+            self.skipTest("The server requires fastapi, and its test client requires httpx.")
+
+        from fastapi.testclient import TestClient
+
+        client = TestClient(create_app("secret"))
+        headers = {"Authorization": "Bearer secret"}
+        self.assertEqual(401, client.get("/health").status_code)
+        self.assertEqual({"version": __version__}, client.get("/health", headers=headers).json())
+
+        response = client.post("/commands/check", json={"arguments": ["--unknown-option"]}, headers=headers)
+        self.assertEqual("GENERAL_FAILURE", response.json()["status_code"])
+        self.assertEqual(404, client.post("/commands/serve", json={}, headers=headers).status_code)
+
+        response = client.get("/definitions", params={"name": "Schema"}, headers=headers)
+        self.assertEqual(["Schema"], [definition["name"] for definition in response.json()])
+
+
+SERVED_CONTENT = """schema:
+  name: ServedSchema
+  package: test_aac.plugins.serve
+  fields:
+    - name: first
+      type: string
+"""
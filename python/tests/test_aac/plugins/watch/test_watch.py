@@ -0,0 +1,125 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from aac.context.language_context import LanguageContext
+from aac.execute.aac_execution_result import ExecutionStatus
+from aac.in_out.constants import AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE
+from aac.plugins.watch.file_watcher import InotifyFileWatcher, PollingFileWatcher
+from aac.plugins.watch.watch_impl import ModelWatch, watch
+
+
+class TestWatch(TestCase):
+    def assert_file_watcher_reports_changes(self, file_watcher, temp_dir: str):
+        watched_file_path = os.path.join(temp_dir, "watched.aac")
+        unwatched_file_path = os.path.join(temp_dir, "unwatched.aac")
+        for file_path in [watched_file_path, unwatched_file_path]:
+            with open(file_path, "w") as file:
+                file.write(WATCHED_CONTENT)
+
+        file_watcher.watch([watched_file_path])
+        try:
+            self.assertEqual([], file_watcher.wait_for_changes(0.05))
+
+            with open(unwatched_file_path, "a") as file:
+                file.write("# unwatched change\n")
+            self.assertEqual([], file_watcher.wait_for_changes(0.2))
+
+            # Editors often save by replacing the file, which must still be reported as a change to the watched file
+            with open(f"{watched_file_path}.tmp", "w") as file:
+                file.write(f"{WATCHED_CONTENT}# watched change\n")
+            os.replace(f"{watched_file_path}.tmp", watched_file_path)
+            self.assertEqual([watched_file_path], file_watcher.wait_for_changes(5))
+            self.assertEqual([], file_watcher.wait_for_changes(0.05))
+        finally:
+            file_watcher.close()
+
+    def test_polling_file_watcher(self):
+        with TemporaryDirectory() as temp_dir:
+            self.assert_file_watcher_reports_changes(PollingFileWatcher(0.01), temp_dir)
+
+    def test_inotify_file_watcher(self):
+        try:
+            file_watcher = InotifyFileWatcher.create()
+        except OSError as error:
+            self.skipTest(f"inotify isn't available: {error}")
+
+        with TemporaryDirectory() as temp_dir:
+            self.assert_file_watcher_reports_changes(file_watcher, temp_dir)
+
+    def test_model_watch_reloads_changed_definitions(self):
+        context = LanguageContext()
+        with TemporaryDirectory() as temp_dir, patch.dict(os.environ, {AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: temp_dir}):
+            imported_file_path = os.path.join(temp_dir, "imported.aac")
+            with open(imported_file_path, "w") as imported_file:
+                imported_file.write(WATCHED_CONTENT)
+            aac_file_path = os.path.join(temp_dir, "model.aac")
+            with open(aac_file_path, "w") as aac_file:
+                aac_file.write(MODEL_CONTENT)
+
+            model_watch = ModelWatch(aac_file_path)
+            result = model_watch.run()
+            self.assertEqual(ExecutionStatus.SUCCESS, result.status_code, result.get_messages_as_string())
+            self.assertEqual(1, len(context.get_definitions_by_name("WatchedModel")))
+            self.assertEqual(1, len(context.get_definitions_by_name("WatchedSchema")))
+            self.assertCountEqual([os.path.realpath(aac_file_path), os.path.realpath(imported_file_path)], model_watch.get_watched_files())
+
+            with open(aac_file_path, "w") as aac_file:
+                aac_file.write(MODEL_CONTENT.replace("WatchedModel", "RenamedModel"))
+            result = model_watch.run()
+            self.assertEqual(ExecutionStatus.SUCCESS, result.status_code, result.get_messages_as_string())
+            self.assertEqual([], context.get_definitions_by_name("WatchedModel"))
+            self.assertEqual(1, len(context.get_definitions_by_name("RenamedModel")))
+            self.assertEqual(1, len(context.get_definitions_by_name("WatchedSchema")))
+
+            # Errors are reported, and the next run picks up the fix
+            with open(aac_file_path, "w") as aac_file:
+                aac_file.write(MODEL_CONTENT.replace("type: string", "type: UnknownType"))
+            self.assertFalse(model_watch.run().is_success())
+            with open(aac_file_path, "w") as aac_file:
+                aac_file.write(MODEL_CONTENT)
+            self.assertTrue(model_watch.run().is_success())
+
+            context.remove_definitions(model_watch.loaded_definitions)
+
+    def test_watch_until_interrupted(self):
+        with TemporaryDirectory() as temp_dir, patch.dict(os.environ, {AAC_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: temp_dir}):
+            aac_file_path = os.path.join(temp_dir, "watched.aac")
+            with open(aac_file_path, "w") as aac_file:
+                aac_file.write(WATCHED_CONTENT)
+
+            wait_for_changes_results = [[aac_file_path], KeyboardInterrupt()]
+            with patch.object(PollingFileWatcher, "wait_for_changes", side_effect=wait_for_changes_results) as wait_for_changes, \
+                    patch.object(ModelWatch, "run") as run:
+                run.return_value.is_success.return_value = True
+                run.return_value.get_messages_as_string.return_value = "All AaC constraint checks were successful."
+                result = watch(aac_file_path, None, None, None, None, False, 10, True)
+
+        self.assertEqual(ExecutionStatus.SUCCESS, result.status_code)
+        self.assertIn(f"Stopped watching {aac_file_path}.", result.get_messages_as_string())
+        self.assertEqual(2, run.call_count)
+        self.assertEqual(2, wait_for_changes.call_count)
+
+
+WATCHED_CONTENT = """schema:
+  name: WatchedSchema
+  package: test_aac.plugins.watch
+  fields:
+    - name: first
+      type: string
+"""
+
+MODEL_CONTENT = """import:
+  files:
+    - ./imported.aac
+---
+schema:
+  name: WatchedModel
+  package: test_aac.plugins.watch
+  fields:
+    - name: watched
+      type: WatchedSchema
+    - name: other
+      type: string
+"""
@@ -0,0 +1,54 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from aac.context.language_context import LanguageContext
+from aac.in_out.parser._parse_source import parse
+from aac.plugins.check.check_aac_impl import check
+from benchmarks.benchmark_suite import MODEL_PRESETS, compare_results, run_benchmarks
+from benchmarks.model_generator import ModelParameters, generate_model
+
+
+class TestBenchmarkSuite(TestCase):
+    def test_generate_model(self):
+        parameters = ModelParameters(definitions=30, fields=4, imports=3, extends_depth=2, typeref_density=0.5)
+        with TemporaryDirectory() as temp_dir:
+            model_file = generate_model(temp_dir, parameters)
+            definitions = parse(model_file)
+            self.assertEqual(len([definition for definition in definitions if definition.get_root_key() == "schema"]), 30)
+            self.assertEqual(len({definition.source.uri for definition in definitions}), 4)
+
+            result = check(model_file, False, False)
+            LanguageContext().remove_definitions([definition for definition in LanguageContext().get_definitions() if definition.source.uri.startswith(temp_dir)])
+        self.assertTrue(result.is_success(), result.get_messages_as_string())
+
+        extending_schema = [definition for definition in definitions if definition.name == "Schema00001"][0]
+        self.assertEqual(extending_schema.structure["schema"]["extends"][0]["name"], "Schema00000")
+
+    def test_generate_model_is_repeatable(self):
+        parameters = ModelParameters(definitions=10, fields=3, typeref_density=0.5)
+        with TemporaryDirectory() as temp_dir:
+            with open(generate_model(os.path.join(temp_dir, "first"), parameters)) as first_model:
+                with open(generate_model(os.path.join(temp_dir, "second"), parameters)) as second_model:
+                    self.assertEqual(first_model.read(), second_model.read())
+
+    def test_run_benchmarks(self):
+        with patch.dict(MODEL_PRESETS, {"tiny": ModelParameters(definitions=5, fields=2)}):
+            results = run_benchmarks(["tiny"], ["bootstrap_snapshot", "parse_warm", "check"], repeat=2, report=lambda message: None)
+
+        self.assertEqual([(result["benchmark"], result["model"]) for result in results["results"]], [("bootstrap_snapshot", None), ("parse_warm", "tiny"), ("check", "tiny")])
+        for result in results["results"]:
+            self.assertEqual(len(result["samples"]), 2)
+            self.assertGreater(result["median"], 0)
+        self.assertEqual(results["results"][1]["parameters"]["definitions"], 5)
+        self.assertIn("aac_version", results["environment"])
+
+    def test_compare_results(self):
+        baseline = {"results": [{"benchmark": "check", "model": "small", "median": 1.0}, {"benchmark": "parse_cold", "model": "small", "median": 1.0}]}
+        current = {"results": [{"benchmark": "check", "model": "small", "median": 1.5}, {"benchmark": "parse_cold", "model": "small", "median": 1.1}]}
+
+        lines, regressions = compare_results(baseline, current, threshold=0.2)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("check [small]", regressions[0])